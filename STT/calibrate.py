@@ -0,0 +1,107 @@
+"""
+Whisper 처리 속도 보정 (whisper_model="auto" 정책용 표 생성)
+
+현재 호스트에서 (모델 크기 × compute type × beam size) 조합별 real-time factor를 측정해
+STT_WHISPER_THROUGHPUT_TABLE 경로(기본 ~/.cache/stt/whisper_throughput.json)에 저장한다.
+
+사용법:
+    python calibrate.py dataset/bts.mp4
+    python calibrate.py dataset/bts.mp4 --models tiny,base,small --compute-types int8 --beams 1,5
+"""
+import argparse
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from faster_whisper import WhisperModel
+
+from stt import decode_audio
+from stt.audio import SAMPLE_RATE
+from stt.config import settings
+from stt.policy import ThroughputTable, WhisperProfile
+
+
+def _csv(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def measure(model: WhisperModel, audio, beam_size: int, repeats: int) -> float:
+    """오디오 1초당 처리 시간(초). VAD 없이 전체 구간을 전사해 보수적으로 측정."""
+    # warm-up: 첫 호출의 초기화 비용 제외
+    segments, _ = model.transcribe(audio[: SAMPLE_RATE * 5], language="ko", beam_size=beam_size)
+    for _ in segments:
+        pass
+
+    elapsed: list[float] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        segments, _ = model.transcribe(audio, language="ko", beam_size=beam_size)
+        for _ in segments:
+            pass
+        elapsed.append(time.perf_counter() - started)
+    # 중앙값
+    return sorted(elapsed)[len(elapsed) // 2] / (len(audio) / SAMPLE_RATE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Whisper 처리 속도 보정")
+    parser.add_argument("sample", help="측정에 사용할 음성 포함 미디어 파일 (30초 이상 권장)")
+    parser.add_argument("--models", default="tiny,base,small", help="측정할 모델 크기 (쉼표 구분)")
+    parser.add_argument("--compute-types", default=settings.whisper_compute_type, help="compute type (쉼표 구분)")
+    parser.add_argument("--beams", default="1,5", help="beam size (쉼표 구분)")
+    parser.add_argument("--seconds", type=float, default=60.0, help="측정에 사용할 최대 오디오 길이")
+    parser.add_argument("--repeats", type=int, default=3, help="조합별 반복 횟수")
+    parser.add_argument("--output", default=settings.whisper_throughput_table, help="표 저장 경로")
+    args = parser.parse_args()
+
+    audio = decode_audio(args.sample)[: int(args.seconds * SAMPLE_RATE)]
+    if len(audio) == 0:
+        print(f"오류: 오디오를 디코딩할 수 없습니다 — {args.sample}")
+        return
+    print(f"측정 오디오: {len(audio) / SAMPLE_RATE:.1f}s, device={settings.whisper_device}")
+
+    profiles: list[WhisperProfile] = []
+    for model_size in _csv(args.models):
+        for compute_type in _csv(args.compute_types):
+            try:
+                model = WhisperModel(
+                    model_size,
+                    device=settings.whisper_device,
+                    compute_type=compute_type,
+                    cpu_threads=settings.whisper_cpu_threads,
+                )
+            except ValueError as e:
+                # 해당 장치에서 지원하지 않는 compute type
+                print(f"  {model_size}/{compute_type}: 건너뜀 ({e})")
+                continue
+            for beam in map(int, _csv(args.beams)):
+                rtf = measure(model, audio, beam, args.repeats)
+                print(f"  {model_size}/{compute_type}/beam={beam}: RTF {rtf:.3f}")
+                profiles.append(
+                    WhisperProfile(
+                        model_size=model_size,
+                        compute_type=compute_type,
+                        beam_size=beam,
+                        rtf=round(rtf, 4),
+                    )
+                )
+            del model
+
+    if not profiles:
+        print("측정된 조합이 없습니다.")
+        return
+
+    table = ThroughputTable(
+        device=settings.whisper_device,
+        cpu_threads=settings.whisper_cpu_threads,
+        calibrated_at=datetime.now(timezone.utc),
+        profiles=profiles,
+    )
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(table.model_dump_json(indent=2), encoding="utf-8")
+    print(f"\n처리 속도 표 저장됨: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,16 @@
 사용법:
     python main.py dataset/bts.mp4
     python main.py dataset/sport_star_ad.mp4 --model small
+
+일괄 처리 (디렉터리 또는 manifest, 결과는 JSONL에 누적 / 재실행 시 이어서 처리):
+    python main.py --batch dataset/ --jsonl results.jsonl
+    python main.py --batch manifest.txt --jsonl transcripts.jsonl --transcript-only
 """
 import argparse
 import json
 from pathlib import Path
 
-from stt import run_pipeline
+from stt import collect_inputs, run_batch, run_pipeline, stt_metrics
 
 
 def print_result(result) -> None:
@@ -36,6 +40,9 @@ def print_result(result) -> None:
     else:
         print("\n[관련 검색 결과 없음]")
 
+    if result.llm_skipped:
+        print("\n[로컬 사전 필터] 키워드 미검출 → LLM 호출 생략")
+
     print("\n" + "=" * 60)
 
 
@@ -55,16 +62,30 @@ def save_result(result, output_path: str) -> None:
 
 def main():
     parser = argparse.ArgumentParser(description="딥페이크 STT 사기 탐지 파이프라인")
-    parser.add_argument("video", help="분석할 비디오 파일 경로")
+    parser.add_argument("video", nargs="?", help="분석할 비디오 파일 경로")
     parser.add_argument(
         "--model",
         default="base",
-        choices=["tiny", "base", "small", "medium", "large"],
-        help="Whisper 모델 크기 (기본: base)",
+        choices=["auto", "tiny", "base", "small", "medium", "large"],
+        help="Whisper 모델 크기, auto면 오디오 길이와 지연 시간 예산으로 선택 (기본: base)",
     )
     parser.add_argument("--output", default=None, help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--batch", default=None, help="일괄 처리할 디렉터리 또는 manifest 파일")
+    parser.add_argument("--jsonl", default="results.jsonl", help="일괄 처리 결과 JSONL 경로 (기본: results.jsonl)")
+    parser.add_argument("--transcript-only", action="store_true", help="일괄 처리 시 전사만 수행")
     args = parser.parse_args()
 
+    if args.batch:
+        inputs = collect_inputs(args.batch)
+        ok, failed, skipped = run_batch(
+            inputs, args.jsonl, whisper_model=args.model, transcript_only=args.transcript_only
+        )
+        print(f"\n[Batch] 완료: 성공 {ok}, 실패 {failed}, 건너뜀 {skipped} → {args.jsonl}")
+        return
+
+    if not args.video:
+        parser.error("video 또는 --batch 중 하나가 필요합니다.")
+
     video_path = Path(args.video)
     if not video_path.exists():
         print(f"오류: 파일을 찾을 수 없습니다 — {video_path}")
@@ -73,6 +94,10 @@ def main():
     result = run_pipeline(str(video_path), whisper_model=args.model)
     print_result(result)
 
+    rate = stt_metrics.snapshot()["prefilter.short_circuit_rate"]
+    if rate is not None:
+        print(f"LLM 생략 비율(사전 필터): {rate:.0%}")
+
     if args.output:
         save_result(result, args.output)
 
@@ -1,3 +1,46 @@
+from .audio import decode_audio, stream_audio
+from .batch import collect_inputs, run_batch
+from .clients import get_groq_client, get_instructor_client, get_tavily_client
+from .keyword_matcher import KeywordMatcher, PrefilterResult
+from .keywords import (
+    KeywordExtractor,
+    RuleBasedKeywordExtractor,
+    get_keyword_extractor,
+    keyword_cache,
+)
+from .metrics import stt_metrics
+from .search_cache import search_cache
+from .policy import WhisperChoice, choose_whisper, load_throughput_table
 from .pipeline import SCAM_SEED_KEYWORDS, RiskLevel, STTPipelineResult, run_pipeline
+from .search import CaseSearcher, FixtureSearcher, get_case_searcher
+from .whisper_pool import load_all_models, whisper_pool
 
-__all__ = ["run_pipeline", "RiskLevel", "SCAM_SEED_KEYWORDS", "STTPipelineResult"]
+__all__ = [
+    "run_pipeline",
+    "decode_audio",
+    "stream_audio",
+    "load_all_models",
+    "whisper_pool",
+    "RiskLevel",
+    "SCAM_SEED_KEYWORDS",
+    "STTPipelineResult",
+    "KeywordMatcher",
+    "PrefilterResult",
+    "stt_metrics",
+    "keyword_cache",
+    "search_cache",
+    "get_groq_client",
+    "get_instructor_client",
+    "get_tavily_client",
+    "KeywordExtractor",
+    "RuleBasedKeywordExtractor",
+    "get_keyword_extractor",
+    "CaseSearcher",
+    "FixtureSearcher",
+    "get_case_searcher",
+    "collect_inputs",
+    "run_batch",
+    "WhisperChoice",
+    "choose_whisper",
+    "load_throughput_table",
+]
@@ -0,0 +1,115 @@
+"""
+ffmpeg stdout → NumPy 오디오 디코딩 (임시 WAV 파일 없음).
+
+ffmpeg가 16kHz mono s16le PCM을 stdout으로 내보내고, 별도 스레드가 이를
+chunk 단위 float32 배열로 큐에 넣는다. 소비자(Whisper)가 앞 chunk를
+처리하는 동안 ffmpeg는 뒤쪽을 계속 디코딩한다.
+"""
+import queue
+import subprocess
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+__all__ = ["SAMPLE_RATE", "stream_audio", "decode_audio", "probe_duration"]
+
+SAMPLE_RATE = 16000  # Whisper 권장 샘플레이트
+_BYTES_PER_SAMPLE = 2  # s16le
+
+
+def _ffmpeg_cmd(media_path: str | Path) -> list[str]:
+    return [
+        "ffmpeg", "-nostdin", "-i", str(media_path),
+        "-vn",                    # 비디오 스트림 제외
+        "-f", "s16le",            # raw 16-bit PCM
+        "-acodec", "pcm_s16le",
+        "-ar", str(SAMPLE_RATE),  # 16kHz
+        "-ac", "1",               # 모노
+        "-",                      # stdout으로 출력
+    ]
+
+
+def _to_float32(buf: bytes) -> np.ndarray:
+    return np.frombuffer(buf, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def stream_audio(
+    media_path: str | Path,
+    chunk_seconds: float = 30.0,
+    max_buffered_chunks: int = 4,
+) -> Iterator[np.ndarray]:
+    """
+    chunk_seconds 길이의 16kHz mono float32 chunk를 디코딩되는 대로 반환.
+    max_buffered_chunks: 소비자보다 앞서 디코딩해 둘 최대 chunk 수.
+    """
+    chunk_bytes = int(chunk_seconds * SAMPLE_RATE) * _BYTES_PER_SAMPLE
+    proc = subprocess.Popen(
+        _ffmpeg_cmd(media_path),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdout is not None
+    stdout = proc.stdout
+    chunks: queue.Queue[bytes | None] = queue.Queue(maxsize=max_buffered_chunks)
+    stop = threading.Event()
+
+    def reader():
+        try:
+            while not stop.is_set():
+                buf = stdout.read(chunk_bytes)
+                if not buf:
+                    break
+                chunks.put(buf)
+        finally:
+            chunks.put(None)
+
+    thread = threading.Thread(target=reader, name="ffmpeg_audio_reader", daemon=True)
+    thread.start()
+    finished = False
+    try:
+        while (buf := chunks.get()) is not None:
+            yield _to_float32(buf)
+        finished = True
+    finally:
+        stop.set()
+        if not finished:
+            proc.kill()
+            # reader가 put에서 막혀 있으면 풀어준다
+            while thread.is_alive():
+                try:
+                    chunks.get_nowait()
+                except queue.Empty:
+                    thread.join(timeout=0.1)
+        stdout.close()
+        returncode = proc.wait()
+        thread.join()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, _ffmpeg_cmd(media_path))
+
+
+def decode_audio(media_path: str | Path) -> np.ndarray:
+    """전체 오디오를 한 번에 16kHz mono float32 배열로 디코딩."""
+    chunks = list(stream_audio(media_path))
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks)
+
+
+def probe_duration(media_path: str | Path) -> float | None:
+    """ffprobe로 미디어 길이(초) 조회. 알 수 없으면 None."""
+    proc = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(media_path),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    try:
+        return float(proc.stdout.strip())
+    except ValueError:
+        return None
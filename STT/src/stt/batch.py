@@ -0,0 +1,141 @@
+"""
+디렉터리 / manifest 단위 일괄 전사.
+
+- Whisper 모델은 한 번만 로드해 전체 배치에서 재사용
+- 현재 파일을 전사하는 동안 다음 파일의 오디오를 백그라운드 스레드에서 미리 디코딩
+- 결과는 파일 하나가 끝날 때마다 JSONL에 한 줄씩 기록 (중단 후 재실행 시 완료된 항목은 건너뜀)
+"""
+import json
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .audio import SAMPLE_RATE, decode_audio
+from .policy import resolve_whisper
+from .pipeline import TranscriptionStats, run_pipeline, transcribe
+from .whisper_pool import load_all_models
+
+__all__ = ["MEDIA_SUFFIXES", "collect_inputs", "completed_entries", "run_batch"]
+
+MEDIA_SUFFIXES = frozenset({".mp4", ".mov", ".mkv", ".avi", ".webm", ".m4a", ".mp3", ".wav"})
+
+
+def collect_inputs(source: str | Path) -> list[Path]:
+    """
+    디렉터리면 하위의 미디어 파일 전체(정렬), 파일이면 manifest로 간주.
+
+    manifest: 한 줄에 경로 하나(.txt) 또는 {"video": 경로} JSON 한 줄(.jsonl).
+    상대 경로는 manifest 위치 기준.
+    """
+    source = Path(source)
+    if source.is_dir():
+        return sorted(p for p in source.rglob("*") if p.suffix.lower() in MEDIA_SUFFIXES)
+
+    paths: list[Path] = []
+    with open(source, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            raw = json.loads(line)["video"] if line.startswith("{") else line
+            path = Path(raw)
+            paths.append(path if path.is_absolute() else source.parent / path)
+    return paths
+
+
+def completed_entries(output_path: str | Path) -> set[str]:
+    """기존 JSONL에서 성공적으로 끝난 항목의 경로 집합 (실패 항목은 재시도 대상)."""
+    done: set[str] = set()
+    output_path = Path(output_path)
+    if not output_path.exists():
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # 중단 시점에 잘린 마지막 줄
+                continue
+            if record.get("status") == "ok":
+                done.add(record["video"])
+    return done
+
+
+def _prefetched(paths: list[Path], pool: ThreadPoolExecutor) -> Iterator[tuple[Path, Future[np.ndarray]]]:
+    """현재 항목을 돌려줄 때 다음 항목의 디코딩을 미리 시작."""
+    if not paths:
+        return
+    next_future = pool.submit(decode_audio, paths[0])
+    for i, path in enumerate(paths):
+        future = next_future
+        if i + 1 < len(paths):
+            next_future = pool.submit(decode_audio, paths[i + 1])
+        yield path, future
+
+
+def _process(path: Path, audio: np.ndarray, whisper_model: str, transcript_only: bool) -> dict[str, Any]:
+    if transcript_only:
+        stats = TranscriptionStats()
+        whisper = resolve_whisper(whisper_model, len(audio) / SAMPLE_RATE)
+        transcript = transcribe(
+            audio,
+            model_size=whisper.model_size,
+            stats=stats,
+            compute_type=whisper.compute_type,
+            beam_size=whisper.beam_size,
+        )
+        return {
+            "transcript": transcript,
+            "audio_seconds": stats.audio_seconds,
+            "speech_coverage": stats.speech_coverage,
+            "whisper": whisper.model_dump(),
+        }
+    result = run_pipeline(str(path), whisper_model=whisper_model, audio=audio)
+    return result.model_dump(exclude={"video_path"})
+
+
+def run_batch(
+    inputs: Iterable[Path],
+    output_path: str | Path,
+    whisper_model: str = "base",
+    transcript_only: bool = False,
+) -> tuple[int, int, int]:
+    """
+    일괄 처리 후 (성공, 실패, 건너뜀) 개수 반환.
+
+    transcript_only: 전사만 수행 (키워드 분석 / 사례 검색 생략)
+    """
+    done = completed_entries(output_path)
+    all_paths = list(inputs)
+    todo = [p for p in all_paths if str(p) not in done]
+    skipped = len(all_paths) - len(todo)
+    print(f"[Batch] 전체 {len(all_paths)}개, 완료 {skipped}개 건너뜀, 처리 대상 {len(todo)}개")
+
+    # auto면 파일마다 정책이 고른 모델을 처음 쓸 때 로드
+    load_all_models(None if whisper_model == "auto" else [whisper_model])
+    ok = failed = 0
+    with (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio_prefetch") as pool,
+        open(output_path, "a", encoding="utf-8") as out,
+    ):
+        for i, (path, audio_future) in enumerate(_prefetched(todo, pool), 1):
+            started = time.perf_counter()
+            record: dict[str, Any] = {"video": str(path)}
+            try:
+                audio = audio_future.result()
+                print(f"\n[Batch {i}/{len(todo)}] {path} ({len(audio) / SAMPLE_RATE:.1f}s)")
+                record |= _process(path, audio, whisper_model, transcript_only)
+                record["status"] = "ok"
+                ok += 1
+            except Exception as e:
+                print(f"[Batch {i}/{len(todo)}] 실패: {path} — {e}")
+                record |= {"status": "error", "error": f"{type(e).__name__}: {e}"}
+                failed += 1
+            record["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()  # 항목마다 기록해 중단되어도 이어서 실행 가능
+    return ok, failed, skipped
@@ -0,0 +1,62 @@
+"""
+외부 API 클라이언트 (프로세스 단위 재사용).
+
+Groq / instructor / Tavily 클라이언트를 요청마다 새로 만들면 HTTP 커넥션 풀과
+TLS 세션이 매번 버려지므로, 최초 호출 시 한 번만 생성해 공유한다.
+"""
+import os
+import threading
+
+import instructor
+from groq import Groq
+from tavily import TavilyClient
+
+__all__ = ["get_groq_client", "get_instructor_client", "get_tavily_client", "reset_clients"]
+
+_lock = threading.Lock()
+_groq: Groq | None = None
+_instructor: instructor.Instructor | None = None
+_tavily: TavilyClient | None = None
+
+
+def _require_env(name: str) -> str:
+    value = os.getenv(name)
+    if not value:
+        raise ValueError(f"{name} 환경변수가 설정되지 않았습니다.")
+    return value
+
+
+def get_groq_client() -> Groq:
+    global _groq
+    if _groq is None:
+        with _lock:
+            if _groq is None:
+                _groq = Groq(api_key=_require_env("GROQ_API_KEY"))
+    return _groq
+
+
+def get_instructor_client() -> instructor.Instructor:
+    """공유 Groq 클라이언트(커넥션 풀)를 감싼 instructor 클라이언트."""
+    global _instructor
+    if _instructor is None:
+        groq_client = get_groq_client()
+        with _lock:
+            if _instructor is None:
+                _instructor = instructor.from_groq(groq_client)
+    return _instructor
+
+
+def get_tavily_client() -> TavilyClient:
+    global _tavily
+    if _tavily is None:
+        with _lock:
+            if _tavily is None:
+                _tavily = TavilyClient(api_key=_require_env("TAVILY_API_KEY"))
+    return _tavily
+
+
+def reset_clients():
+    """API 키 변경 등으로 클라이언트를 다시 만들어야 할 때 사용."""
+    global _groq, _instructor, _tavily
+    with _lock:
+        _groq = _instructor = _tavily = None
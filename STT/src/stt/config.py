@@ -0,0 +1,66 @@
+"""STT 파이프라인 설정 (환경변수 기반)."""
+import os
+from pathlib import Path
+from typing import Literal, Self
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+
+load_dotenv()
+
+__all__ = ["STTSettings", "settings"]
+
+
+class STTSettings(BaseModel):
+    # Whisper 모델 풀
+    whisper_device: str = "cpu"
+    whisper_compute_type: str = "int8"
+    whisper_cpu_threads: int = 0    # 0이면 CTranslate2 기본값 사용
+    whisper_num_workers: int = 1    # 모델 인스턴스 하나가 동시에 처리할 수 있는 transcribe 수
+    whisper_preload: list[str] = ["base"]  # 워커 시작 시 미리 로드할 모델 크기
+    whisper_beam_size: int = 5
+    # whisper_model="auto"일 때 사용하는 지연 시간 예산 / 보정 표 (calibrate.py로 생성)
+    target_latency_s: float = 60.0
+    whisper_throughput_table: str = str(Path.home() / ".cache" / "stt" / "whisper_throughput.json")
+    # VAD (Silero, faster-whisper 내장): 음성 구간만 Whisper로 전달
+    vad_enabled: bool = True
+    vad_min_speech_ms: int = 250     # 이보다 짧은 발화는 버림
+    vad_max_silence_ms: int = 2000   # 발화 구간 내부에 허용되는 최대 무음 (넘으면 구간 분리)
+    vad_speech_pad_ms: int = 400     # 각 발화 구간 앞뒤 여유
+    # 로컬 키워드 사전 필터: 키워드가 전혀 없으면 LLM 호출 생략
+    keyword_prefilter: bool = True
+    # 키워드 추출 LLM 응답 캐시 (정규화 전사 해시 기준)
+    llm_cache_size: int = 512        # 0이면 캐시 사용 안 함
+    llm_cache_ttl_s: float = 6 * 3600
+    llm_model: str = "llama-3.3-70b-versatile"
+    # 외부 API 백엔드 선택: 오프라인 백엔드(rule / fixture)는 API 키가 필요 없음
+    keyword_backend: Literal["groq", "rule"] = "groq"
+    search_backend: Literal["tavily", "fixture"] = "tavily"
+    search_fixture_path: str | None = None   # fixture 검색 결과 JSON
+    stub_llm_latency_s: float = 0.0          # rule 추출기 인위적 지연
+    stub_search_latency_s: float = 0.0       # fixture 검색 인위적 지연
+    # 긴 전사 처리: 세그먼트를 구간 단위로 모아 전사와 동시에 키워드 분석
+    transcript_window_chars: int = 2000  # 0이면 전사 완료 후 전체를 한 번에 분석
+    stop_on_high_risk: bool = False      # high 판정이 나오면 남은 전사/분석 중단
+    # Tavily 사례 검색
+    search_max_keywords: int = 3
+    search_timeout_s: float = 10.0      # 키워드별 검색 타임아웃
+    search_cache_ttl_s: float = 6 * 3600
+    search_cache_redis_url: str | None = None  # 없으면 REDIS_URL, 그것도 없으면 프로세스 내 캐시
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """STT_ 접두사 환경변수로 기본값 덮어쓰기 (예: STT_WHISPER_CPU_THREADS=4)."""
+        values: dict[str, object] = {}
+        for name, field in cls.model_fields.items():
+            raw = os.getenv(f"STT_{name.upper()}")
+            if raw is None:
+                continue
+            if field.annotation == list[str]:
+                values[name] = [v.strip() for v in raw.split(",") if v.strip()]
+            else:
+                values[name] = raw
+        return cls.model_validate(values)
+
+
+settings = STTSettings.from_env()
@@ -0,0 +1,171 @@
+"""
+로컬 키워드 사전 필터 (Aho–Corasick).
+
+전사 텍스트를 LLM에 보내기 전에 시드 키워드 및 변형어를 한 번의 선형 스캔으로 찾는다.
+
+- positive: 어절 시작에서 키워드가 나오고 뒤에 조사/어미만 붙은 경우 (예: "코인으로", "송금해")
+- ambiguous: 어절 중간이나 알 수 없는 접미어와 함께 나온 경우 (예: "여자이자", "사기업")
+- none: 아무 키워드도 없음 → LLM 호출 없이 risk_level='none'으로 처리 가능
+
+띄어쓰기 차이("원금 보장" / "원금보장")는 공백을 제거한 문자열에서 매칭해 흡수한다.
+"""
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Literal
+
+__all__ = ["KeywordMatcher", "PrefilterResult", "PrefilterVerdict", "KEYWORD_VARIANTS"]
+
+type PrefilterVerdict = Literal["positive", "ambiguous", "none"]
+
+# 시드 키워드별 변형어 (영문 표기, 줄임말, 파생어)
+KEYWORD_VARIANTS: dict[str, list[str]] = {
+    "코인": ["coin", "가상화폐", "암호화폐"],
+    "비트코인": ["bitcoin", "btc"],
+    "이더리움": ["ethereum"],
+    "선물": ["선물거래", "futures"],
+    "레버리지": ["leverage"],
+    "리딩방": ["리딩룸"],
+    "고수익": ["고수익률", "수익률"],
+    "원금 보장": ["원금보전"],
+    "피싱": ["phishing", "스미싱"],
+    "보이스피싱": ["보이스 피싱"],
+    "사기": ["사기꾼", "사기범"],
+    "대출": ["대부", "대출금"],
+    "계좌이체": ["계좌 이체"],
+    "도박": ["토토", "카지노", "바카라"],
+    "로또": ["lotto"],
+}
+
+# 체언 뒤 조사 / 용언화 어미 (긴 것부터 매칭)
+_JOSA_SUFFIXES: tuple[str, ...] = tuple(
+    sorted(
+        {
+            "이", "가", "은", "는", "을", "를", "의", "에", "도", "만", "와", "과", "로",
+            "으로", "에서", "에게", "한테", "께", "까지", "부터", "처럼", "보다", "이나",
+            "나", "랑", "이랑", "하고", "요", "이요", "이다", "입니다", "이에요", "예요",
+            "라고", "이라고", "라는", "이라는", "들", "적", "적인", "적으로",
+            "하다", "해", "해요", "했", "했어요", "했습니다", "합니다", "하는", "하면",
+            "하세요", "할", "한", "하여", "해서", "하시", "되", "된", "되는", "돼",
+        },
+        key=len,
+        reverse=True,
+    )
+)
+
+_BOUNDARY = frozenset(" \t\n\r.,!?;:\"'()[]{}<>~…·-/")
+
+
+def _is_josa_tail(rest: str, depth: int = 3) -> bool:
+    """rest가 비어 있거나 조사/어미 조합(최대 depth개)으로만 이루어졌는지."""
+    if not rest:
+        return True
+    if depth == 0:
+        return False
+    return any(
+        rest.startswith(suffix) and _is_josa_tail(rest[len(suffix):], depth - 1)
+        for suffix in _JOSA_SUFFIXES
+    )
+
+
+@dataclass
+class PrefilterResult:
+    verdict: PrefilterVerdict
+    positive: list[str] = field(default_factory=list[str])   # 확실히 매칭된 시드 키워드
+    ambiguous: list[str] = field(default_factory=list[str])  # 애매하게 매칭된 시드 키워드
+
+
+class KeywordMatcher:
+    """시드 키워드 + 변형어에 대한 Aho–Corasick 오토마톤."""
+
+    def __init__(self, keywords: Iterable[str], variants: dict[str, list[str]] | None = None):
+        variants = variants or {}
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # 노드별 출력: (패턴 길이, 대표 시드 키워드)
+        self._out: list[list[tuple[int, str]]] = [[]]
+
+        for kw in keywords:
+            for surface in (kw, *variants.get(kw, [])):
+                self._add(self._compact(surface), kw)
+        self._build()
+
+    @staticmethod
+    def _compact(text: str) -> str:
+        return "".join(ch for ch in text.lower() if not ch.isspace())
+
+    def _add(self, pattern: str, keyword: str):
+        if not pattern:
+            return
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), keyword))
+
+    def _build(self):
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[child] = self._goto[f].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def classify(self, text: str) -> PrefilterResult:
+        """텍스트를 한 번 스캔해 positive / ambiguous / none 판정."""
+        lowered = text.lower()
+        # 공백 제거 문자열과 원문 인덱스 매핑
+        chars: list[str] = []
+        positions: list[int] = []
+        for i, ch in enumerate(lowered):
+            if not ch.isspace():
+                chars.append(ch)
+                positions.append(i)
+
+        # (시작, 끝, 키워드, positive 여부) — 원문 기준 [시작, 끝)
+        hits: list[tuple[int, int, str, bool]] = []
+        node = 0
+        for j, ch in enumerate(chars):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, keyword in self._out[node]:
+                start = positions[j - length + 1]
+                end = positions[j] + 1
+                hits.append((start, end, keyword, self._is_clean(lowered, start, end)))
+
+        positive_spans = [(s, e) for s, e, _, ok in hits if ok]
+        positive: list[str] = []
+        ambiguous: list[str] = []
+        for s, e, keyword, ok in hits:
+            if ok:
+                if keyword not in positive:
+                    positive.append(keyword)
+            elif not any(ps <= s and e <= pe for ps, pe in positive_spans):
+                # 더 긴 positive 매칭에 포함된 부분 매칭(예: "보이스피싱" 안의 "피싱")은 무시
+                if keyword not in ambiguous:
+                    ambiguous.append(keyword)
+        ambiguous = [kw for kw in ambiguous if kw not in positive]
+
+        verdict: PrefilterVerdict = "positive" if positive else "ambiguous" if ambiguous else "none"
+        return PrefilterResult(verdict=verdict, positive=positive, ambiguous=ambiguous)
+
+    @staticmethod
+    def _is_clean(text: str, start: int, end: int) -> bool:
+        """어절 시작에서 시작하고 뒤에 조사/어미만 붙어 있는지."""
+        if start > 0 and text[start - 1] not in _BOUNDARY:
+            return False
+        tail_end = end
+        while tail_end < len(text) and text[tail_end] not in _BOUNDARY:
+            tail_end += 1
+        return _is_josa_tail(text[end:tail_end])
@@ -0,0 +1,153 @@
+"""
+사기 키워드 추출 백엔드.
+
+- groq: Groq LLM (instructor) 기반 추출, 정규화 전사 해시로 응답 캐시
+- rule: 로컬 키워드 매칭 기반 결정적 추출 (외부 호출 없음, 부하 테스트/벤치마크용)
+
+STT_KEYWORD_BACKEND 설정으로 선택한다.
+"""
+import time
+from typing import Annotated, Literal, Protocol
+
+from pydantic import BaseModel, Field
+
+from .clients import get_instructor_client
+from .config import settings
+from .keyword_matcher import KEYWORD_VARIANTS, KeywordMatcher
+from .metrics import stt_metrics
+from .response_cache import TTLCache, transcript_key
+
+__all__ = [
+    "SCAM_SEED_KEYWORDS",
+    "RiskLevel",
+    "Keywords",
+    "KeywordExtractor",
+    "GroqKeywordExtractor",
+    "RuleBasedKeywordExtractor",
+    "extract_keywords_with_groq",
+    "get_keyword_extractor",
+    "keyword_cache",
+    "keyword_matcher",
+]
+
+# 사기 관련 탐지 키워드 seed
+SCAM_SEED_KEYWORDS:list[str] = [
+    "투자", "도박", "코인", "대출", "송금", "수익", "이자", "원금 보장",
+    "비트코인", "이더리움", "선물", "레버리지", "리딩방", "고수익",
+    "불법", "사기", "피싱", "보이스피싱", "로또", "환전", "계좌이체",
+]
+
+keyword_matcher = KeywordMatcher(SCAM_SEED_KEYWORDS, KEYWORD_VARIANTS)
+
+type RiskLevel = Literal['high', 'medium', 'low', 'none']
+
+
+class Keywords(BaseModel):
+    detected_keywords: Annotated[list[str], Field(description="List of detected keywords")]
+    risk_level: RiskLevel
+    reason: Annotated[str, Field(description="위험 판단 근거 한 줄 설명")]
+
+
+class KeywordExtractor(Protocol):
+    name: str
+
+    def extract(self, transcript: str) -> Keywords: ...
+
+
+keyword_cache: TTLCache[Keywords] = TTLCache(
+    maxsize=settings.llm_cache_size, ttl=settings.llm_cache_ttl_s, name="llm_cache"
+)
+
+
+def extract_keywords_with_groq(transcript: str, model: str | None = None) -> Keywords:
+    """Groq LLM으로 텍스트에서 사기 관련 키워드 및 위험도 추출 (응답 캐시 사용)."""
+    model = model or settings.llm_model
+    cache_key = transcript_key(transcript, model)
+    cached = keyword_cache.get(cache_key)
+    if cached is not None:
+        print("  [Groq] 캐시된 분석 결과 사용")
+        return cached.model_copy(deep=True)
+
+    seed_str = ", ".join(SCAM_SEED_KEYWORDS)
+
+    prompt = (
+        "다음 텍스트를 분석하여 투자/도박/코인/대출/송금 등 금융 사기와 관련된 "
+        "키워드를 추출하고 위험도를 평가해주세요.\n\n"
+        f"참고 키워드 목록: {seed_str}\n\n"
+        f"분석할 텍스트:\n{transcript}\n\n"
+    )
+
+    stt_metrics.incr("llm.calls")
+    completion = get_instructor_client().create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        response_model=Keywords,
+    )
+    keyword_cache.set(cache_key, completion.model_copy(deep=True))
+    return completion
+
+
+class GroqKeywordExtractor:
+    name = "groq"
+
+    def __init__(self, model: str | None = None):
+        self.model = model
+        # 키가 없으면 파이프라인 시작 시점에 바로 실패하도록 클라이언트를 미리 생성
+        get_instructor_client()
+
+    def extract(self, transcript: str) -> Keywords:
+        return extract_keywords_with_groq(transcript, self.model)
+
+
+class RuleBasedKeywordExtractor:
+    """
+    로컬 키워드 매칭만으로 위험도를 정하는 결정적 추출기.
+
+    확정 키워드 수 3개 이상 high, 2개 medium, 1개 또는 애매한 매칭만 있으면 low.
+    latency 만큼 대기해 LLM 응답 시간을 흉내 낼 수 있다.
+    """
+
+    name = "rule"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def extract(self, transcript: str) -> Keywords:
+        if self.latency > 0:
+            time.sleep(self.latency)
+        stt_metrics.incr("rule_extractor.calls")
+        result = keyword_matcher.classify(transcript)
+        n = len(result.positive)
+        risk: RiskLevel
+        if n >= 3:
+            risk = "high"
+        elif n == 2:
+            risk = "medium"
+        elif n == 1 or result.ambiguous:
+            risk = "low"
+        else:
+            risk = "none"
+        return Keywords(
+            detected_keywords=result.positive + result.ambiguous,
+            risk_level=risk,
+            reason=(
+                f"규칙 기반 판정: 확정 키워드 {n}개, 애매한 키워드 {len(result.ambiguous)}개"
+                if risk != "none"
+                else "사기 관련 키워드가 발견되지 않았습니다."
+            ),
+        )
+
+
+_extractor: KeywordExtractor | None = None
+
+
+def get_keyword_extractor() -> KeywordExtractor:
+    """설정(STT_KEYWORD_BACKEND)에 따른 프로세스 단위 추출기."""
+    global _extractor
+    if _extractor is None:
+        match settings.keyword_backend:
+            case "groq":
+                _extractor = GroqKeywordExtractor()
+            case "rule":
+                _extractor = RuleBasedKeywordExtractor(latency=settings.stub_llm_latency_s)
+    return _extractor
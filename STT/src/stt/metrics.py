@@ -0,0 +1,56 @@
+"""STT 파이프라인 프로세스 단위 카운터."""
+import threading
+from collections import Counter
+from collections.abc import Callable
+
+__all__ = ["STTMetrics", "stt_metrics"]
+
+
+class STTMetrics:
+    """스레드 안전 카운터. snapshot()으로 누적값과 비율을 조회."""
+
+    def __init__(self):
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[str, int], None]] = []
+
+    def add_listener(self, listener: Callable[[str, int], None]):
+        """incr마다 (name, amount)로 호출 (외부 메트릭 exporter 연동용)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counts[name] += amount
+        for listener in self._listeners:
+            listener(name, amount)
+
+    def get(self, name: str) -> int:
+        with self._lock:
+            return self._counts[name]
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+    @staticmethod
+    def _rate(hit: int, total: int) -> float | None:
+        return hit / total if total else None
+
+    def snapshot(self) -> dict[str, int | float | None]:
+        with self._lock:
+            counts = dict(self._counts)
+        prefilter_total = sum(v for k, v in counts.items() if k.startswith("prefilter."))
+        snapshot: dict[str, int | float | None] = {
+            **counts,
+            # 로컬 사전 필터에서 LLM 호출 없이 끝난 비율
+            "prefilter.short_circuit_rate": self._rate(counts.get("prefilter.none", 0), prefilter_total),
+        }
+        # 캐시 적중률: `<name>.hit` / `<name>.miss` 쌍마다 `<name>.hit_rate`
+        for name in {k.rsplit(".", 1)[0] for k in counts if k.endswith((".hit", ".miss"))}:
+            hit, miss = counts.get(f"{name}.hit", 0), counts.get(f"{name}.miss", 0)
+            snapshot[f"{name}.hit_rate"] = self._rate(hit, hit + miss)
+        return snapshot
+
+
+stt_metrics = STTMetrics()
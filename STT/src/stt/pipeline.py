@@ -1,29 +1,52 @@
-from typing import Literal, Annotated
+from collections.abc import Generator, Iterable, Iterator
+from typing import NamedTuple
 import os
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"  # macOS Conda OpenMP 충돌 방지
 
-import subprocess
-import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from pathlib import Path
-from dataclasses import field
+import time
+from dataclasses import dataclass, field
 
-import instructor
-from pydantic import BaseModel, Field
-from faster_whisper import WhisperModel
-from groq import Groq
-from tavily import TavilyClient
+import numpy as np
+from pydantic import BaseModel
 from dotenv import load_dotenv
 
+from .audio import SAMPLE_RATE, probe_duration, stream_audio
+from .config import settings
+from .keyword_matcher import PrefilterVerdict
+from .keywords import (
+    SCAM_SEED_KEYWORDS,
+    KeywordExtractor,
+    Keywords,
+    RiskLevel,
+    extract_keywords_with_groq,
+    get_keyword_extractor,
+    keyword_matcher,
+)
+from .metrics import stt_metrics
+from .policy import WhisperChoice, resolve_whisper
+from .search import CaseSearcher, get_case_searcher
+from .search_cache import search_cache
+from .whisper_pool import whisper_pool
+
 load_dotenv()
 
-# 사기 관련 탐지 키워드 seed
-SCAM_SEED_KEYWORDS:list[str] = [
-    "투자", "도박", "코인", "대출", "송금", "수익", "이자", "원금 보장",
-    "비트코인", "이더리움", "선물", "레버리지", "리딩방", "고수익",
-    "불법", "사기", "피싱", "보이스피싱", "로또", "환전", "계좌이체",
+__all__ = [
+    "SCAM_SEED_KEYWORDS",
+    "RiskLevel",
+    "Keywords",
+    "STTPipelineResult",
+    "extract_keywords_with_groq",
+    "iter_transcript",
+    "transcribe",
+    "merge_keywords",
+    "search_latest_cases",
+    "run_pipeline",
 ]
 
-type RiskLevel = Literal['high', 'medium', 'low', 'none']
+
 class STTPipelineResult(BaseModel):
     video_path: str
     transcript: str
@@ -31,116 +54,418 @@ class STTPipelineResult(BaseModel):
     risk_level: RiskLevel
     risk_reason: str
     search_results: list[dict[str, str]] = field(default_factory=list[dict[str, str]])
+    # VAD 통계
+    audio_seconds: float = 0.0
+    speech_coverage: float | None = None  # Whisper에 전달된 음성 구간 비율
+    vad_skipped_seconds: float = 0.0      # VAD로 건너뛴 오디오 길이
+    vad_time_saved_seconds: float = 0.0   # 건너뛴 구간 전사 시간 추정치
+    # 로컬 키워드 사전 필터
+    prefilter_verdict: PrefilterVerdict | None = None
+    llm_skipped: bool = False
+    # 구간 단위 분석
+    windows: int = 0
+    stopped_early: bool = False  # high 확정으로 전사/분석을 중단했는지
+    whisper: WhisperChoice | None = None  # 사용한 Whisper 설정 (auto면 정책 선택 근거 포함)
 
 
-def extract_audio(video_path: str | Path) -> str:
-    """ffmpeg으로 비디오에서 오디오(WAV) 추출. 임시파일 경로 반환."""
-    tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-    tmp.close()
-    subprocess.run(
-        [
-            "ffmpeg", "-i", str(video_path),
-            "-vn",                    # 비디오 스트림 제외
-            "-acodec", "pcm_s16le",   # 16-bit PCM
-            "-ar", "16000",           # 16kHz (Whisper 권장)
-            "-ac", "1",               # 모노
-            tmp.name, "-y",           # 출력, 덮어쓰기
-        ],
-        check=True,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
-    return tmp.name
+class TranscriptSegment(NamedTuple):
+    start: float  # 초 (전체 오디오 기준)
+    end: float
+    text: str
 
 
-def transcribe(audio_path: str | Path, model_size: str = "base") -> str:
-    """Faster-Whisper로 음성 → 텍스트 변환 (한국어 우선 감지)."""
-    print(f"  [STT] Whisper 모델 로드 중 ({model_size})...")
-    model = WhisperModel(model_size, device="cpu", compute_type="int8")
-    segments, info = model.transcribe(str(audio_path), language="ko", beam_size=5)
-    text = " ".join(seg.text.strip() for seg in segments)
-    print(f"  [STT] 언어: {info.language}, 확률: {info.language_probability:.2f}")
-    return text
-
-class Keywords(BaseModel):
-    detected_keywords: Annotated[list[str], Field(description="List of detected keywords")]
-    risk_level: RiskLevel
-    reason: Annotated[str, Field(description="위험 판단 근거 한 줄 설명")]
+@dataclass
+class TranscriptionStats:
+    audio_seconds: float = 0.0    # 입력 오디오 길이
+    speech_seconds: float = 0.0   # VAD 통과 후 Whisper에 전달된 길이
+    elapsed_seconds: float = 0.0  # 전사 소요 시간 (wall clock)
 
+    @property
+    def speech_coverage(self) -> float:
+        return self.speech_seconds / self.audio_seconds if self.audio_seconds else 0.0
 
-def extract_keywords_with_groq(transcript: str, client: Groq, model: str = "llama-3.3-70b-versatile") -> Keywords:
-    """Groq LLM으로 텍스트에서 사기 관련 키워드 및 위험도 추출."""
-    seed_str = ", ".join(SCAM_SEED_KEYWORDS)
+    @property
+    def skipped_seconds(self) -> float:
+        return max(0.0, self.audio_seconds - self.speech_seconds)
 
-    prompt = (
-        "다음 텍스트를 분석하여 투자/도박/코인/대출/송금 등 금융 사기와 관련된 "
-        "키워드를 추출하고 위험도를 평가해주세요.\n\n"
-        f"참고 키워드 목록: {seed_str}\n\n"
-        f"분석할 텍스트:\n{transcript}\n\n"
-    )
-    instruct_client = instructor.from_provider(f'groq/{model}', async_client=False, api_key=client.api_key)
+    @property
+    def estimated_time_saved(self) -> float:
+        """VAD로 건너뛴 구간을 같은 속도로 전사했다면 추가로 걸렸을 시간 (추정)."""
+        if not self.speech_seconds:
+            return 0.0
+        return self.elapsed_seconds * self.skipped_seconds / self.speech_seconds
+
+
+type AudioInput = str | Path | np.ndarray | Iterable[np.ndarray]
+
+
+@contextmanager
+def closing_iter(it: Iterable[object]) -> Iterator[None]:
+    """블록을 벗어날 때 제너레이터면 close() 호출."""
+    try:
+        yield
+    finally:
+        if isinstance(it, Generator):
+            it.close()
+
+
+# chunk 경계: 마지막으로 끝난 세그먼트 이후 오디오는 다음 chunk 앞에 붙여 다시 전사
+_BOUNDARY_S = 1.0    # chunk 끝에서 이 안쪽에서 끝난 세그먼트는 경계에 걸친 것으로 봄
+_MAX_CARRY_S = 10.0  # 이월 상한 (넘는 세그먼트는 그대로 확정)
 
-    completion = instruct_client.create(
-        messages=[{"role": "user", "content": prompt}],
-        response_model=Keywords
+
+def _with_last[T](items: Iterable[T]) -> Iterator[tuple[T, bool]]:
+    """(항목, 마지막 여부). 다음 항목을 하나 미리 읽는다."""
+    it = iter(items)
+    try:
+        prev = next(it)
+    except StopIteration:
+        return
+    for item in it:
+        yield prev, False
+        prev = item
+    yield prev, True
+
+
+def _vad_parameters() -> dict[str, int]:
+    return {
+        "min_speech_duration_ms": settings.vad_min_speech_ms,
+        "min_silence_duration_ms": settings.vad_max_silence_ms,
+        "speech_pad_ms": settings.vad_speech_pad_ms,
+    }
+
+
+def iter_transcript(
+    audio: AudioInput,
+    model_size: str = "base",
+    stats: TranscriptionStats | None = None,
+    compute_type: str | None = None,
+    beam_size: int | None = None,
+) -> Iterator[TranscriptSegment]:
+    """
+    Faster-Whisper로 음성 → 텍스트 세그먼트 스트리밍 (한국어 우선 감지).
+
+    audio:
+        - 미디어 파일 경로: ffmpeg stdout에서 chunk 단위로 디코딩하며 바로 전사
+        - 16kHz mono float32 PCM 배열
+        - 위 배열 chunk의 iterable (앞 chunk 전사 중 뒤 chunk 디코딩 가능)
+    chunk 경계에 걸친 발화가 잘리지 않도록, 마지막으로 끝난 세그먼트 이후 오디오(경계에 걸친
+    세그먼트 포함)는 확정하지 않고 다음 chunk 앞에 이어 붙여 다시 전사한다 (VAD 문맥도 유지).
+    stats: 주어지면 오디오 길이 / VAD 통과 길이 / 소요 시간을 누적 기록
+    compute_type / beam_size: 없으면 설정 기본값
+    """
+    chunks: Iterable[np.ndarray]
+    if isinstance(audio, (str, Path)):
+        chunks = stream_audio(audio)
+    elif isinstance(audio, np.ndarray):
+        chunks = [audio]
+    else:
+        chunks = audio
+
+    stats = stats if stats is not None else TranscriptionStats()
+    offset = 0.0  # 현재 window 시작 시각 (전체 오디오 기준)
+    carry = np.zeros(0, dtype=np.float32)  # 이전 chunk에서 확정하지 않은 뒷부분
+    # 모델은 프로세스 단위 풀에서 재사용 (최초 1회만 로드)
+    # 소비자가 중간에 멈추면(조기 종료) ffmpeg 스트림도 바로 정리
+    with closing_iter(chunks), whisper_pool.acquire(model_size, compute_type) as model:
+        for i, (chunk, is_last) in enumerate(_with_last(chunks)):
+            window = np.concatenate([carry, chunk]) if carry.size else chunk
+            started = time.perf_counter()
+            segments, info = model.transcribe(
+                window,
+                language="ko",
+                beam_size=beam_size or settings.whisper_beam_size,
+                vad_filter=settings.vad_enabled,
+                vad_parameters=_vad_parameters() if settings.vad_enabled else None,
+            )
+            if i == 0:
+                print(f"  [STT] 언어: {info.language}, 확률: {info.language_probability:.2f}")
+            # 마지막 세그먼트는 chunk 경계에 걸쳐 잘렸을 수 있으므로 한 개씩 늦게 확정
+            held = None
+            finished_end = 0.0  # window 기준, 확정한 마지막 세그먼트 끝
+            for seg in segments:
+                if held is not None:
+                    stats.elapsed_seconds += time.perf_counter() - started
+                    yield TranscriptSegment(held.start + offset, held.end + offset, held.text.strip())
+                    started = time.perf_counter()
+                    finished_end = held.end
+                held = seg
+            stats.elapsed_seconds += time.perf_counter() - started
+
+            window_s = len(window) / SAMPLE_RATE
+            if held is not None and (is_last or held.end < window_s - _BOUNDARY_S):
+                # chunk 끝 전에 끝난 세그먼트 → 확정
+                yield TranscriptSegment(held.start + offset, held.end + offset, held.text.strip())
+                finished_end, held = held.end, None
+            cut = max(finished_end, window_s - _MAX_CARRY_S)
+            if held is not None and held.start < cut:
+                # 경계에 걸쳤지만 이월 상한보다 김 → 잘린 채로 확정
+                yield TranscriptSegment(held.start + offset, held.end + offset, held.text.strip())
+                cut = max(cut, held.end)
+            # 이월분은 다시 전사되므로 통계에는 새로 들어온 chunk 비율만큼만 반영
+            new_ratio = len(chunk) / len(window) if len(window) else 0.0
+            stats.audio_seconds += len(chunk) / SAMPLE_RATE
+            stats.speech_seconds += (
+                info.duration_after_vad if settings.vad_enabled else info.duration
+            ) * new_ratio
+            carry = window[min(int(cut * SAMPLE_RATE), len(window)):]
+            offset += len(window) / SAMPLE_RATE - len(carry) / SAMPLE_RATE
+
+
+def transcribe(
+    audio: AudioInput,
+    model_size: str = "base",
+    stats: TranscriptionStats | None = None,
+    compute_type: str | None = None,
+    beam_size: int | None = None,
+) -> str:
+    """Faster-Whisper로 음성 → 텍스트 변환 (한국어 우선 감지)."""
+    return " ".join(
+        seg.text for seg in iter_transcript(audio, model_size, stats, compute_type, beam_size)
     )
-    return completion
-
-
-def search_latest_cases(keywords: list[str], tavily_client: TavilyClient) -> list[dict[str, str]]:
-    """Tavily로 키워드별 최신 사기 사례 검색."""
-    results = []
-    for kw in keywords[:3]:  # 상위 3개 키워드만 검색
-        query = f"딥페이크 {kw} 금융사기 최신 사례"
-        print(f"  [Search] 검색 중: {query}")
-        response = tavily_client.search(query=query, max_results=3)
-        for item in response.get("results", []):
-            results.append(
-                {
-                    "keyword": kw,
-                    "title": item.get("title", ""),
-                    "url": item.get("url", ""),
-                    "content": item.get("content", "")[:500],  # 앞 300자만
-                }
+
+_RISK_ORDER: dict[str, int] = {"none": 0, "low": 1, "medium": 2, "high": 3}
+_NO_KEYWORD_REASON = "사기 관련 키워드가 발견되지 않았습니다."
+
+
+def merge_keywords(results: Iterable[Keywords]) -> Keywords:
+    """구간별 분석 결과 병합: 키워드는 합집합(등장 순서 유지), 위험도는 최댓값."""
+    keywords: list[str] = []
+    top: Keywords | None = None
+    for r in results:
+        for kw in r.detected_keywords:
+            if kw not in keywords:
+                keywords.append(kw)
+        if top is None or _RISK_ORDER[r.risk_level] > _RISK_ORDER[top.risk_level]:
+            top = r
+    if top is None:
+        return Keywords(detected_keywords=[], risk_level="none", reason=_NO_KEYWORD_REASON)
+    return Keywords(detected_keywords=keywords, risk_level=top.risk_level, reason=top.reason)
+
+
+class StreamingKeywordAnalyzer:
+    """
+    Whisper가 내보내는 세그먼트를 window_chars 단위 구간으로 모아 키워드 분석.
+
+    - 구간마다 로컬 사전 필터 → 키워드가 있을 때만 LLM 호출
+    - LLM 호출은 전용 스레드 1개에서 순서대로 실행되어 다음 구간 전사와 겹쳐 진행
+    - 직전 구간의 마지막 세그먼트를 문맥으로 함께 전달
+    """
+
+    def __init__(
+        self,
+        extractor: KeywordExtractor,
+        window_chars: int,
+        stop_on_high: bool = False,
+    ):
+        self.extractor = extractor
+        self.window_chars = window_chars
+        self.stop_on_high = stop_on_high
+        self.windows = 0
+        self.llm_calls = 0
+        self.verdicts: list[PrefilterVerdict] = []
+        self._buffer: list[str] = []
+        self._buffer_chars = 0
+        self._context = ""
+        self._futures: list[Future[Keywords]] = []
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt_llm")
+
+    def feed(self, text: str) -> bool:
+        """세그먼트 추가. 조기 종료 조건(high 확정)을 만족하면 True."""
+        if text:
+            self._buffer.append(text)
+            self._buffer_chars += len(text) + 1
+        if self.window_chars > 0 and self._buffer_chars >= self.window_chars:
+            self._flush()
+        return self.stop_on_high and self._high_risk_found()
+
+    def finish(self) -> Keywords:
+        """남은 구간을 분석하고 전체 결과를 병합해 반환."""
+        if self.stop_on_high and self._high_risk_found():
+            # 이미 high면 대기 중인 구간 분석은 필요 없음
+            for f in self._futures:
+                f.cancel()
+        else:
+            self._flush()
+        results = [f.result() for f in self._futures if not f.cancelled()]
+        return merge_keywords(results)
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def prefilter_verdict(self) -> PrefilterVerdict | None:
+        if not self.verdicts:
+            return None
+        for verdict in ("positive", "ambiguous"):
+            if verdict in self.verdicts:
+                return verdict
+        return "none"
+
+    def _high_risk_found(self) -> bool:
+        return any(
+            f.done() and not f.cancelled() and f.exception() is None
+            and f.result().risk_level == "high"
+            for f in self._futures
+        )
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        text = " ".join(self._buffer)
+        context = self._context
+        self._context = self._buffer[-1]
+        self._buffer = []
+        self._buffer_chars = 0
+        self.windows += 1
+
+        if settings.keyword_prefilter:
+            prefilter = keyword_matcher.classify(text)
+            self.verdicts.append(prefilter.verdict)
+            stt_metrics.incr(f"prefilter.{prefilter.verdict}")
+            if prefilter.verdict == "none":
+                # 시드 키워드/변형어가 하나도 없으면 LLM 호출 생략
+                print(f"  [구간 {self.windows}] 사전 필터: 키워드 없음 → 키워드 분석 생략")
+                return
+            print(
+                f"  [구간 {self.windows}] 사전 필터: {prefilter.verdict} "
+                f"(확정 {prefilter.positive}, 애매 {prefilter.ambiguous}) → {self.extractor.name} 분석"
             )
-    return results
+        self.llm_calls += 1
+        prompt_text = f"{context} {text}" if context else text
+        self._futures.append(self._pool.submit(self.extractor.extract, prompt_text))
 
 
-def run_pipeline(video_path: str, whisper_model: str = "base") -> STTPipelineResult:
-    """전체 파이프라인 실행: 비디오 → STT → 키워드 추출 → 검색."""
-    groq_key = os.getenv("GROQ_API_KEY")
-    tavily_key = os.getenv("TAVILY_API_KEY")
+def _search_keyword(kw: str, searcher: CaseSearcher) -> list[dict[str, str]]:
+    query = f"딥페이크 {kw} 금융사기 최신 사례"
+    cached = search_cache.get(query)
+    if cached is not None:
+        print(f"  [Search] 캐시 사용: {query}")
+        return cached
 
-    if not groq_key:
-        raise ValueError("GROQ_API_KEY 환경변수가 설정되지 않았습니다.")
-    if not tavily_key:
-        raise ValueError("TAVILY_API_KEY 환경변수가 설정되지 않았습니다.")
+    print(f"  [Search] 검색 중: {query}")
+    response = searcher.search(query, max_results=3, timeout=settings.search_timeout_s)
+    items = [
+        {
+            "keyword": kw,
+            "title": item.get("title", ""),
+            "url": item.get("url", ""),
+            "content": item.get("content", "")[:500],  # 앞 500자만
+        }
+        for item in response.get("results", [])
+    ]
+    search_cache.set(query, items)
+    return items
 
-    groq_client = Groq(api_key=groq_key)
-    tavily =TavilyClient(api_key=tavily_key)
 
-    print(f"\n[1/4] 오디오 추출: {video_path}")
-    audio_path = extract_audio(video_path)
+def search_latest_cases(keywords: list[str], searcher: CaseSearcher) -> list[dict[str, str]]:
+    """키워드별 최신 사기 사례 검색 (키워드별 동시 실행, 결과 캐시)."""
+    targets = keywords[: settings.search_max_keywords]  # 상위 키워드만 검색
+    if not targets:
+        return []
 
+    pool = ThreadPoolExecutor(max_workers=len(targets), thread_name_prefix="case_search")
     try:
-        print("[2/4] 음성 → 텍스트 변환 (Faster-Whisper)")
-        transcript = transcribe(audio_path, model_size=whisper_model)
-        print(f"  전사 결과 ({len(transcript)}자): {transcript[:200]}...")
-
-        print("[3/4] Groq로 키워드 및 위험도 분석")
-        kw_result = extract_keywords_with_groq(transcript, groq_client)
-        print(f"  감지 키워드: {kw_result.detected_keywords}")
-        print(f"  위험도: {kw_result.risk_level} — {kw_result.reason}")
-
-        search_results = []
-        if kw_result.detected_keywords and kw_result.risk_level != "none":
-            print("[4/4] Tavily로 최신 사례 검색")
-            search_results = search_latest_cases(kw_result.detected_keywords, tavily)
-        else:
-            print("[4/4] 사기 관련 키워드 없음 → 검색 생략")
+        futures = [pool.submit(_search_keyword, kw, searcher) for kw in targets]
+        done, _ = wait(futures, timeout=settings.search_timeout_s)
+        results: list[dict[str, str]] = []
+        # 키워드 순서 유지, 실패/타임아웃 키워드는 건너뜀
+        for kw, future in zip(targets, futures):
+            if future not in done:
+                print(f"  [Search] 타임아웃 ({settings.search_timeout_s:.0f}s): {kw}")
+                continue
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                print(f"  [Search] 검색 실패 ({kw}): {e}")
+        return results
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_pipeline(
+    video_path: str,
+    whisper_model: str = "base",
+    audio: np.ndarray | None = None,
+    target_latency_s: float | None = None,
+) -> STTPipelineResult:
+    """전체 파이프라인 실행: 비디오 → STT → 키워드 추출 → 검색.
 
+    whisper_model: 모델 크기, 또는 "auto"(오디오 길이와 target_latency_s로 정책 선택)
+    audio: 이미 디코딩된 16kHz mono float32 PCM. 주어지면 오디오 추출을 생략한다.
+    target_latency_s: "auto"일 때 전사 지연 시간 예산 (없으면 설정값)
+    """
+    # 백엔드는 설정으로 선택, 프로세스 단위로 재사용
+    # (groq / tavily 백엔드인데 API 키가 없으면 여기서 ValueError)
+    extractor = get_keyword_extractor()
+    searcher = get_case_searcher()
+
+    if audio is None:
+        # ffmpeg stdout을 chunk 단위로 받아 디코딩과 전사를 겹쳐서 진행 (디스크 미사용)
+        print(f"\n[1/4] 오디오 스트리밍 추출: {video_path}")
+        audio_input: AudioInput = stream_audio(video_path)
+    else:
+        print(f"\n[1/4] 공유 오디오 사용 ({len(audio) / SAMPLE_RATE:.1f}s): {video_path}")
+        audio_input = audio
+
+    audio_seconds: float | None = None
+    if audio is not None:
+        audio_seconds = len(audio) / SAMPLE_RATE
+    elif whisper_model == "auto":
+        audio_seconds = probe_duration(video_path)
+    whisper = resolve_whisper(whisper_model, audio_seconds, target_latency_s)
+    print(
+        f"  [STT] Whisper 설정: {whisper.model_size}/{whisper.compute_type}/beam={whisper.beam_size}"
+        + (f" (예상 {whisper.estimated_seconds}s, 예산 {whisper.target_latency_s}s)"
+           if whisper.estimated_seconds is not None else "")
+    )
+
+    print("[2/4] 음성 → 텍스트 변환 (Faster-Whisper) + 구간별 키워드 분석")
+    stt_stats = TranscriptionStats()
+    analyzer = StreamingKeywordAnalyzer(
+        extractor,
+        window_chars=settings.transcript_window_chars,
+        stop_on_high=settings.stop_on_high_risk,
+    )
+    texts: list[str] = []
+    stopped_early = False
+    try:
+        segments = iter_transcript(
+            audio_input,
+            model_size=whisper.model_size,
+            stats=stt_stats,
+            compute_type=whisper.compute_type,
+            beam_size=whisper.beam_size,
+        )
+        with closing_iter(segments):
+            for seg in segments:
+                texts.append(seg.text)
+                if analyzer.feed(seg.text):
+                    stopped_early = True
+                    print(f"  [STT] high 위험도 확정 → {seg.end:.1f}s 지점에서 전사 중단")
+                    break
+        print("[3/4] 구간별 분석 결과 병합")
+        kw_result = analyzer.finish()
     finally:
-        os.unlink(audio_path)  # 임시 오디오 파일 삭제
+        analyzer.close()
+
+    transcript = " ".join(texts)
+    print(
+        f"  [VAD] 음성 비율 {stt_stats.speech_coverage:.0%}, "
+        f"건너뛴 구간 {stt_stats.skipped_seconds:.1f}s "
+        f"(절약 추정 {stt_stats.estimated_time_saved:.1f}s)"
+    )
+    print(f"  전사 결과 ({len(transcript)}자): {transcript[:200]}...")
+    print(f"  구간 {analyzer.windows}개 중 LLM 분석 {analyzer.llm_calls}개")
+    print(f"  감지 키워드: {kw_result.detected_keywords}")
+    print(f"  위험도: {kw_result.risk_level} — {kw_result.reason}")
+
+    search_results = []
+    if kw_result.detected_keywords and kw_result.risk_level != "none":
+        print(f"[4/4] 최신 사례 검색 ({searcher.name})")
+        search_results = search_latest_cases(kw_result.detected_keywords, searcher)
+    else:
+        print("[4/4] 사기 관련 키워드 없음 → 검색 생략")
 
     return STTPipelineResult(
         video_path=video_path,
@@ -149,4 +474,13 @@ def run_pipeline(video_path: str, whisper_model: str = "base") -> STTPipelineRes
         risk_level=kw_result.risk_level,
         risk_reason=kw_result.reason,
         search_results=search_results,
+        audio_seconds=stt_stats.audio_seconds,
+        speech_coverage=stt_stats.speech_coverage if stt_stats.audio_seconds else None,
+        vad_skipped_seconds=stt_stats.skipped_seconds,
+        vad_time_saved_seconds=stt_stats.estimated_time_saved,
+        prefilter_verdict=analyzer.prefilter_verdict,
+        llm_skipped=analyzer.llm_calls == 0,
+        windows=analyzer.windows,
+        stopped_early=stopped_early,
+        whisper=whisper,
     )
@@ -0,0 +1,162 @@
+"""
+Whisper 설정 자동 선택 (지연 시간 예산 기반).
+
+오디오 길이와 목표 지연 시간이 주어지면, 보정된 처리 속도 표에서 예산 안에 끝나는
+가장 정확한 (모델 크기, beam size, compute type) 조합을 고른다.
+
+처리 속도 표는 calibrate.py로 호스트에서 측정해 JSON으로 저장하며
+(STT_WHISPER_THROUGHPUT_TABLE), 파일이 없으면 CPU int8 기준 보수적 기본값을 사용한다.
+"""
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from .config import settings
+
+__all__ = [
+    "MODEL_SIZE_ORDER",
+    "WhisperProfile",
+    "ThroughputTable",
+    "WhisperChoice",
+    "choose_whisper",
+    "resolve_whisper",
+    "load_throughput_table",
+]
+
+# 정확도 순서 (뒤로 갈수록 정확)
+MODEL_SIZE_ORDER: list[str] = ["tiny", "base", "small", "medium", "large-v3"]
+_COMPUTE_TYPE_ORDER: list[str] = ["int8", "int8_float16", "int8_float32", "float16", "float32"]
+
+
+class WhisperProfile(BaseModel):
+    model_size: str
+    compute_type: str
+    beam_size: int
+    rtf: float  # real-time factor: 오디오 1초당 처리 시간(초)
+
+    @property
+    def accuracy_rank(self) -> tuple[int, int, int]:
+        size = MODEL_SIZE_ORDER.index(self.model_size) if self.model_size in MODEL_SIZE_ORDER else -1
+        compute = (
+            _COMPUTE_TYPE_ORDER.index(self.compute_type)
+            if self.compute_type in _COMPUTE_TYPE_ORDER
+            else -1
+        )
+        return size, self.beam_size, compute
+
+
+class ThroughputTable(BaseModel):
+    device: str = "cpu"
+    cpu_threads: int = 0
+    calibrated_at: datetime | None = None  # None이면 내장 기본값
+    overhead_s: float = 1.0  # 호출당 고정 비용 (언어 감지 등)
+    profiles: list[WhisperProfile]
+
+
+# CPU int8 기준 보수적 추정치 (calibrate.py 결과가 있으면 대체됨)
+_DEFAULT_TABLE = ThroughputTable(
+    profiles=[
+        WhisperProfile(model_size="tiny", compute_type="int8", beam_size=1, rtf=0.04),
+        WhisperProfile(model_size="tiny", compute_type="int8", beam_size=5, rtf=0.07),
+        WhisperProfile(model_size="base", compute_type="int8", beam_size=1, rtf=0.08),
+        WhisperProfile(model_size="base", compute_type="int8", beam_size=5, rtf=0.13),
+        WhisperProfile(model_size="small", compute_type="int8", beam_size=1, rtf=0.22),
+        WhisperProfile(model_size="small", compute_type="int8", beam_size=5, rtf=0.35),
+    ],
+)
+
+
+class WhisperChoice(BaseModel):
+    """정책이 고른 Whisper 설정 (결과에 기록)."""
+    model_size: str
+    compute_type: str
+    beam_size: int
+    audio_seconds: float | None = None
+    target_latency_s: float | None = None
+    estimated_seconds: float | None = None
+    within_budget: bool = True
+    source: str = "fixed"  # fixed | policy | policy-default-table
+
+
+_table: ThroughputTable | None = None
+_table_lock = threading.Lock()
+
+
+def load_throughput_table(path: str | Path | None = None, reload: bool = False) -> ThroughputTable:
+    """보정 표 로드 (없거나 읽을 수 없으면 내장 기본값)."""
+    global _table
+    if _table is not None and not reload and path is None:
+        return _table
+    with _table_lock:
+        table_path = Path(path or settings.whisper_throughput_table)
+        try:
+            table = ThroughputTable.model_validate_json(table_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            table = _DEFAULT_TABLE
+        except (OSError, ValueError, json.JSONDecodeError) as e:
+            print(f"  [STT] 처리 속도 표 로드 실패, 기본값 사용 ({table_path}): {e}")
+            table = _DEFAULT_TABLE
+        if path is None:
+            _table = table
+        return table
+
+
+def choose_whisper(
+    audio_seconds: float,
+    target_latency_s: float | None = None,
+    table: ThroughputTable | None = None,
+) -> WhisperChoice:
+    """
+    예산(target_latency_s) 안에 끝나는 가장 정확한 조합 선택.
+    예산 안에 드는 조합이 없으면 가장 빠른 조합을 고르고 within_budget=False.
+    """
+    table = table or load_throughput_table()
+    budget = target_latency_s if target_latency_s is not None else settings.target_latency_s
+
+    def estimate(p: WhisperProfile) -> float:
+        return table.overhead_s + p.rtf * audio_seconds
+
+    fitting = [p for p in table.profiles if estimate(p) <= budget]
+    if fitting:
+        profile = max(fitting, key=lambda p: p.accuracy_rank)
+    else:
+        profile = min(table.profiles, key=lambda p: p.rtf)
+
+    return WhisperChoice(
+        model_size=profile.model_size,
+        compute_type=profile.compute_type,
+        beam_size=profile.beam_size,
+        audio_seconds=audio_seconds,
+        target_latency_s=budget,
+        estimated_seconds=round(estimate(profile), 2),
+        within_budget=bool(fitting),
+        source="policy" if table.calibrated_at is not None else "policy-default-table",
+    )
+
+
+def resolve_whisper(
+    whisper_model: str,
+    audio_seconds: float | None = None,
+    target_latency_s: float | None = None,
+) -> WhisperChoice:
+    """whisper_model이 "auto"면 정책으로 선택, 아니면 고정 설정 그대로 사용."""
+    if whisper_model != "auto":
+        return WhisperChoice(
+            model_size=whisper_model,
+            compute_type=settings.whisper_compute_type,
+            beam_size=settings.whisper_beam_size,
+            audio_seconds=audio_seconds,
+        )
+    if audio_seconds is None:
+        # 길이를 알 수 없으면 미리 로드된 기본 모델 사용
+        return WhisperChoice(
+            model_size=settings.whisper_preload[0] if settings.whisper_preload else "base",
+            compute_type=settings.whisper_compute_type,
+            beam_size=settings.whisper_beam_size,
+            target_latency_s=target_latency_s,
+            source="fallback",
+        )
+    return choose_whisper(audio_seconds, target_latency_s)
@@ -0,0 +1,71 @@
+"""LLM 응답 캐시 (LRU + TTL, 프로세스 단위)."""
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from .metrics import stt_metrics
+
+__all__ = ["TTLCache", "transcript_key"]
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def transcript_key(transcript: str, *extra: str) -> str:
+    """
+    정규화된 전사 텍스트의 sha256.
+
+    대소문자, 공백, 문장부호 차이만 있는 전사(같은 영상 재업로드, 재인코딩 등)는
+    같은 키가 된다.
+    """
+    normalized = _NON_WORD.sub("", transcript.lower())
+    h = hashlib.sha256(normalized.encode("utf-8"))
+    for part in extra:
+        h.update(b"\0" + part.encode("utf-8"))
+    return h.hexdigest()
+
+
+class TTLCache[V]:
+    """
+    크기 제한(LRU)과 만료 시간(TTL)이 있는 스레드 안전 캐시.
+
+    name이 주어지면 stt_metrics에 `<name>.hit` / `<name>.miss` 카운터를 기록한다.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0, name: str | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self._data: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> V | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] < now:
+                del self._data[key]
+                entry = None
+            if entry is not None:
+                self._data.move_to_end(key)
+        if self.name:
+            stt_metrics.incr(f"{self.name}.{'hit' if entry is not None else 'miss'}")
+        return entry[1] if entry is not None else None
+
+    def set(self, key: str, value: V):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
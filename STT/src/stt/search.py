@@ -0,0 +1,86 @@
+"""
+최신 사기 사례 검색 백엔드.
+
+- tavily: Tavily 웹 검색
+- fixture: 고정 결과를 돌려주는 로컬 스텁 (인위적 지연 설정 가능, 부하 테스트/벤치마크용)
+
+STT_SEARCH_BACKEND 설정으로 선택한다.
+"""
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Protocol
+
+from .clients import get_tavily_client
+from .config import settings
+
+__all__ = ["CaseSearcher", "TavilySearcher", "FixtureSearcher", "get_case_searcher"]
+
+
+class CaseSearcher(Protocol):
+    name: str
+
+    def search(self, query: str, max_results: int, timeout: float) -> dict[str, Any]:
+        """Tavily 응답 형식({"results": [{"title", "url", "content"}, ...]})으로 반환."""
+        ...
+
+
+class TavilySearcher:
+    name = "tavily"
+
+    def __init__(self):
+        self.client = get_tavily_client()
+
+    def search(self, query: str, max_results: int, timeout: float) -> dict[str, Any]:
+        return self.client.search(query=query, max_results=max_results, timeout=int(timeout))
+
+
+class FixtureSearcher:
+    """
+    fixture JSON({"쿼리": [{"title", "url", "content"}, ...]})에서 결과를 조회.
+
+    fixture에 없는 쿼리는 쿼리 해시로 만든 결정적 더미 결과를 반환한다.
+    """
+
+    name = "fixture"
+
+    def __init__(self, fixture_path: str | Path | None = None, latency: float = 0.0):
+        self.latency = latency
+        self.fixtures: dict[str, list[dict[str, str]]] = {}
+        if fixture_path:
+            with open(fixture_path, encoding="utf-8") as f:
+                self.fixtures = json.load(f)
+
+    def search(self, query: str, max_results: int, timeout: float) -> dict[str, Any]:
+        if self.latency > 0:
+            time.sleep(min(self.latency, timeout))
+        items = self.fixtures.get(query)
+        if items is None:
+            digest = hashlib.sha256(query.encode("utf-8")).hexdigest()[:12]
+            items = [
+                {
+                    "title": f"[fixture] {query} #{i + 1}",
+                    "url": f"https://fixture.invalid/{digest}/{i + 1}",
+                    "content": f"{query} 관련 고정 검색 결과 {i + 1}",
+                }
+                for i in range(max_results)
+            ]
+        return {"query": query, "results": items[:max_results]}
+
+
+_searcher: CaseSearcher | None = None
+
+
+def get_case_searcher() -> CaseSearcher:
+    """설정(STT_SEARCH_BACKEND)에 따른 프로세스 단위 검색기."""
+    global _searcher
+    if _searcher is None:
+        match settings.search_backend:
+            case "tavily":
+                _searcher = TavilySearcher()
+            case "fixture":
+                _searcher = FixtureSearcher(
+                    settings.search_fixture_path, latency=settings.stub_search_latency_s
+                )
+    return _searcher
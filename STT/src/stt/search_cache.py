@@ -0,0 +1,72 @@
+"""
+Tavily 검색 결과 캐시.
+
+검색 쿼리는 키워드에만 의존하므로("딥페이크 코인 금융사기 최신 사례") 모든 사용자에게
+같은 결과가 돌아간다. redis 패키지와 URL이 있으면 Redis에 저장해 워커 간에 공유하고,
+없거나 Redis 오류 시에는 프로세스 내 TTL 캐시를 사용한다.
+"""
+import json
+import os
+
+from .config import settings
+from .metrics import stt_metrics
+from .response_cache import TTLCache
+
+try:
+    from redis import Redis
+    from redis.exceptions import RedisError
+except ImportError:  # redis는 선택 의존성
+    Redis = None
+    RedisError = OSError
+
+__all__ = ["SearchCache", "search_cache"]
+
+type SearchItems = list[dict[str, str]]
+
+_KEY_PREFIX = "stt:search:"
+
+
+class SearchCache:
+    def __init__(self, redis_url: str | None, ttl: float):
+        self.ttl = ttl
+        self._local: TTLCache[SearchItems] = TTLCache(maxsize=1024, ttl=ttl)
+        self._redis = None
+        if redis_url and Redis is not None:
+            self._redis = Redis.from_url(redis_url, socket_timeout=1.0, socket_connect_timeout=1.0)
+
+    @property
+    def backend(self) -> str:
+        return "redis" if self._redis is not None else "local"
+
+    def get(self, query: str) -> SearchItems | None:
+        items: SearchItems | None = None
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(_KEY_PREFIX + query)
+                items = json.loads(raw) if raw is not None else None
+            except RedisError as e:
+                print(f"  [Search] Redis 캐시 조회 실패, 로컬 캐시 사용: {e}")
+                items = self._local.get(query)
+        else:
+            items = self._local.get(query)
+        stt_metrics.incr(f"search_cache.{'hit' if items is not None else 'miss'}")
+        return items
+
+    def set(self, query: str, items: SearchItems):
+        self._local.set(query, items)
+        if self._redis is None:
+            return
+        try:
+            self._redis.set(
+                _KEY_PREFIX + query,
+                json.dumps(items, ensure_ascii=False),
+                ex=int(self.ttl),
+            )
+        except RedisError as e:
+            print(f"  [Search] Redis 캐시 저장 실패: {e}")
+
+
+search_cache = SearchCache(
+    redis_url=settings.search_cache_redis_url or os.getenv("REDIS_URL"),
+    ttl=settings.search_cache_ttl_s,
+)
@@ -0,0 +1,102 @@
+"""
+프로세스 단위 Whisper 모델 레지스트리.
+
+모델 크기/연산 타입별로 WhisperModel을 한 번만 로드하고, 인스턴스마다
+num_workers 개까지만 동시에 transcribe 하도록 제한한다.
+"""
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from faster_whisper import WhisperModel
+
+from .config import STTSettings, settings
+
+__all__ = ["WhisperPool", "whisper_pool", "load_all_models"]
+
+
+@dataclass
+class _PooledModel:
+    model: WhisperModel
+    slots: threading.BoundedSemaphore
+    in_use: int = field(default=0)  # 대기 + 실행 중인 호출 수 (WhisperPool._lock으로 보호)
+
+
+class WhisperPool:
+    def __init__(self, config: STTSettings):
+        self.config = config
+        self._models: dict[tuple[str, str], _PooledModel] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, model_size: str, compute_type: str | None) -> tuple[str, str]:
+        return model_size, compute_type or self.config.whisper_compute_type
+
+    def _get(self, model_size: str, compute_type: str | None = None) -> _PooledModel:
+        key = self._key(model_size, compute_type)
+        pooled = self._models.get(key)
+        if pooled is not None:
+            return pooled
+        with self._lock:
+            pooled = self._models.get(key)
+            if pooled is None:
+                print(f"  [STT] Whisper 모델 로드 중 ({key[0]}, {key[1]})...")
+                model = WhisperModel(
+                    key[0],
+                    device=self.config.whisper_device,
+                    compute_type=key[1],
+                    cpu_threads=self.config.whisper_cpu_threads,
+                    num_workers=self.config.whisper_num_workers,
+                )
+                pooled = _PooledModel(
+                    model=model,
+                    slots=threading.BoundedSemaphore(self.config.whisper_num_workers),
+                )
+                self._models[key] = pooled
+        return pooled
+
+    @contextmanager
+    def acquire(
+        self, model_size: str, compute_type: str | None = None
+    ) -> Iterator[WhisperModel]:
+        """
+        ```python
+        with whisper_pool.acquire("base") as model:
+            segments, info = model.transcribe(...)
+            text = " ".join(seg.text for seg in segments)  # 세그먼트 소비까지 블록 안에서
+        ```
+        """
+        key = self._key(model_size, compute_type)
+        pooled = self._get(model_size, compute_type)
+        with self._lock:
+            # _get 이후 unload()로 빠졌으면 같은 인스턴스를 다시 등록 (중복 로드 방지)
+            pooled = self._models.setdefault(key, pooled)
+            pooled.in_use += 1
+        try:
+            with pooled.slots:
+                yield pooled.model
+        finally:
+            with self._lock:
+                pooled.in_use -= 1
+
+    def load_all_models(self, model_sizes: Iterable[str] | None = None):
+        """워커 시작 시 warm-up (기본: settings.whisper_preload)."""
+        for size in model_sizes if model_sizes is not None else self.config.whisper_preload:
+            self._get(size)
+
+    def unload(self):
+        """사용(대기 포함) 중이 아닌 모델 인스턴스 해제."""
+        with self._lock:
+            for key, pooled in list(self._models.items()):
+                if pooled.in_use == 0:
+                    del self._models[key]
+
+    def loaded(self) -> list[tuple[str, str]]:
+        return list(self._models)
+
+
+whisper_pool = WhisperPool(settings)
+
+
+def load_all_models(model_sizes: Iterable[str] | None = None):
+    whisper_pool.load_all_models(model_sizes)
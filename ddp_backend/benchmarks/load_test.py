@@ -0,0 +1,156 @@
+"""
+워커 내 추론 부하 테스트 (작업 간 마이크로 배칭 효과 측정)
+
+같은 프로세스에서 여러 작업을 동시에 실행해 처리량(jobs/s)과 작업 지연 p50/p95/p99,
+모델별 배치 통계를 출력한다. Redis/DB 없이 DetectionPipeline을 직접 호출한다.
+
+사용법:
+    python -m ddp_backend.benchmarks.load_test sample.mp4 --mode fast --jobs 32 --concurrency 8
+    python -m ddp_backend.benchmarks.load_test --synthetic --jobs 64 --concurrency 16 --batch-size 1,8,32
+"""
+
+import argparse
+import math
+import statistics
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+def percentile(values: list[float], q: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def run_load(
+    job: Callable[[int], object], jobs: int, concurrency: int
+) -> tuple[float, list[float], int]:
+    """job(i)를 concurrency개 스레드로 jobs번 실행 → (총 소요 시간, 작업별 지연, 실패 수)"""
+    latencies: list[float] = []
+    failures = 0
+    lock = threading.Lock()
+
+    def timed(i: int):
+        nonlocal failures
+        started = time.perf_counter()
+        try:
+            job(i)
+        except Exception as e:
+            print(f"[WARN] job {i} failed: {e}")
+            with lock:
+                failures += 1
+            return
+        with lock:
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load_test") as pool:
+        list(pool.map(timed, range(jobs)))
+    return time.perf_counter() - started, latencies, failures
+
+
+def report(label: str, elapsed: float, latencies: list[float], failures: int, extra: object = None):
+    done = len(latencies)
+    print(f"\n[{label}]")
+    print(f"  jobs: {done} ok / {failures} failed, elapsed {elapsed:.2f}s")
+    print(f"  throughput: {done / elapsed:.2f} jobs/s")
+    if latencies:
+        print(
+            f"  latency: mean {statistics.fmean(latencies):.3f}s"
+            f" | p50 {percentile(latencies, 50):.3f}s"
+            f" | p95 {percentile(latencies, 95):.3f}s"
+            f" | p99 {percentile(latencies, 99):.3f}s"
+        )
+    if extra:
+        print(f"  batching: {extra}")
+
+
+def synthetic(args: argparse.Namespace):
+    """
+    모델 없이 배처만 측정. 배치 1회 비용 = fixed_ms + per_item_ms × 배치 크기
+    (GPU처럼 고정 비용이 큰 장치를 흉내 냄).
+    """
+    from ddp_backend.detectors.batching import MicroBatcher
+
+    for batch_size in (int(b) for b in args.batch_size.split(",")):
+
+        def run_batch(items: list[int]) -> list[int]:
+            time.sleep((args.fixed_ms + args.per_item_ms * len(items)) / 1000)
+            return items
+
+        batcher: MicroBatcher[int, int] = MicroBatcher(
+            "synthetic", run_batch, max_batch_size=batch_size, max_wait_ms=args.max_wait_ms
+        )
+        try:
+            elapsed, latencies, failures = run_load(
+                lambda _: batcher.map(range(args.items_per_job)), args.jobs, args.concurrency
+            )
+            report(f"synthetic batch_size={batch_size}", elapsed, latencies, failures, batcher.stats.snapshot())
+        finally:
+            batcher.close()
+
+
+def pipeline(args: argparse.Namespace):
+    from ddp_backend.core.model import get_detection_pipeline
+    from ddp_backend.schemas.enums import AnalyzeMode
+
+    mode = AnalyzeMode(args.mode)
+    video = Path(args.video)
+    pipe = get_detection_pipeline()
+    pipe.load_models([mode])
+
+    run: Callable[[Path], object] = {
+        AnalyzeMode.FAST: pipe.run_fast_mode,
+        AnalyzeMode.DEEP: pipe.run_deep_mode,
+        AnalyzeMode.AUTO: pipe.run_auto_mode,
+    }[mode]
+
+    # warm-up: 첫 호출의 CUDA 초기화 / 커널 선택 비용 제외
+    for _ in range(args.warmup):
+        run(video)
+
+    baseline = {name: dict(s) for name, s in pipe.batch_stats().items()}
+    elapsed, latencies, failures = run_load(lambda _: run(video), args.jobs, args.concurrency)
+    stats = {
+        str(name): {
+            "batches": s["batches"] - baseline.get(name, {}).get("batches", 0),
+            "items": s["items"] - baseline.get(name, {}).get("items", 0),
+            "max_batch": s["max_batch"],
+        }
+        for name, s in pipe.batch_stats().items()
+    }
+    for s in stats.values():
+        s["avg_batch"] = round(s["items"] / s["batches"], 2) if s["batches"] else 0.0
+    report(f"{mode} x{args.concurrency}", elapsed, latencies, failures, stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추론 부하 테스트 (처리량 / p50·p95·p99 지연)")
+    parser.add_argument("video", nargs="?", help="분석할 영상 (--synthetic이면 불필요)")
+    parser.add_argument("--mode", default="fast", choices=["fast", "deep", "auto"])
+    parser.add_argument("--jobs", type=int, default=16, help="총 작업 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 실행 작업 수")
+    parser.add_argument("--warmup", type=int, default=1, help="측정 전 워밍업 작업 수")
+    parser.add_argument("--synthetic", action="store_true", help="모델 없이 배처만 측정")
+    parser.add_argument("--batch-size", default="1,8,32", help="[synthetic] 비교할 최대 배치 크기 (쉼표 구분)")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0, help="[synthetic] 배치 최대 대기")
+    parser.add_argument("--items-per-job", type=int, default=64, help="[synthetic] 작업당 추론 요청 수")
+    parser.add_argument("--fixed-ms", type=float, default=20.0, help="[synthetic] 배치 1회 고정 비용")
+    parser.add_argument("--per-item-ms", type=float, default=1.0, help="[synthetic] 요청당 추가 비용")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        synthetic(args)
+    elif args.video:
+        pipeline(args)
+    else:
+        parser.error("video 경로 또는 --synthetic 이 필요합니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+S3 클라이언트 호출당 오버헤드 마이크로벤치마크
+
+같은 S3 호출을 두 방식으로 반복해 호출당 지연을 비교한다.
+- per-call: 호출마다 boto3.client("s3") 생성 (기존 core.s3 동작)
+- shared: core.s3.get_s3_client() 프로세스 전역 client (커넥션 풀 / 재시도 / TransferConfig 적용)
+
+로컬 S3 호환 서버(moto server 또는 MinIO)를 대상으로 실행한다. 앱 .env(필수 설정)가 필요하다.
+
+사용법:
+    moto_server -p 5000 &   # 또는 MinIO (http://127.0.0.1:9000, minioadmin/minioadmin)
+    python -m ddp_backend.benchmarks.s3_client --endpoint http://127.0.0.1:5000 --calls 200 --concurrency 8
+"""
+
+import argparse
+import os
+import statistics
+import threading
+import uuid
+from collections.abc import Callable
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from ddp_backend.benchmarks.load_test import percentile, run_load
+
+
+def summarize(label: str, elapsed: float, latencies: list[float], failures: int):
+    done = len(latencies)
+    print(f"  {label:<9} {done:>5} ok / {failures} failed | {done / elapsed:8.1f} calls/s", end="")
+    if latencies:
+        print(
+            f" | mean {statistics.fmean(latencies) * 1000:7.2f}ms"
+            f" | p50 {percentile(latencies, 50) * 1000:7.2f}ms"
+            f" | p95 {percentile(latencies, 95) * 1000:7.2f}ms"
+            f" | p99 {percentile(latencies, 99) * 1000:7.2f}ms"
+        )
+    else:
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="S3 client 호출당 오버헤드 (per-call vs shared)")
+    parser.add_argument("--endpoint", default="http://127.0.0.1:5000", help="S3 호환 서버 주소")
+    parser.add_argument("--bucket", default="ddp-bench")
+    parser.add_argument("--calls", type=int, default=200, help="연산별 호출 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 호출 스레드 수")
+    parser.add_argument("--object-kb", type=int, default=64, help="put/get 객체 크기")
+    args = parser.parse_args()
+
+    # core.s3는 import 시점에 설정을 읽으므로 먼저 환경변수로 대상 지정
+    os.environ["S3_ENDPOINT_URL"] = args.endpoint
+    os.environ["S3_BUCKET"] = args.bucket
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+    os.environ.setdefault("AWS_REGION", "us-east-1")
+
+    import boto3
+
+    from ddp_backend.core import s3
+
+    region = os.environ["AWS_REGION"]
+    create_lock = threading.Lock()
+
+    def per_call_client() -> Any:
+        # 기존 동작: 호출마다 새 client (기본 session은 생성이 스레드 안전하지 않아 생성만 직렬화)
+        with create_lock:
+            return boto3.client("s3", region_name=region, endpoint_url=args.endpoint)
+
+    shared = s3.get_s3_client()
+    try:
+        shared.create_bucket(Bucket=args.bucket)
+    except shared.exceptions.BucketAlreadyOwnedByYou:
+        pass
+    except Exception as e:
+        if "BucketAlreadyExists" not in str(e):
+            raise
+
+    payload = os.urandom(args.object_kb * 1024)
+    key = f"bench/{uuid.uuid4().hex}.bin"
+    shared.put_object(Bucket=args.bucket, Key=key, Body=payload)
+
+    with TemporaryDirectory() as tmp:
+
+        def ops(client: Callable[[], Any], transfer: Any) -> dict[str, Callable[[int], object]]:
+            return {
+                "presign": lambda _: client().generate_presigned_url(
+                    "get_object", Params={"Bucket": args.bucket, "Key": key}, ExpiresIn=3600
+                ),
+                "head": lambda _: client().head_object(Bucket=args.bucket, Key=key),
+                "put": lambda i: client().upload_fileobj(
+                    BytesIO(payload), args.bucket, f"bench/put_{i}.bin", Config=transfer
+                ),
+                "get": lambda i: client().download_file(
+                    args.bucket, key, str(Path(tmp) / f"get_{i}.bin"), Config=transfer
+                ),
+            }
+
+        variants = {
+            "per-call": ops(per_call_client, None),
+            "shared": ops(s3.get_s3_client, s3.TRANSFER_CONFIG),
+        }
+        print(
+            f"S3 microbenchmark: {args.endpoint} calls={args.calls} "
+            f"concurrency={args.concurrency} object={args.object_kb}KB "
+            f"(pool={s3.settings.S3_MAX_POOL_CONNECTIONS}, retry={s3.settings.S3_RETRY_MODE})"
+        )
+        for op in ("presign", "head", "put", "get"):
+            print(f"\n[{op}]")
+            for label, variant in variants.items():
+                variant[op](0)  # warm-up (자격 증명 / endpoint 해석, 첫 커넥션)
+                elapsed, latencies, failures = run_load(variant[op], args.calls, args.concurrency)
+                summarize(label, elapsed, latencies, failures)
+
+
+if __name__ == "__main__":
+    main()
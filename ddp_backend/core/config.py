@@ -36,6 +36,15 @@ class Settings(BaseSettings):
     AWS_REGION: str | None = None
     AWS_ACCESS_KEY_ID: str | None = None
     AWS_SECRET_ACCESS_KEY: str | None = None
+    # S3 클라이언트 (프로세스당 1개 공유): 커넥션 풀 / 재시도 / 멀티파트 전송 설정
+    # S3_ENDPOINT_URL: MinIO 등 S3 호환 스토리지 사용 시
+    S3_ENDPOINT_URL: str | None = None
+    S3_MAX_POOL_CONNECTIONS: int = 32
+    S3_RETRY_MODE: str = "standard"
+    S3_MAX_ATTEMPTS: int = 5
+    S3_MULTIPART_THRESHOLD_MB: int = 16
+    S3_MULTIPART_CHUNK_MB: int = 16
+    S3_TRANSFER_CONCURRENCY: int = 8
     # model configurations
     WAVELET_YAML_PATH: str = "Wavelet-CLIP/wavelet_lib/config/detector/detector.yaml"
     WAVELET_MODEL_PATH: str = "/home/ubuntu/deepfaker_detection/ckpt_best_5.pth"
@@ -44,6 +53,63 @@ class Settings(BaseSettings):
     UNITE_IMG_SIZE: int = 384
     RPPG_MODEL_PATH: str = "/home/ubuntu/deepfaker_detection/UBFC-rPPG_EfficientPhys.pth"
     RPPG_IMG_SIZE: int = 72
+    # auto 모드: wavelet REAL 확률이 이 구간 안이면 UNITE로 에스컬레이션
+    AUTO_UNCERTAIN_LOW: float = 0.35
+    AUTO_UNCERTAIN_HIGH: float = 0.65
+    # 콘텐츠 해시 기반 결과 캐시
+    RESULT_CACHE_ENABLED: bool = True
+    # 결과 캐시 / 단계 체크포인트의 모델 버전 (비우면 체크포인트 파일 내용 sha256으로 계산)
+    MODEL_VERSION: str = ""
+    # Taskiq 큐 (워커 풀별로 담당 모드 분리)
+    TASKIQ_FAST_QUEUE: str = "taskiq"
+    TASKIQ_DEEP_QUEUE: str = "taskiq_deep"
+    # 워커 프로세스당 모드별 동시 실행 수 (deep과 auto는 같은 슬롯 공유)
+    FAST_WORKER_CONCURRENCY: int = 4
+    DEEP_WORKER_CONCURRENCY: int = 1
+    # 추론 전용 스레드 수 (0이면 FAST + DEEP 동시 실행 수의 합)
+    INFERENCE_EXECUTOR_WORKERS: int = 0
+    # deep 작업은 (같은 워커가 fast 큐도 처리할 때) fast 큐에 대기 작업이 있으면 최대 이 시간까지 시작을 미룸 (0이면 양보 안 함)
+    DEEP_YIELD_MAX_WAIT_S: float = 30.0
+    # 워커 모델 로드: 기동 시 담당 모드 모델 미리 로드 여부 / 유휴 해제 시간 (0이면 해제 안 함)
+    MODEL_PRELOAD: bool = True
+    MODEL_IDLE_UNLOAD_SECONDS: float = 0.0
+    # 요청 수락 제어: 추정 대기 시간(적체량 × 최근 평균 처리 시간 / 처리 슬롯)이 상한을 넘거나
+    # 사용자별 진행 중 작업이 한도를 넘으면 429 (ADMISSION_WORKER_PROCESSES: 모드별 워커 프로세스 수)
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_MAX_INFLIGHT_PER_USER: int = 3
+    ADMISSION_MAX_WAIT_S_FAST: float = 300.0
+    ADMISSION_MAX_WAIT_S_DEEP: float = 900.0
+    ADMISSION_WORKER_PROCESSES: int = 1
+    ADMISSION_DEFAULT_JOB_S: float = 30.0
+    ADMISSION_INFLIGHT_TTL_S: float = 3600.0
+    # 작업 비용 상한: 탐지기별 샘플링(wavelet 프레임 수, rPPG 구간, STT 길이, UNITE 구간)을 예산 안으로 조정
+    # JOB_MAX_SOURCE_DURATION_S를 넘는 영상은 분석하지 않음 (0이면 제한 없음)
+    JOB_COMPUTE_BUDGET_S: float = 180.0
+    JOB_MAX_SOURCE_DURATION_S: float = 4 * 3600.0
+    JOB_DECODE_MAX_SIDE: int = 1280
+    # 작업 heartbeat: 이 시간 동안 갱신이 없는 PROCESSING 작업은 reaper가 다시 큐에 넣음 (최대 시도 횟수까지)
+    JOB_HEARTBEAT_INTERVAL_S: float = 30.0
+    JOB_HEARTBEAT_DEADLINE_S: float = 180.0
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_REAPER_INTERVAL_S: float = 60.0
+    # S3 사전 다운로드: 큐에서 다음 N개 작업의 영상을 미리 staging (0이면 사용 안 함)
+    # 워커 --max-async-tasks가 슬롯 수보다 큰 만큼 줄어듦 (슬롯 수와 같게 두어야 N개 모두 사용)
+    # PREFETCH_DIR는 같은 호스트의 워커 프로세스가 공유, PREFETCH_MAX_MB는 프로세스별 한도
+    PREFETCH_LOOKAHEAD: int = 2
+    PREFETCH_DIR: str = "/tmp/ddp_prefetch"
+    PREFETCH_MAX_MB: int = 4096
+    PREFETCH_MAX_AGE_S: float = 1800.0
+    PREFETCH_CONCURRENCY: int = 2
+    # 작업 시작 시 진행 중인 사전 다운로드를 기다리는 최대 시간 (초과 시 직접 다운로드)
+    PREFETCH_WAIT_S: float = 120.0
+    # 워커 prometheus 메트릭 포트 (0이면 사용 안 함, prometheus_client 필요)
+    METRICS_PORT: int = 0
+    # 워커 프로세스별 메트릭을 모아 한 포트로 내보낼 때 쓰는 디렉터리 (prometheus multiprocess 모드, 비우면 사용 안 함)
+    METRICS_MULTIPROC_DIR: str = "/tmp/ddp_metrics"
+    # 작업 간 마이크로 배칭: 모델별 최대 배치 크기 / 첫 요청 후 최대 대기 (1이면 배칭 안 함)
+    WAVELET_BATCH_SIZE: int = 32
+    UNITE_BATCH_SIZE: int = 8
+    BATCH_MAX_WAIT_MS: float = 5.0
 
 
 
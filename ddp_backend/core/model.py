@@ -1,45 +1,134 @@
 """
 Singleton variables used across files
+
+탐지기와 파이프라인은 get_detection_pipeline() 최초 호출 시 생성한다.
+API 서버 프로세스는 추론을 하지 않으므로 이 모듈을 import 해도
+torch / insightface / onnxruntime이 로드되지 않는다 (워커에서만 로드).
 """
 
-from ddp_backend.detectors.audio import STTDetector
-from ddp_backend.detectors.visual import RPPGDetector, UniteDetector, WaveletDetector
-from ddp_backend.schemas.config import BaseVideoConfig, RPPGConfig
-from ddp_backend.services import DetectionPipeline
+import threading
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from ddp_backend.schemas.enums import AnalyzeMode
 
 from .config import settings
 
+if TYPE_CHECKING:
+    from ddp_backend.services import DetectionPipeline
+
+__all__ = ["get_detection_pipeline", "load_all_model", "purge_stale_cache"]
+
 DETECTOR_YAML = "Wavelet-CLIP/wavelet_lib/config/detector/detector.yaml"
 CKPT_PATH = "/home/ubuntu/deepfaker_detection/ckpt_best_5.pth"
 IMG_SIZE = 224
 
+_pipeline: "DetectionPipeline | None" = None
+_pipeline_lock = threading.Lock()
+
 
-# UniteDetector (정밀탐지모드 / deep)
-unite_detector = UniteDetector(
-    BaseVideoConfig(
-        model_path=settings.UNITE_MODEL_PATH,
-        img_size=settings.UNITE_IMG_SIZE,
+def _build_pipeline() -> "DetectionPipeline":
+    # ML 라이브러리는 여기서 처음 import 된다
+    from ddp_backend.detectors.audio import STTDetector
+    from ddp_backend.detectors.visual import RPPGDetector, UniteDetector, WaveletDetector
+    from ddp_backend.schemas.config import BaseVideoConfig, RPPGConfig
+    from ddp_backend.services import DetectionPipeline
+
+    # UniteDetector (정밀탐지모드 / deep)
+    unite_detector = UniteDetector(
+        BaseVideoConfig(
+            model_path=settings.UNITE_MODEL_PATH,
+            img_size=settings.UNITE_IMG_SIZE,
+            batch_max_size=settings.UNITE_BATCH_SIZE,
+            batch_max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+        )
     )
-)
 
-# WaveletDetector (증거수집모드 / fast)
-wavelet_detector = WaveletDetector.from_yaml(
-    settings.WAVELET_YAML_PATH, settings.WAVELET_IMG_SIZE, settings.WAVELET_MODEL_PATH
-)
+    # WaveletDetector (증거수집모드 / fast)
+    wavelet_detector = WaveletDetector.from_yaml(
+        settings.WAVELET_YAML_PATH,
+        settings.WAVELET_IMG_SIZE,
+        settings.WAVELET_MODEL_PATH,
+        batch_max_size=settings.WAVELET_BATCH_SIZE,
+        batch_max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+    )
 
-r_ppg_detector = RPPGDetector(
-    RPPGConfig(
-        model_path=settings.RPPG_MODEL_PATH, img_size=settings.RPPG_IMG_SIZE
+    r_ppg_detector = RPPGDetector(
+        RPPGConfig(
+            model_path=settings.RPPG_MODEL_PATH,
+            img_size=settings.RPPG_IMG_SIZE,
+            batch_max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+        )
     )
-)
 
-stt_detector = STTDetector()
+    stt_detector = STTDetector()
+
+    return DetectionPipeline(
+        unite_detector,
+        wavelet_detector,
+        r_ppg_detector,
+        stt_detector,
+        auto_uncertain_band=(settings.AUTO_UNCERTAIN_LOW, settings.AUTO_UNCERTAIN_HIGH),
+        version_tag=settings.MODEL_VERSION,
+    )
+
+
+def get_detection_pipeline() -> "DetectionPipeline":
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = _build_pipeline()
+    return _pipeline
+
+
+def __getattr__(name: str) -> Any:
+    # 하위 호환: `from ddp_backend.core.model import detection_pipeline`
+    if name == "detection_pipeline":
+        return get_detection_pipeline()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def load_all_model(modes: Iterable[AnalyzeMode] | None = None):
+    """
+    워커 기동 시 호출. modes(기본: 전체)에 필요한 모델만 미리 로드하고,
+    나머지는 첫 사용 시 로드된다. MODEL_IDLE_UNLOAD_SECONDS > 0이면 유휴 모델 해제 시작.
+    """
+    pipeline = get_detection_pipeline()
+    modes = list(modes) if modes is not None else list(AnalyzeMode)
+    if settings.MODEL_PRELOAD:
+        pipeline.load_models(modes)
+    print(f"[STARTUP] Serving modes: {[str(m) for m in modes]}, loaded: {pipeline.loaded_models()}")
+    pipeline.start_idle_unloader(settings.MODEL_IDLE_UNLOAD_SECONDS)
+    # 체크포인트 해시는 프로세스당 1회 계산 → 작업 중(이벤트 루프)에 계산하지 않도록 미리 수행
+    for mode in modes:
+        print(f"[STARTUP] {mode} model version: {pipeline.model_version(mode)}")
+
+
+def purge_stale_cache():
+    """
+    체크포인트가 교체되어 모델 버전이 바뀐 결과 캐시 항목 삭제.
+    워커마다 버전이 잠시 다를 수 있으므로(롤링 배포) 기동 시 자동 실행하지 않고,
+    모든 워커가 새 체크포인트로 교체된 뒤 수동으로 실행한다:
+        python -m ddp_backend.core.model purge-cache
+    """
+    from ddp_backend.core.database import get_db_ctx
+    from ddp_backend.services.result_cache import result_cache
 
+    pipeline = get_detection_pipeline()
+    versions = {mode: pipeline.model_version(mode) for mode in AnalyzeMode}
+    try:
+        with get_db_ctx() as db:
+            removed = result_cache.purge_stale(db, versions)
+        if removed:
+            print(f"[STARTUP] Removed {removed} stale result cache entries")
+    except Exception as e:
+        print(f"[WARN] Result cache purge failed: {e}")
 
-detection_pipeline = DetectionPipeline(
-    unite_detector, wavelet_detector, r_ppg_detector, stt_detector
-)
 
+if __name__ == "__main__":
+    import sys
 
-def load_all_model():
-    detection_pipeline.load_all_models()
+    if sys.argv[1:] != ["purge-cache"]:
+        sys.exit("usage: python -m ddp_backend.core.model purge-cache")
+    purge_stale_cache()
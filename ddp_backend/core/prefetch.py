@@ -0,0 +1,334 @@
+"""
+워커 측 S3 사전 다운로드 (prefetch).
+
+현재 작업이 추론하는 동안 담당 큐에서 아직 전달되지 않은 다음 작업 N개를 엿보고,
+해당 영상 원본을 로컬 staging 디렉터리에 미리 받아 둔다. 작업은 fetch_video()로
+staging된 파일을 가져가고, 없으면 그때 S3에서 직접 받는다.
+
+- 같은 호스트의 워커 프로세스는 staging 디렉터리를 공유한다. 영상별 디렉터리를 mkdir로 먼저 만든
+  프로세스만 다운로드하고(선점), 작업을 전달받은 프로세스가 rename으로 가져간다 → 호스트당 한 번만 받음
+- 용량 제한: PREFETCH_MAX_MB 이상이면 새로 받지 않고, 큐에서 빠진 항목부터 오래된 순으로 삭제
+- 기간 제한: PREFETCH_MAX_AGE_S 동안 가져가지 않은 항목 삭제 (취소 / 다른 호스트가 처리한 작업)
+- 워커가 슬롯보다 많이 잡아 둔 작업(--max-async-tasks)은 작업이 직접 미리 받으므로,
+  그만큼 lookahead에서 빼고 남는 게 없으면 prefetcher를 켜지 않는다 (start 참고)
+"""
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ddp_backend.schemas.enums import AnalyzeMode
+
+from .config import settings
+from .queue_stats import QUEUE_OF_MODE, queue_stats
+from .s3 import download_video_from_s3
+from .tk_broker import worker_max_async_tasks
+
+__all__ = ["S3Prefetcher", "prefetcher", "fetch_video"]
+
+_READY = ".ready"  # 다운로드 완료 표시 (내용: 영상 파일 이름)
+_POLL_S = 0.5
+
+
+@dataclass
+class _Staged:
+    video_id: uuid.UUID
+    future: Future[Path]
+    created_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def path(self) -> Path | None:
+        if not self.future.done() or self.future.exception() is not None:
+            return None
+        return self.future.result()
+
+    @property
+    def size(self) -> int:
+        path = self.path
+        try:
+            return path.stat().st_size if path is not None else 0
+        except OSError:
+            return 0
+
+
+class S3Prefetcher:
+    def __init__(
+        self,
+        staging_dir: str | Path,
+        max_bytes: int,
+        max_age: float,
+        lookahead: int,
+        interval: float = 2.0,
+        concurrency: int = 2,
+    ):
+        # 같은 호스트의 워커 프로세스가 공유 (영상별 하위 디렉터리)
+        self.staging_dir = Path(staging_dir)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.lookahead = lookahead
+        self.active_lookahead = 0  # start()에서 잡아 둔 작업 수를 빼고 정해짐
+        self.interval = interval
+        self.concurrency = concurrency
+        self.hits = 0
+        self.misses = 0
+        self._staged: dict[uuid.UUID, _Staged] = {}
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._streams: list[str] = []
+
+    # ──────────────────────────────────────────────────────────
+    # 작업 측 API
+    # ──────────────────────────────────────────────────────────
+    def take(self, video_id: uuid.UUID, dest_dir: Path, timeout: float | None = None) -> Path | None:
+        """
+        staging된 영상을 dest_dir로 옮겨 반환 (staging 용량에서 제외됨).
+        이 프로세스나 같은 호스트의 다른 워커 프로세스가 다운로드 중이면 완료까지 대기,
+        없거나 실패했으면 None.
+        """
+        with self._lock:
+            staged = self._staged.pop(video_id, None)
+        wait = timeout
+        if staged is not None:
+            try:
+                staged.future.result(timeout=timeout)
+            except FutureTimeoutError:
+                # 다운로드가 너무 오래 걸림 → 직접 받기 (남은 파일은 완료 후 정리)
+                staged.future.add_done_callback(lambda f: self._discard(f))
+                self.misses += 1
+                return None
+            except Exception as e:
+                print(f"[WARN] Prefetch of {video_id} failed: {e}")
+                self.misses += 1
+                return None
+            wait = 0.0
+        dest = self._take_shared(video_id, dest_dir, wait)
+        if dest is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dest
+
+    def _take_shared(self, video_id: uuid.UUID, dest_dir: Path, timeout: float | None) -> Path | None:
+        """공유 staging 디렉터리에서 완료된 영상을 가져옴. 선점한 프로세스의 다운로드가 끝날 때까지 대기."""
+        src = self.staging_dir / str(video_id)
+        deadline = time.monotonic() + (self.max_age if timeout is None else timeout)
+        while not (src / _READY).exists():
+            if not src.exists() or time.monotonic() >= deadline:
+                return None
+            time.sleep(_POLL_S)
+        # 재전달 등으로 두 프로세스가 동시에 가져가지 않도록 rename으로 소유권 확보
+        taken = self.staging_dir / f".taken-{video_id}-{os.getpid()}"
+        try:
+            os.rename(src, taken)
+            name = (taken / _READY).read_text()
+            dest = dest_dir / name
+            shutil.move(taken / name, dest)
+        except OSError as e:
+            print(f"[WARN] Prefetched {video_id} could not be taken: {e}")
+            return None
+        finally:
+            shutil.rmtree(taken, ignore_errors=True)
+        return dest
+
+    # ──────────────────────────────────────────────────────────
+    # 백그라운드 루프
+    # ──────────────────────────────────────────────────────────
+    @staticmethod
+    def _slots(modes: set[AnalyzeMode]) -> int:
+        """워커 프로세스의 동시 추론 슬롯 수 (deep / auto는 같은 슬롯 공유)."""
+        slots = settings.FAST_WORKER_CONCURRENCY if AnalyzeMode.FAST in modes else 0
+        if modes & {AnalyzeMode.DEEP, AnalyzeMode.AUTO}:
+            slots += settings.DEEP_WORKER_CONCURRENCY
+        return slots
+
+    def start(self, modes: Iterable[AnalyzeMode]):
+        """
+        modes를 담당하는 큐를 주기적으로 엿보는 백그라운드 스레드 시작.
+        워커가 슬롯 수보다 많이 잡아 둔 작업은 슬롯을 기다리는 동안 직접 다운로드하므로
+        lookahead에서 그만큼 빼서, 슬롯 앞에 미리 받아 두는 영상이 PREFETCH_LOOKAHEAD를 넘지 않게 한다.
+        """
+        modes = set(modes)
+        if self._thread is not None or self.lookahead <= 0:
+            return
+        self._streams = list(dict.fromkeys(QUEUE_OF_MODE[m] for m in modes))
+        if not self._streams:
+            return
+        held_ahead = max(worker_max_async_tasks() - self._slots(modes), 0)
+        self.active_lookahead = self.lookahead - held_ahead
+        if self.active_lookahead <= 0:
+            print(
+                f"[PREFETCH] Disabled: worker already holds {held_ahead} jobs beyond its slots "
+                f"(--max-async-tasks={worker_max_async_tasks()}); "
+                f"use --max-async-tasks={self._slots(modes)} to prefetch {self.lookahead} ahead"
+            )
+            return
+        # 종료된 프로세스가 남긴 항목 정리 (다른 프로세스가 사용 중인 최근 항목은 유지)
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        for stale in self.staging_dir.iterdir():
+            try:
+                if time.time() - stale.stat().st_mtime > self.max_age:
+                    shutil.rmtree(stale, ignore_errors=True)
+            except OSError:
+                continue
+        self._stop.clear()
+        self._pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="s3_prefetch")
+        self._thread = threading.Thread(target=self._loop, name="s3_prefetcher", daemon=True)
+        self._thread.start()
+        print(f"[PREFETCH] Watching {self._streams} (lookahead={self.active_lookahead})")
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=self.interval * 2)
+        self._thread = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        with self._lock:
+            owned = list(self._staged)
+            self._staged.clear()
+        # 공유 디렉터리이므로 이 프로세스가 받은 항목만 삭제
+        for video_id in owned:
+            shutil.rmtree(self.staging_dir / str(video_id), ignore_errors=True)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                upcoming = self._upcoming_video_ids()
+                self.evict(keep=set(upcoming))
+                for video_id in upcoming:
+                    if not self._schedule(video_id):
+                        break
+            except Exception as e:
+                print(f"[WARN] Prefetch loop failed: {e}")
+
+    def _upcoming_video_ids(self) -> list[uuid.UUID]:
+        ids: list[uuid.UUID] = []
+        for stream in self._streams:
+            for message in queue_stats.upcoming(stream, self.active_lookahead):
+                labels = message.get("labels")
+                raw = labels.get("video_id") if isinstance(labels, dict) else None
+                if raw is None:
+                    args = message.get("args")
+                    raw = args[0] if isinstance(args, list) and args else None
+                try:
+                    ids.append(uuid.UUID(str(raw)))
+                except ValueError:
+                    continue
+        return ids
+
+    def _schedule(self, video_id: uuid.UUID) -> bool:
+        """video_id 다운로드 예약. 용량 한도에 도달했으면 False."""
+        with self._lock:
+            if video_id in self._staged:
+                return True
+            if self._total_bytes() >= self.max_bytes:
+                return False
+            # 같은 호스트의 다른 워커 프로세스가 이미 선점한 영상이면 건너뜀
+            try:
+                (self.staging_dir / str(video_id)).mkdir()
+            except FileExistsError:
+                return True
+            assert self._pool is not None
+            self._staged[video_id] = _Staged(video_id, self._pool.submit(self._download, video_id))
+        return True
+
+    def _download(self, video_id: uuid.UUID) -> Path:
+        from ddp_backend.core.database import get_db_ctx
+        from ddp_backend.services.crud import CRUDSource
+
+        dest_dir = self.staging_dir / str(video_id)  # _schedule에서 선점한 디렉터리
+        try:
+            with get_db_ctx() as db:
+                src = CRUDSource.get_by_video(db, video_id)
+                if src is None:
+                    raise LookupError(f"Source not found for video_id={video_id}")
+                s3_path = src.s3_path
+            path = download_video_from_s3(s3_path, dest_dir)
+            # 다른 프로세스가 받는 중인 파일을 가져가지 않도록 완료 표시는 원자적으로 기록
+            (dest_dir / f"{_READY}.tmp").write_text(path.name)
+            os.replace(dest_dir / f"{_READY}.tmp", dest_dir / _READY)
+        except BaseException:
+            shutil.rmtree(dest_dir, ignore_errors=True)
+            raise
+        return path
+
+    def _discard(self, future: Future[Path]):
+        if future.exception() is None:
+            shutil.rmtree(future.result().parent, ignore_errors=True)
+
+    def _total_bytes(self) -> int:
+        return sum(s.size for s in self._staged.values())
+
+    def evict(self, keep: set[uuid.UUID] | None = None) -> int:
+        """
+        기간 초과 / 실패 항목 삭제 후, 용량 초과분을 오래된 순으로 삭제. 삭제 수 반환.
+        keep(아직 큐에 대기 중인 작업)은 용량 초과로는 삭제하지 않는다 (삭제 후 재다운로드 반복 방지).
+        """
+        keep = keep or set()
+        now = time.monotonic()
+        removed: list[_Staged] = []
+        with self._lock:
+            for video_id, staged in list(self._staged.items()):
+                if staged.future.done() and (
+                    now - staged.created_at > self.max_age
+                    or staged.path is None
+                    # 같은 호스트의 다른 프로세스가 가져감
+                    or not (self.staging_dir / str(video_id)).exists()
+                ):
+                    removed.append(self._staged.pop(video_id))
+            done = sorted(
+                (s for s in self._staged.values() if s.future.done() and s.video_id not in keep),
+                key=lambda s: s.created_at,
+            )
+            total = self._total_bytes()
+            for staged in done:
+                if total <= self.max_bytes:
+                    break
+                total -= staged.size
+                removed.append(self._staged.pop(staged.video_id))
+        for staged in removed:
+            shutil.rmtree(self.staging_dir / str(staged.video_id), ignore_errors=True)
+        return len(removed)
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            staged = len(self._staged)
+            in_flight = sum(1 for s in self._staged.values() if not s.future.done())
+            total = self._total_bytes()
+        return {
+            "enabled": self._thread is not None,
+            "lookahead": self.active_lookahead,
+            "staged": staged,
+            "in_flight": in_flight,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+prefetcher = S3Prefetcher(
+    staging_dir=settings.PREFETCH_DIR,
+    max_bytes=settings.PREFETCH_MAX_MB * 1024 * 1024,
+    max_age=settings.PREFETCH_MAX_AGE_S,
+    lookahead=settings.PREFETCH_LOOKAHEAD,
+    concurrency=settings.PREFETCH_CONCURRENCY,
+)
+
+
+def fetch_video(video_id: uuid.UUID, s3_path: str, dest_dir: Path) -> Path:
+    """작업용 영상 경로: staging된 파일이 있으면 가져오고, 없으면 S3에서 직접 다운로드."""
+    staged = prefetcher.take(video_id, dest_dir, timeout=settings.PREFETCH_WAIT_S)
+    if staged is not None:
+        print(f"[TASK] Using prefetched video: {staged}", flush=True)
+        return staged
+    return download_video_from_s3(s3_path, dest_dir)
@@ -0,0 +1,140 @@
+"""
+모드별 Taskiq 큐 상태 (적체량 / 대기 시간).
+
+- 적체량: Redis stream consumer group의 lag(아직 전달 안 된 작업) + pending(처리 중, 미 ack)
+- 대기 시간: 작업 enqueue 시각(label `enqueued_at`)부터 워커가 처리를 시작할 때까지 (최근 N개)
+- 처리 시간: 워커가 슬롯을 잡고 추론을 끝낼 때까지 (최근 N개, admission control의 대기 시간 추정용)
+"""
+import json
+import time
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from ddp_backend.schemas.enums import AnalyzeMode
+
+from .config import REDIS_URL, settings
+
+__all__ = ["QueueStats", "queue_stats", "QUEUE_OF_MODE", "CONSUMER_GROUP"]
+
+CONSUMER_GROUP = "taskiq"
+QUEUE_OF_MODE: dict[AnalyzeMode, str] = {
+    AnalyzeMode.FAST: settings.TASKIQ_FAST_QUEUE,
+    AnalyzeMode.DEEP: settings.TASKIQ_DEEP_QUEUE,
+    AnalyzeMode.AUTO: settings.TASKIQ_DEEP_QUEUE,
+}
+_WAIT_KEY = "queue_stats:wait:{mode}"
+_DURATION_KEY = "queue_stats:duration:{mode}"
+_WAIT_SAMPLES = 200
+
+
+class QueueStats:
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    def depth(self, stream: str) -> dict[str, int | None]:
+        """stream의 lag / pending / 합계. 조회 실패 시 None."""
+        try:
+            groups: list[dict[str, object]] = self.redis.xinfo_groups(stream)  # type: ignore
+        except RedisError:
+            # stream이 아직 생성되지 않음 (작업이 한 번도 들어오지 않음)
+            return {"lag": 0, "pending": 0, "depth": 0}
+        group = next((g for g in groups if g.get("name") in (CONSUMER_GROUP, CONSUMER_GROUP.encode())), None)
+        if group is None:
+            return {"lag": None, "pending": None, "depth": None}
+        pending = int(group.get("pending") or 0)  # type: ignore
+        lag = group.get("lag")
+        if lag is None:
+            # Redis < 7: lag 미지원 → 전체 길이로 근사
+            lag = max(int(self.redis.xlen(stream)) - pending, 0)  # type: ignore
+        lag = int(lag)  # type: ignore
+        return {"lag": lag, "pending": pending, "depth": lag + pending}
+
+    def upcoming(self, stream: str, count: int) -> list[dict[str, object]]:
+        """
+        consumer group에 아직 전달되지 않은 다음 작업 최대 count개 (stream 순서).
+        Taskiq 메시지 JSON(task_name / labels / args / kwargs)을 그대로 반환.
+        """
+        try:
+            groups: list[dict[str, object]] = self.redis.xinfo_groups(stream)  # type: ignore
+            group = next((g for g in groups if g.get("name") in (CONSUMER_GROUP, CONSUMER_GROUP.encode())), None)
+            last_id = group.get("last-delivered-id", b"0-0") if group is not None else b"0-0"
+            if isinstance(last_id, bytes):
+                last_id = last_id.decode()
+            entries: list[tuple[bytes, dict[bytes, bytes]]] = self.redis.xrange(  # type: ignore
+                stream, min=f"({last_id}", count=count
+            )
+        except RedisError:
+            return []
+        messages: list[dict[str, object]] = []
+        for _, fields in entries:
+            try:
+                messages.append(json.loads(fields[b"data"]))
+            except (KeyError, ValueError):
+                continue
+        return messages
+
+    def backlog(self, mode: AnalyzeMode) -> int:
+        """아직 워커가 가져가지 않은 작업 수."""
+        return self.depth(QUEUE_OF_MODE[mode])["lag"] or 0
+
+    def _record(self, key: str, seconds: float):
+        try:
+            pipe = self.redis.pipeline()
+            pipe.lpush(key, round(max(seconds, 0.0), 3))
+            pipe.ltrim(key, 0, _WAIT_SAMPLES - 1)
+            pipe.execute()
+        except RedisError as e:
+            print(f"[WARN] Queue stats record failed ({key}): {e}")
+
+    def record_wait(self, mode: AnalyzeMode, seconds: float):
+        self._record(_WAIT_KEY.format(mode=mode), seconds)
+
+    def record_duration(self, mode: AnalyzeMode, seconds: float):
+        self._record(_DURATION_KEY.format(mode=mode), seconds)
+
+    def avg_duration(self, mode: AnalyzeMode) -> float | None:
+        """최근 작업 평균 처리 시간 (샘플이 없으면 None)."""
+        return self._summary(_DURATION_KEY, mode)["avg_s"]  # type: ignore
+
+    def wait_for_fast_backlog(self, max_wait: float, poll: float = 0.5) -> float:
+        """
+        fast 큐에 대기 작업이 있으면 비워질 때까지(최대 max_wait초) 대기.
+        deep 작업이 같은 자원(GPU/CPU)을 쓰는 fast 작업에 양보할 때 사용. 대기한 시간 반환.
+        """
+        started = time.monotonic()
+        try:
+            while self.backlog(AnalyzeMode.FAST) > 0:
+                if time.monotonic() - started >= max_wait:
+                    break
+                time.sleep(poll)
+        except RedisError as e:
+            print(f"[WARN] Fast backlog check failed: {e}")
+        return time.monotonic() - started
+
+    def _summary(self, key: str, mode: AnalyzeMode) -> dict[str, float | int | None]:
+        raw: list[bytes] = self.redis.lrange(key.format(mode=mode), 0, -1)  # type: ignore
+        waits = sorted(float(v) for v in raw)
+        if not waits:
+            return {"samples": 0, "avg_s": None, "p50_s": None, "p95_s": None}
+        return {
+            "samples": len(waits),
+            "avg_s": round(sum(waits) / len(waits), 3),
+            "p50_s": waits[len(waits) // 2],
+            "p95_s": waits[min(len(waits) - 1, int(len(waits) * 0.95))],
+        }
+
+    def snapshot(self) -> dict[str, object]:
+        """/health 용: 큐별 적체량 + 모드별 대기 시간."""
+        try:
+            queues = {
+                stream: self.depth(stream) for stream in dict.fromkeys(QUEUE_OF_MODE.values())
+            }
+            waits = {str(mode): self._summary(_WAIT_KEY, mode) for mode in AnalyzeMode}
+            durations = {str(mode): self._summary(_DURATION_KEY, mode) for mode in AnalyzeMode}
+        except RedisError as e:
+            return {"error": str(e)}
+        return {"queues": queues, "wait": waits, "duration": durations}
+
+
+queue_stats = QueueStats(Redis.from_url(REDIS_URL or "redis://127.0.0.1:6379/0"))
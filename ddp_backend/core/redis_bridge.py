@@ -5,7 +5,11 @@ from fastapi import FastAPI
 from pydantic import ValidationError
 from redis.asyncio import Redis
 
-from ddp_backend.schemas.message import WorkerResultMessage
+from ddp_backend.schemas.message import (
+    WorkerPartialMessage,
+    WorkerResultMessage,
+    worker_message_adapter,
+)
 
 from .config import REDIS_URL
 from .websocket import connection_manager
@@ -32,10 +36,18 @@ async def redis_connector(app: FastAPI):
                 if msg["type"] != "message":
                     continue
                 try:
-                    data = WorkerResultMessage.model_validate_json(msg["data"])
+                    data = worker_message_adapter.validate_json(msg["data"])
                 except ValidationError:
                     continue
-                await connection_manager.send_message(data.user_id, data.result_id, data.error_msg)
+                match data:
+                    case WorkerResultMessage():
+                        await connection_manager.send_message(
+                            data.user_id, data.result_id, data.error_msg
+                        )
+                    case WorkerPartialMessage():
+                        await connection_manager.send_json(
+                            data.user_id, data.model_dump(mode="json", exclude={"user_id"})
+                        )
     except asyncio.CancelledError:
         await pubsub.unsubscribe()
         await redis.close()
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
 import uuid
 from pathlib import Path
-from typing import BinaryIO, Optional, Iterable
+from typing import Any, BinaryIO, Optional, Iterable
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 from urllib.parse import urlparse
 
@@ -28,15 +32,64 @@ def _require_bucket():
     if not S3_BUCKET:
         raise RuntimeError("S3_BUCKET env is not set")
 
-def _get_s3_client():
-    kwargs = {"region_name": settings.AWS_REGION}
+# =========================
+# Client (프로세스 전역 1개)
+# =========================
+# boto3 client는 스레드 안전하지만 생성(자격 증명 조회, endpoint / 커넥션 풀 구성)은 비싸고
+# 기본 session에서의 생성은 스레드 안전하지 않으므로, 전용 session으로 최초 사용 시 1번만 만든다.
+_client: Any = None
+_client_lock = threading.Lock()
+
+_CLIENT_CONFIG = Config(
+    max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+    retries={"mode": settings.S3_RETRY_MODE, "max_attempts": settings.S3_MAX_ATTEMPTS},  # type: ignore
+)
+
+# upload_fileobj / download_file 멀티파트 설정
+# (동시 전송 스레드 합이 max_pool_connections를 넘으면 커넥션을 기다리게 됨)
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=settings.S3_MULTIPART_THRESHOLD_MB * 1024 * 1024,
+    multipart_chunksize=settings.S3_MULTIPART_CHUNK_MB * 1024 * 1024,
+    max_concurrency=settings.S3_TRANSFER_CONCURRENCY,
+    use_threads=True,
+)
+
+
+def _create_s3_client():
+    kwargs: dict[str, Any] = {
+        "region_name": settings.AWS_REGION or AWS_REGION,
+        "config": _CLIENT_CONFIG,
+    }
+    if settings.S3_ENDPOINT_URL:
+        kwargs["endpoint_url"] = settings.S3_ENDPOINT_URL
     if settings.AWS_ACCESS_KEY_ID:
         kwargs["aws_access_key_id"] = settings.AWS_ACCESS_KEY_ID
         kwargs["aws_secret_access_key"] = settings.AWS_SECRET_ACCESS_KEY
-    return boto3.client("s3", **kwargs)
+    return boto3.session.Session().client("s3", **kwargs)
+
+
+def get_s3_client():
+    """프로세스 전역 S3 client (지연 생성)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _create_s3_client()
+    return _client
+
+
+def _reset_s3_client():
+    # fork된 자식(워커 프로세스)은 부모의 커넥션 풀을 공유하지 않도록 새로 생성
+    global _client, _client_lock
+    _client = None
+    _client_lock = threading.Lock()
 
-def _s3_client():
-    return boto3.client("s3", region_name=AWS_REGION)
+
+os.register_at_fork(after_in_child=_reset_s3_client)
+
+# 기존 호출부 호환
+_get_s3_client = get_s3_client
+_s3_client = get_s3_client
 
 
 def _normalize_key(key: str) -> str:
@@ -138,12 +191,51 @@ def upload_file_to_s3(
         extra["ContentType"] = content_type
 
     try:
-        _s3_client().upload_fileobj(fileobj, S3_BUCKET, key, ExtraArgs=extra or None)
+        _s3_client().upload_fileobj(
+            fileobj, S3_BUCKET, key, ExtraArgs=extra or None, Config=TRANSFER_CONFIG
+        )
         return key
     except (BotoCoreError, ClientError) as e:
         raise RuntimeError(f"S3 upload failed: {e}") from e
 
 
+class HashingReader:
+    """
+    업로드 스트림을 감싸 읽는 동안 sha256을 계산하는 래퍼.
+    (영상 내용 기반 결과 캐시 키로 사용 — 별도 재읽기 없음)
+    """
+
+    def __init__(self, fileobj: BinaryIO, chunk_size: int = 1024 * 1024):
+        self._fileobj = fileobj
+        self._hash = hashlib.sha256()
+        self._chunk_size = chunk_size
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self._hash.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        # 업로드가 끝까지 읽지 않은 경우(dry-run 등) 남은 바이트까지 반영
+        while self.read(self._chunk_size):
+            pass
+        return self._hash.hexdigest()
+
+
+def upload_file_to_s3_hashed(
+    fileobj: BinaryIO,
+    key: str,
+    content_type: Optional[str] = None,
+) -> tuple[str, str]:
+    """
+    upload_file_to_s3 + 스트리밍 중 sha256 계산.
+    - return: (업로드된 key, content sha256 hex)
+    """
+    reader = HashingReader(fileobj)
+    s3_key = upload_file_to_s3(reader, key, content_type)  # type: ignore[arg-type]
+    return s3_key, reader.hexdigest()
+
+
 def download_file_from_s3(key_or_url: str, download_path: str | Path) -> Path:
     """
     S3 다운로드 표준 함수.
@@ -171,7 +263,7 @@ def download_file_from_s3(key_or_url: str, download_path: str | Path) -> Path:
         return local_path
 
     try:
-        _s3_client().download_file(S3_BUCKET, key, str(local_path))
+        _s3_client().download_file(S3_BUCKET, key, str(local_path), Config=TRANSFER_CONFIG)
         return local_path
     except (BotoCoreError, ClientError) as e:
         raise RuntimeError(f"S3 download failed: {e}") from e
@@ -211,6 +303,7 @@ def upload_image_to_s3(file: UploadFile, user_id: str) -> str:
             settings.S3_BUCKET,
             key,
             ExtraArgs={"ContentType": file.content_type or "image/jpeg"},
+            Config=TRANSFER_CONFIG,
         )
     except ClientError as e:
         raise HTTPException(
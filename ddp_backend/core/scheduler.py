@@ -1,7 +1,16 @@
+import asyncio
+
 from apscheduler.schedulers.background import BackgroundScheduler # 동작 이상 없음
+from redis import Redis
+from redis.exceptions import RedisError
 
+from ddp_backend.core.config import REDIS_URL, settings
 from ddp_backend.core.database import get_db_ctx # DB에서 직접 처리
-from ddp_backend.services.crud import CRUDToken
+from ddp_backend.schemas.enums import VideoStatus
+from ddp_backend.services.crud import CRUDPartialReport, CRUDResult, CRUDToken, CRUDVideo
+
+_REAPER_LOCK_KEY = "scheduler:reaper_lock"
+_redis = Redis.from_url(REDIS_URL or "redis://127.0.0.1:6379/0")
 
 
 def revoke_expired_tokens():
@@ -9,9 +18,52 @@ def revoke_expired_tokens():
     with get_db_ctx() as db:
         CRUDToken.bulk_revoke_expired(db)
 
+
+def requeue_stale_jobs(loop: asyncio.AbstractEventLoop):
+    """
+    heartbeat가 끊긴 PROCESSING 작업(워커 비정상 종료) 처리.
+    - 결과가 이미 있으면 COMPLETED로 정리
+    - 최대 시도 횟수를 넘었으면 FAILED
+    - 그 외에는 QUEUED로 되돌리고 처음과 같은 인자로 다시 enqueue (완료된 단계는 체크포인트에서 재개)
+    API 서버 replica마다 스케줄러가 돌기 때문에, 주기마다 Redis 락을 잡은 replica 하나만 실행한다.
+    """
+    from ddp_backend.task.detection import requeue_detection
+
+    try:
+        # 해제하지 않고 만료시킴 → 같은 주기에 다른 replica가 다시 스캔하지 않음
+        acquired = _redis.set(
+            _REAPER_LOCK_KEY, "1", nx=True, ex=max(int(settings.JOB_REAPER_INTERVAL_S) - 1, 1)
+        )
+    except RedisError as e:
+        print(f"[REAPER] Lock failed, skip this round: {e}")
+        return
+    if not acquired:
+        return
+
+    with get_db_ctx() as db:
+        for video in CRUDVideo.get_stale_processing(db, settings.JOB_HEARTBEAT_DEADLINE_S):
+            if CRUDResult.get_by_video_id(db, video.video_id) is not None:
+                CRUDVideo.update_status(db, video.video_id, VideoStatus.COMPLETED)
+                continue
+            if video.analysis_mode is None or video.attempts >= settings.JOB_MAX_ATTEMPTS:
+                print(f"[REAPER] video_id={video.video_id} gave up after {video.attempts} attempts")
+                CRUDVideo.update_status(db, video.video_id, VideoStatus.FAILED)
+                CRUDPartialReport.delete_by_video(db, video.video_id)
+                continue
+            print(f"[REAPER] Re-enqueue stale job video_id={video.video_id} ({video.analysis_mode})")
+            CRUDVideo.update_status(db, video.video_id, VideoStatus.QUEUED)
+            try:
+                # 브로커 연결은 API 서버 이벤트 루프에 묶여 있으므로 그 루프에서 enqueue
+                asyncio.run_coroutine_threadsafe(
+                    requeue_detection(video.video_id, video.analysis_mode), loop
+                ).result(timeout=10)
+            except Exception as e:
+                print(f"[REAPER] Re-enqueue failed for video_id={video.video_id}: {e}")
+                CRUDVideo.update_status(db, video.video_id, VideoStatus.PROCESSING)
+
 scheduler = BackgroundScheduler()
 
-def start_schedular():
+def start_schedular(loop: asyncio.AbstractEventLoop | None = None):
     if not scheduler.running:
         scheduler.add_job(
             revoke_expired_tokens,
@@ -20,6 +72,16 @@ def start_schedular():
             id="revoke_job",
             replace_existing=True # 같은 id 존재시 덮어씌움
         )
+        if loop is not None:
+            scheduler.add_job(
+                requeue_stale_jobs,
+                trigger='interval',
+                seconds=settings.JOB_REAPER_INTERVAL_S,
+                args=[loop],
+                id="reaper_job",
+                replace_existing=True,
+                max_instances=1,
+            )
     scheduler.start()
 
 def shutdown_schedular():
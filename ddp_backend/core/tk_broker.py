@@ -1,13 +1,71 @@
+"""
+Taskiq 브로커.
+
+fast / deep 작업을 별도 Redis stream(큐)으로 분리해, 워커 풀마다 담당 모드의 모델만 로드한다.
+
+    taskiq worker ddp_backend.core.tk_broker:broker ddp_backend.task.detection       # fast
+    taskiq worker ddp_backend.core.tk_broker:deep_broker ddp_backend.task.detection  # deep / auto
+
+작업 함수는 async이며, 프로세스당 동시 추론 수는 FAST_WORKER_CONCURRENCY /
+DEEP_WORKER_CONCURRENCY로 제한한다. 슬롯을 기다리는 작업은 그동안 S3 다운로드를 미리 진행하므로
+--max-async-tasks가 워커가 동시에 잡아 둘 작업(= 미리 받아 둘 영상) 수가 된다.
+stream은 한 번에 한 메시지씩 읽어, 잡아 두지 않은 작업은 큐에 남겨 prefetcher가 엿볼 수 있게 한다
+(core.prefetch가 --max-async-tasks만큼 lookahead를 줄임).
+"""
+import argparse
+import sys
 from uuid import UUID
 
 from taskiq_redis import RedisAsyncResultBackend, ListQueueBroker
 import taskiq_fastapi
-from .config import REDIS_URL
+from .config import REDIS_URL, settings
+from .queue_stats import CONSUMER_GROUP
 
 from taskiq_redis import RedisStreamBroker
 
+from ddp_backend.schemas.enums import AnalyzeMode
+
 _broker_url = REDIS_URL or "redis://127.0.0.1:6379/0"
 result_backend = RedisAsyncResultBackend[UUID | None](_broker_url)
-broker = RedisStreamBroker(_broker_url).with_result_backend(result_backend)
+
+# 증거수집모드(fast)
+broker = RedisStreamBroker(
+    _broker_url,
+    queue_name=settings.TASKIQ_FAST_QUEUE,
+    consumer_group_name=CONSUMER_GROUP,
+    xread_count=1,
+).with_result_backend(result_backend)
+# 정밀탐지모드(deep) / auto (UNITE 사용)
+deep_broker = RedisStreamBroker(
+    _broker_url,
+    queue_name=settings.TASKIQ_DEEP_QUEUE,
+    consumer_group_name=CONSUMER_GROUP,
+    xread_count=1,
+).with_result_backend(result_backend)
+
+all_brokers = (broker, deep_broker)
 
 taskiq_fastapi.init(broker, "ddp_backend.main:app")
+taskiq_fastapi.init(deep_broker, "ddp_backend.main:app")
+
+
+def is_worker_process() -> bool:
+    return any(b.is_worker_process for b in all_brokers)
+
+
+def serving_modes() -> set[AnalyzeMode]:
+    """현재 워커 프로세스가 처리하는 분석 모드 (API 서버면 빈 집합)."""
+    modes: set[AnalyzeMode] = set()
+    if broker.is_worker_process:
+        modes.add(AnalyzeMode.FAST)
+    if deep_broker.is_worker_process:
+        modes |= {AnalyzeMode.DEEP, AnalyzeMode.AUTO}
+    return modes
+
+
+def worker_max_async_tasks() -> int:
+    """taskiq worker의 --max-async-tasks (워커 프로세스가 동시에 잡아 두는 작업 수, 기본 100, 0 이하면 무제한)."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--max-async-tasks", type=int, default=100)
+    args, _ = parser.parse_known_args(sys.argv[1:])
+    return args.max_async_tasks if args.max_async_tasks > 0 else sys.maxsize
@@ -0,0 +1,205 @@
+"""
+작업 단위 구간(stage) 타이밍 수집.
+
+```python
+with start_trace(AnalyzeMode.FAST) as trace:
+    with span("download"):
+        ...
+    with span("wavelet.forward"):
+        ...
+result.timings = trace.summary()
+```
+
+- 현재 작업의 trace는 contextvar로 전달된다. 다른 스레드에서 실행되는 코드는
+  contextvars.copy_context().run(...)으로 실행해야 같은 trace에 기록된다 (submit_in_context 참고).
+- 같은 이름의 span이 여러 번(프레임/윈도우별, 병렬 분기) 실행되면 시간을 합산한다.
+- prometheus_client가 설치되어 있으면 stage별 / 작업별 히스토그램으로도 내보낸다.
+  워커 프로세스가 여러 개여도 METRICS_MULTIPROC_DIR에 각자 기록하고, 포트를 먼저 잡은 프로세스가
+  모든 프로세스의 값을 합쳐 내보낸다 (prometheus multiprocess 모드).
+"""
+import contextvars
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from pathlib import Path
+
+from .config import settings
+
+# multiprocess 모드는 prometheus_client import 전에 환경변수로 켜야 함
+if settings.METRICS_PORT > 0 and settings.METRICS_MULTIPROC_DIR:
+    if "prometheus_client" in sys.modules and "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        print("[WARN] prometheus_client was imported before tracing. Multiprocess metrics disabled.")
+    else:
+        os.makedirs(settings.METRICS_MULTIPROC_DIR, exist_ok=True)
+        os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.METRICS_MULTIPROC_DIR)
+
+try:
+    import prometheus_client  # type: ignore
+except ImportError:  # 선택 의존성
+    prometheus_client = None
+
+__all__ = [
+    "JobTrace",
+    "current_trace",
+    "start_trace",
+    "span",
+    "submit_in_context",
+    "record_stt_event",
+    "record_stt_short_circuit_rate",
+    "start_metrics_server",
+]
+
+_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+if prometheus_client is not None:
+    _STAGE_SECONDS = prometheus_client.Histogram(
+        "ddp_stage_seconds", "Per-job stage duration", ["stage"], buckets=_BUCKETS
+    )
+    _JOB_SECONDS = prometheus_client.Histogram(
+        "ddp_job_seconds", "End-to-end job duration", ["mode", "status"], buckets=_BUCKETS
+    )
+    _STT_EVENTS = prometheus_client.Counter(
+        "ddp_stt_events",
+        "STT pipeline counters (llm_cache / search_cache hit|miss, llm.calls, prefilter.<verdict>)",
+        ["name"],
+    )
+    # 프로세스별 누적 비율 (multiprocess 모드에서는 살아 있는 프로세스마다 pid label로 구분)
+    _STT_SHORT_CIRCUIT = prometheus_client.Gauge(
+        "ddp_stt_prefilter_short_circuit_ratio",
+        "Share of STT windows resolved by the local keyword prefilter without an LLM call",
+        multiprocess_mode="liveall",
+    )
+
+
+class JobTrace:
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        self.stages: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self.failed = False
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float):
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+            self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self) -> dict[str, float]:
+        """stage별 누적 시간(초) + total. Result.timings에 저장되는 형태."""
+        with self._lock:
+            timings = {stage: round(sec, 4) for stage, sec in self.stages.items()}
+        timings["total"] = round(self.elapsed, 4)
+        return timings
+
+
+_current: contextvars.ContextVar[JobTrace | None] = contextvars.ContextVar(
+    "ddp_job_trace", default=None
+)
+
+
+def current_trace() -> JobTrace | None:
+    return _current.get()
+
+
+@contextmanager
+def start_trace(name: str) -> Iterator[JobTrace]:
+    """새 작업 trace 시작. 종료 시 작업 전체 시간을 히스토그램에 기록."""
+    trace = JobTrace(name)
+    token = _current.set(trace)
+    try:
+        yield trace
+    except BaseException:
+        trace.failed = True
+        raise
+    finally:
+        _current.reset(token)
+        if prometheus_client is not None:
+            status = "error" if trace.failed else "ok"
+            _JOB_SECONDS.labels(mode=name, status=status).observe(trace.elapsed)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """stage 구간 시간 측정. 진행 중인 trace가 없으면 히스토그램에만 기록."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started
+        trace = _current.get()
+        if trace is not None:
+            trace.add(stage, seconds)
+        if prometheus_client is not None:
+            _STAGE_SECONDS.labels(stage=stage).observe(seconds)
+
+
+def record_stt_event(name: str, amount: int = 1):
+    """STT 파이프라인 카운터(stt_metrics) 증가분을 prometheus로 내보냄."""
+    if prometheus_client is not None:
+        _STT_EVENTS.labels(name=name).inc(amount)
+
+
+def record_stt_short_circuit_rate(rate: float | None):
+    """stt_metrics의 prefilter.short_circuit_rate를 prometheus gauge로 내보냄."""
+    if prometheus_client is not None and rate is not None:
+        _STT_SHORT_CIRCUIT.set(rate)
+
+
+def submit_in_context[T](executor: Executor, fn: Callable[..., T], *args: object) -> Future[T]:
+    """executor.submit과 같되 현재 contextvar(trace)를 작업 스레드로 전달."""
+    ctx = contextvars.copy_context()
+    return executor.submit(ctx.run, fn, *args)
+
+
+def _prune_dead_processes(multiproc_dir: Path):
+    """종료된 프로세스가 남긴 multiprocess 메트릭 파일(`<type>_<pid>.db`) 삭제."""
+    for path in multiproc_dir.glob("*.db"):
+        try:
+            pid = int(path.stem.rsplit("_", 1)[1])
+            os.kill(pid, 0)
+        except (IndexError, ValueError):
+            continue
+        except ProcessLookupError:
+            path.unlink(missing_ok=True)
+        except PermissionError:
+            continue  # 다른 사용자의 살아 있는 프로세스
+
+
+def start_metrics_server(port: int):
+    """prometheus 스크레이프용 HTTP 서버 (port <= 0이거나 prometheus_client 미설치면 무시)."""
+    if port <= 0:
+        return
+    if prometheus_client is None:
+        print("[WARN] prometheus_client is not installed. Metrics export disabled.")
+        return
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir is None:
+        try:
+            prometheus_client.start_http_server(port)
+            print(f"[STARTUP] Prometheus metrics on :{port}")
+        except OSError as e:
+            # 같은 호스트의 다른 워커 프로세스가 이미 포트를 사용 중 (이 프로세스의 값은 내보내지 못함)
+            print(f"[WARN] Metrics server failed on :{port}: {e}")
+        return
+
+    from prometheus_client import multiprocess  # type: ignore
+
+    registry = prometheus_client.CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=multiproc_dir)
+    try:
+        prometheus_client.start_http_server(port, registry=registry)
+    except OSError:
+        # 다른 워커 프로세스가 이미 exporter → 이 프로세스의 값도 그쪽에서 합쳐 내보냄
+        print(f"[STARTUP] Prometheus metrics on :{port} served by another worker (multiprocess)")
+        return
+    _prune_dead_processes(Path(multiproc_dir))
+    print(f"[STARTUP] Prometheus metrics on :{port} (multiprocess: {multiproc_dir})")
@@ -1,4 +1,5 @@
 from contextlib import asynccontextmanager
+from typing import Any
 
 from uuid import UUID
 from fastapi import WebSocket
@@ -21,6 +22,11 @@ class ConnectionManager:
             websocket = self.connections[user_id]
             await websocket.send_text(f"{res_id}" if res_id else f"{error_msg}")
 
+    async def send_json(self, user_id: UUID, data: dict[str, Any]):
+        if user_id in self.connections:
+            websocket = self.connections[user_id]
+            await websocket.send_json(data)
+
 
 connection_manager = ConnectionManager()
 
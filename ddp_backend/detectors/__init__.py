@@ -1,6 +1,9 @@
 from .interfaces import VisualDetector, AudioAnalyzer
+from .media import MediaContext, probe_media
 
 __all__ = [
     'AudioAnalyzer',
+    'MediaContext',
     'VisualDetector',
-]
\ No newline at end of file
+    'probe_media',
+]
@@ -1,20 +1,49 @@
 from pathlib import Path
 from typing import final, override
 
-from STT.src.stt import SCAM_SEED_KEYWORDS, run_pipeline
+from STT.src.stt import SCAM_SEED_KEYWORDS, load_all_models, run_pipeline, stt_metrics, whisper_pool
 
+from ddp_backend.core.tracing import record_stt_event, record_stt_short_circuit_rate, span
 from ddp_backend.schemas.enums import ModelName, Status, STTRiskLevel
 from ddp_backend.schemas.report import STTReport
-from ddp_backend.detectors import AudioAnalyzer
+from ddp_backend.detectors import AudioAnalyzer, MediaContext
+
+def _export_stt_metric(name: str, amount: int):
+    # 키워드 / 검색 캐시 적중, LLM 호출 수, 사전 필터 판정을 워커 prometheus 메트릭으로 내보냄
+    record_stt_event(name, amount)
+    if name.startswith("prefilter."):
+        record_stt_short_circuit_rate(stt_metrics.snapshot()["prefilter.short_circuit_rate"])
+
+
+stt_metrics.add_listener(_export_stt_metric)
 
 
 @final
 class STTDetector(AudioAnalyzer):
     model_name = ModelName.STT
 
+    def __init__(self, whisper_model: str = "base"):
+        self.whisper_model = whisper_model
+
+    def load_model(self):
+        # Whisper 모델을 프로세스 풀에 미리 로드 (job마다 재로드 방지)
+        # auto면 영상마다 정책이 고르므로 STT_WHISPER_PRELOAD 목록만 미리 로드
+        load_all_models(None if self.whisper_model == "auto" else [self.whisper_model])
+
+    def unload_model(self):
+        whisper_pool.unload()
+
     @override
-    def analyze(self, vid_path: str | Path) -> STTReport:
-        result = run_pipeline(str(vid_path))
+    def analyze(
+        self, vid_path: str | Path, media: MediaContext | None = None
+    ) -> STTReport:
+        audio = media.audio if media is not None else None
+        # 작업 계획이 있으면 오디오는 이미 계획 구간으로 잘려 있고, "auto" Whisper 선택도 같은 예산 사용
+        budget = media.plan.budget_s if media is not None and media.plan is not None else None
+        with span("stt.pipeline"):
+            result = run_pipeline(
+                str(vid_path), whisper_model=self.whisper_model, audio=audio, target_latency_s=budget
+            )
         detected_set = set(result.detected_keywords)
         # 시드 키워드 전체를 detected 여부와 함께 반환
         stt_keywords: list[dict[str, str | bool]] = [
@@ -0,0 +1,167 @@
+"""
+작업 간 마이크로 배칭 스케줄러.
+
+여러 Taskiq 작업(스레드)이 같은 모델에 보내는 프레임/클립 추론 요청을 모델 전용 스레드
+하나가 모아, 최대 max_batch_size개 또는 첫 요청 후 max_wait_ms가 지나면 한 번에 실행하고
+결과를 Future로 돌려준다.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+__all__ = ["MicroBatcher", "BatcherStats"]
+
+
+@dataclass
+class BatcherStats:
+    batches: int = 0
+    items: int = 0
+    busy_seconds: float = 0.0
+    max_batch: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, size: int, seconds: float):
+        with self._lock:
+            self.batches += 1
+            self.items += size
+            self.busy_seconds += seconds
+            self.max_batch = max(self.max_batch, size)
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "items": self.items,
+                "avg_batch": round(self.items / self.batches, 2) if self.batches else 0.0,
+                "max_batch": self.max_batch,
+                "busy_seconds": round(self.busy_seconds, 3),
+            }
+
+
+class MicroBatcher[I, O]:
+    """
+    ```python
+    batcher = MicroBatcher("wavelet", run_batch, max_batch_size=32, max_wait_ms=5)
+    probs = batcher.map(tensors)  # 다른 작업의 요청과 섞여 배치로 실행됨
+    ```
+
+    run_batch: 입력 리스트 → 같은 순서/길이의 출력 시퀀스
+    max_batch_size=1이면 배칭 없이 모델 호출만 전용 스레드로 직렬화된다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run_batch: Callable[[list[I]], Sequence[O]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        self.name = name
+        self.run_batch = run_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.stats = BatcherStats()
+        self._queue: queue.Queue[tuple[I, Future[O]] | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, item: I) -> Future[O]:
+        return self.submit_many([item])[0]
+
+    def submit_many(self, items: Iterable[I]) -> list[Future[O]]:
+        if self._closed:
+            raise RuntimeError(f"{self.name} batcher is closed.")
+        self._ensure_thread()
+        futures: list[Future[O]] = []
+        for item in items:
+            future: Future[O] = Future()
+            self._queue.put((item, future))
+            futures.append(future)
+        return futures
+
+    def map(self, items: Iterable[I]) -> list[O]:
+        return [f.result() for f in self.submit_many(items)]
+
+    def close(self):
+        """스레드 종료. 대기 중인 요청은 실패 처리."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._thread is not None:
+                self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+
+    def _ensure_thread(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name=f"batcher_{self.name}", daemon=True
+                )
+                self._thread.start()
+
+    def _collect(self) -> tuple[list[tuple[I, Future[O]]], bool]:
+        """첫 요청을 기다린 뒤 max_wait 동안(또는 가득 찰 때까지) 추가 요청 수집."""
+        first = self._queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                # 이미 쌓인 요청은 대기 없이 가져오고, 비었을 때만 남은 시간만큼 대기
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _loop(self):
+        stop = False
+        while not stop:
+            batch, stop = self._collect()
+            # 호출 측에서 취소한 요청은 제외
+            batch = [(x, f) for x, f in batch if f.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            started = time.perf_counter()
+            try:
+                outputs = self.run_batch([x for x, _ in batch])
+                if len(outputs) != len(batch):
+                    raise RuntimeError(
+                        f"{self.name} batch returned {len(outputs)} outputs for {len(batch)} inputs"
+                    )
+            except BaseException as e:
+                for _, f in batch:
+                    f.set_exception(e)
+            else:
+                for (_, f), out in zip(batch, outputs):
+                    f.set_result(out)
+            self.stats.record(len(batch), time.perf_counter() - started)
+
+        # 종료 후 남은 요청 실패 처리
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(RuntimeError(f"{self.name} batcher is closed."))
@@ -7,6 +7,8 @@ from pydantic import BaseModel
 from ddp_backend.schemas.enums import ModelName
 from ddp_backend.schemas.report import STTReport, VideoReport
 
+from .media import MediaContext
+
 
 class VisualDetector[ContentType: BaseModel](ABC):
     model_name: ClassVar[ModelName]
@@ -15,13 +17,26 @@ class VisualDetector[ContentType: BaseModel](ABC):
     def load_model(self):
         pass
 
+    def unload_model(self):
+        pass
+
     @abstractmethod
-    def analyze(self, vid_path: str | Path) -> VideoReport[ContentType]:
+    def analyze(
+        self, vid_path: str | Path, media: MediaContext | None = None
+    ) -> VideoReport[ContentType]:
         pass
 
 class AudioAnalyzer(ABC):
     model_name: ClassVar[ModelName]
 
+    def load_model(self):
+        pass
+
+    def unload_model(self):
+        pass
+
     @abstractmethod
-    def analyze(self, vid_path: str | Path) -> STTReport:
-        pass
\ No newline at end of file
+    def analyze(
+        self, vid_path: str | Path, media: MediaContext | None = None
+    ) -> STTReport:
+        pass
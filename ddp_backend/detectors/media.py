@@ -0,0 +1,374 @@
+"""
+Per-job media context.
+
+한 작업(job) 안에서 여러 탐지기가 같은 영상을 각자 열고 디코딩하지 않도록,
+영상을 한 번만 디코딩해 30fps 정규화 프레임과 16kHz 모노 PCM 오디오를 공유한다.
+작업 계획(JobPlan)이 주어지면 디코딩 해상도 / 구간 / 오디오 길이를 계획대로 제한한다.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+import cv2
+import numpy as np
+
+from ddp_backend.core.tracing import span
+from ddp_backend.schemas.plan import JobPlan, MediaInfo
+
+__all__ = ["MediaContext", "normalize_fps", "probe_media"]
+
+TARGET_FPS = 30
+AUDIO_SAMPLE_RATE = 16000
+# 전체 프레임을 메모리에 올리는 dense 디코딩(rPPG)의 긴 변 상한
+# (rPPG는 얼굴을 72px로 줄여 쓰므로 원본 해상도가 필요 없음)
+DENSE_MAX_SIDE = 640
+
+
+def probe_media(vid_path: str | Path) -> MediaInfo:
+    """ffprobe로 길이 / 해상도 / fps / 코덱 조회. ffprobe가 없거나 실패하면 OpenCV 메타데이터 사용."""
+    try:
+        proc = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries",
+                "format=duration:stream=codec_type,codec_name,width,height,avg_frame_rate,duration",
+                "-of", "json",
+                str(vid_path),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if proc.returncode == 0:
+            return _parse_ffprobe(json.loads(proc.stdout))
+    except (OSError, subprocess.TimeoutExpired, ValueError, KeyError, StopIteration):
+        pass
+
+    cap = cv2.VideoCapture(str(vid_path))
+    try:
+        if not cap.isOpened():
+            raise FileNotFoundError(f"File {vid_path} not found.")
+        fps = cap.get(cv2.CAP_PROP_FPS) or float(TARGET_FPS)
+        frames = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+        return MediaInfo(
+            duration_s=frames / fps if frames > 0 else 0.0,
+            width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            fps=fps,
+        )
+    finally:
+        cap.release()
+
+
+def _parse_ffprobe(info: dict[str, Any]) -> MediaInfo:
+    streams: list[dict[str, Any]] = info.get("streams", [])
+    video = next(s for s in streams if s.get("codec_type") == "video")
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    num, _, den = str(video.get("avg_frame_rate", "0/1")).partition("/")
+    fps = float(num) / float(den or 1) if float(den or 1) else 0.0
+    duration = info.get("format", {}).get("duration") or video.get("duration") or 0.0
+    return MediaInfo(
+        duration_s=float(duration),
+        width=int(video["width"]),
+        height=int(video["height"]),
+        fps=fps or float(TARGET_FPS),
+        video_codec=video.get("codec_name"),
+        audio_codec=audio.get("codec_name") if audio is not None else None,
+    )
+
+
+def normalize_fps(
+    vid_src: str | Path,
+    vid_dest: str | Path,
+    target_fps: int = TARGET_FPS,
+    span_s: tuple[float, float] | None = None,
+    max_side: int | None = None,
+):
+    """
+    ffmpeg fps 필터로 영상 FPS를 target_fps로 맞춘 파일을 vid_dest에 생성.
+    span_s: 잘라낼 구간 (시작초, 끝초) / max_side: 긴 변 상한 (넘으면 비율 유지 축소)
+    """
+    cap = cv2.VideoCapture(str(vid_src))
+    try:
+        if not cap.isOpened():
+            raise FileNotFoundError(f"File {vid_src} not found.")
+        current_fps = cap.get(cv2.CAP_PROP_FPS)
+        long_side = max(cap.get(cv2.CAP_PROP_FRAME_WIDTH), cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    finally:
+        cap.release()
+
+    downscale = max_side is not None and long_side > max_side
+    # 현재 FPS와 타겟 FPS가 같고 자르거나 줄일 필요가 없다면 단순히 복사
+    if int(current_fps) == target_fps and span_s is None and not downscale:
+        shutil.copy(vid_src, vid_dest)
+        return
+
+    # -filter:v fps=fps=30: 프레임 드랍/복제 방식으로 FPS 조정
+    # -c:a copy: 오디오는 재인코딩 없이 그대로 복사
+    filters = [f"fps=fps={target_fps}"]
+    if downscale:
+        filters.append(f"scale='if(gt(iw,ih),{max_side},-2)':'if(gt(iw,ih),-2,{max_side})'")
+    trim: list[str] = []
+    if span_s is not None:
+        trim = ["-ss", f"{span_s[0]:.3f}", "-t", f"{span_s[1] - span_s[0]:.3f}"]
+    cmd = [
+        "ffmpeg",
+        "-y",
+        *trim,
+        "-i",
+        str(vid_src),
+        "-filter:v",
+        ",".join(filters),
+        "-c:a",
+        "copy",
+        str(vid_dest),
+    ]
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        error_msg = result.stderr.strip()
+        raise RuntimeError(
+            f"FFMPEG failed with returncode {result.returncode}: {error_msg}"
+        )
+
+
+class MediaContext:
+    """
+    작업 단위 디코딩 결과 저장소.
+
+    ```python
+    with MediaContext(path) as media:
+        wavelet_detector.analyze(path, media)
+        r_ppg_detector.analyze(path, media)
+        stt_detector.analyze(path, media)
+    ```
+
+    - frames: target_fps로 리샘플링된 RGB 프레임 (dense 소비자(rPPG)용, 최초 접근 시 1회 디코딩,
+      긴 변 DENSE_MAX_SIDE 이하로 축소)
+    - sample(n): 필요한 n개 프레임만 seek해서 읽음 (전체 디코딩 없음)
+    - audio: 16kHz mono float32 PCM (지연 수행, 오디오 스트림만 demux하므로 비디오 디코딩과 중복 없음)
+    - resampled_path(): 파일 경로가 필요한 탐지기(UNITE)를 위한 fps 정규화 파일
+
+    plan이 주어지면
+    - frames는 plan.rppg_span_s 구간만 디코딩 (sample()은 구간과 무관하게 전체 길이에서 추출)
+    - 모든 프레임은 긴 변이 plan.decode_max_side 이하가 되도록 축소
+    - audio는 앞에서부터 plan.stt_window_s초만 디코딩
+    - resampled_path()는 plan.unite_span_s 구간만 잘라 생성
+    """
+
+    def __init__(
+        self, vid_path: str | Path, target_fps: int = TARGET_FPS, plan: JobPlan | None = None
+    ):
+        self.path = Path(vid_path)
+        self.target_fps = target_fps
+        self.plan = plan
+        self.source_fps: float = 0.0
+        self._duration_s: float | None = None
+        self._frames: list[np.ndarray] | None = None
+        self._audio: np.ndarray | None = None
+        self._resampled_path: Path | None = None
+        self._frames_lock = threading.Lock()
+        self._audio_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+    def release(self):
+        """디코딩 결과를 해제하고 생성한 임시 파일을 삭제."""
+        self._frames = None
+        self._audio = None
+        if self._resampled_path is not None:
+            self._resampled_path.unlink(missing_ok=True)
+            self._resampled_path = None
+
+    # ──────────────────────────────────────────────────────────
+    # 비디오
+    # ──────────────────────────────────────────────────────────
+    @property
+    def fps(self) -> float:
+        return float(self.target_fps)
+
+    @property
+    def frames(self) -> list[np.ndarray]:
+        """target_fps로 정규화된 전체 RGB 프레임 (읽기 전용으로 취급할 것)."""
+        if self._frames is None:
+            with self._frames_lock:
+                if self._frames is None:
+                    with span("frame_decode"):
+                        self._frames = self._decode_frames()
+        return self._frames
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.frames)
+
+    def frame(self, idx: int) -> np.ndarray:
+        return self.frames[idx]
+
+    @property
+    def duration_s(self) -> float:
+        """영상 길이(초). plan의 probe 결과가 없으면 컨테이너 메타데이터로 계산."""
+        if self.plan is not None:
+            return self.plan.media.duration_s
+        if self._duration_s is None:
+            cap = cv2.VideoCapture(str(self.path))
+            try:
+                if not cap.isOpened():
+                    raise FileNotFoundError(f"File {self.path} not found.")
+                fps = cap.get(cv2.CAP_PROP_FPS) or float(self.target_fps)
+                self._duration_s = max(cap.get(cv2.CAP_PROP_FRAME_COUNT), 0.0) / fps
+            finally:
+                cap.release()
+        return self._duration_s
+
+    def sample(self, n: int) -> tuple[list[int], list[np.ndarray]]:
+        """
+        전체 구간에서 균등 간격으로 n개 프레임 (target_fps 기준 인덱스, 프레임) 반환.
+        요청한 프레임만 seek해서 읽으므로 전체 영상을 디코딩하지 않는다.
+        """
+        with span("frame_seek"):
+            return self._seek_frames(n)
+
+    def _fit(self, frame: np.ndarray, max_side: int | None = None) -> np.ndarray:
+        """BGR 프레임 → (긴 변 max_side 이하로 축소한) RGB 프레임. 기본값은 plan.decode_max_side."""
+        if max_side is None and self.plan is not None:
+            max_side = self.plan.decode_max_side
+        h, w = frame.shape[:2]
+        if max_side is not None and max(h, w) > max_side:
+            scale = max_side / max(h, w)
+            frame = cv2.resize(frame, (round(w * scale), round(h * scale)), interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    def _seek_frames(self, n: int) -> tuple[list[int], list[np.ndarray]]:
+        total = int(self.duration_s * self.target_fps)
+        if total <= 0:
+            return [], []
+        wanted: list[int] = np.linspace(0, total - 1, min(n, total), dtype=int).tolist()
+        cap = cv2.VideoCapture(str(self.path))
+        if not cap.isOpened():
+            raise FileNotFoundError(f"File {self.path} not found.")
+        indices: list[int] = []
+        frames: list[np.ndarray] = []
+        try:
+            for idx in wanted:
+                cap.set(cv2.CAP_PROP_POS_MSEC, idx * 1000.0 / self.target_fps)
+                ret, frame = cap.read()
+                if not ret:
+                    continue
+                indices.append(idx)
+                frames.append(self._fit(frame))
+        finally:
+            cap.release()
+        return indices, frames
+
+    def _decode_frames(self) -> list[np.ndarray]:
+        cap = cv2.VideoCapture(str(self.path))
+        if not cap.isOpened():
+            raise FileNotFoundError(f"File {self.path} not found.")
+
+        span_s = self.plan.rppg_span_s if self.plan is not None else None
+        # dense 디코딩은 메모리를 프레임 수만큼 쓰므로 plan보다 작게 축소
+        max_side = DENSE_MAX_SIDE
+        if self.plan is not None and self.plan.decode_max_side is not None:
+            max_side = min(max_side, self.plan.decode_max_side)
+        frames: list[np.ndarray] = []
+        try:
+            self.source_fps = cap.get(cv2.CAP_PROP_FPS) or float(self.target_fps)
+            end_ms = float("inf")
+            if span_s is not None:
+                cap.set(cv2.CAP_PROP_POS_MSEC, span_s[0] * 1000.0)
+                end_ms = span_s[1] * 1000.0
+            # ffmpeg fps 필터와 동일하게 프레임 드랍/복제로 리샘플링
+            # 출력 프레임 j는 원본 프레임 round(j * src_fps / target_fps)에 대응
+            passthrough = int(self.source_fps) == self.target_fps
+            ratio = self.source_fps / self.target_fps
+            src_idx = 0
+            out_idx = 0
+            while True:
+                if cap.get(cv2.CAP_PROP_POS_MSEC) >= end_ms:
+                    break
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                if passthrough:
+                    frames.append(self._fit(frame, max_side))
+                else:
+                    rgb: np.ndarray | None = None
+                    while round(out_idx * ratio) == src_idx:
+                        if rgb is None:
+                            rgb = self._fit(frame, max_side)
+                        frames.append(rgb)
+                        out_idx += 1
+                src_idx += 1
+        finally:
+            cap.release()
+        return frames
+
+    def resampled_path(self) -> Path:
+        """fps 정규화 파일 경로 (최초 호출 시 1회 생성)."""
+        if self._resampled_path is None:
+            with self._file_lock:
+                if self._resampled_path is None:
+                    dest = self.path.with_stem(f"resize_{self.path.stem}")
+                    with span("fps_normalize"):
+                        normalize_fps(
+                            self.path,
+                            dest,
+                            self.target_fps,
+                            span_s=self.plan.unite_span_s if self.plan is not None else None,
+                            max_side=self.plan.decode_max_side if self.plan is not None else None,
+                        )
+                    self._resampled_path = dest
+        return self._resampled_path
+
+    # ──────────────────────────────────────────────────────────
+    # 오디오
+    # ──────────────────────────────────────────────────────────
+    @property
+    def audio(self) -> np.ndarray:
+        """16kHz mono float32 PCM ([-1, 1])."""
+        if self._audio is None:
+            with self._audio_lock:
+                if self._audio is None:
+                    with span("audio_decode"):
+                        self._audio = self._decode_audio()
+        return self._audio
+
+    def _decode_audio(self) -> np.ndarray:
+        window = self.plan.stt_window_s if self.plan is not None else None
+        proc = subprocess.run(
+            [
+                "ffmpeg", "-nostdin", "-i", str(self.path),
+                *(["-t", f"{window:.3f}"] if window is not None else []),
+                "-vn",
+                "-f", "s16le",
+                "-acodec", "pcm_s16le",
+                "-ar", str(AUDIO_SAMPLE_RATE),
+                "-ac", "1",
+                "-",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
-import shutil
-import subprocess
+import gc
 from abc import abstractmethod
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Sequence
 from contextlib import contextmanager
 from io import BytesIO
 from pathlib import Path
+from typing import Any, ClassVar
 
 import cv2
 import torch
 from pydantic import BaseModel
 
 from ddp_backend.core.s3 import upload_file_to_s3
-from ddp_backend.detectors import VisualDetector
+from ddp_backend.core.tracing import span
+from ddp_backend.detectors import MediaContext, VisualDetector
+from ddp_backend.detectors.batching import MicroBatcher
+from ddp_backend.detectors.media import normalize_fps
 from ddp_backend.schemas.config import BaseVideoConfig
 from ddp_backend.schemas.enums import Status
 from ddp_backend.schemas.report import VideoReport, VisualContent
@@ -29,11 +32,46 @@ class BaseVideoDetector[C: BaseVideoConfig, ContentType: BaseModel](VisualDetect
     BaseVideoDetector[C: BaseVideoConfig] for Config.
     """
 
+    # unload_model()에서 해제할 모델 속성
+    _model_attrs: ClassVar[tuple[str, ...]] = ("model",)
+
     def __init__(self, config: C):
         self.config = config
         self.device: torch.device = torch.device(
             "cuda" if torch.cuda.is_available() else "cpu"
         )
+        self._batcher: MicroBatcher[Any, Any] | None = None
+
+    def _start_batcher(
+        self,
+        run_batch: Callable[[list[Any]], Sequence[Any]],
+        max_batch_size: int | None = None,
+    ):
+        """
+        load_model()에서 호출. 동시 작업들의 추론 요청을 모아 run_batch로 실행하는 모델 전용 스레드.
+        max_batch_size 기본값은 config.batch_max_size.
+        """
+        self._stop_batcher()
+        self._batcher = MicroBatcher(
+            self.model_name,
+            run_batch,
+            max_batch_size=self.config.batch_max_size if max_batch_size is None else max_batch_size,
+            max_wait_ms=self.config.batch_max_wait_ms,
+        )
+
+    def _stop_batcher(self):
+        if self._batcher is not None:
+            self._batcher.close()
+            self._batcher = None
+
+    @property
+    def batcher(self) -> MicroBatcher[Any, Any]:
+        if self._batcher is None:
+            raise RuntimeError(f"{self.model_name} model is not loaded.")
+        return self._batcher
+
+    def batch_stats(self) -> dict[str, float | int] | None:
+        return self._batcher.stats.snapshot() if self._batcher is not None else None
 
     @contextmanager
     def _load_video(
@@ -49,68 +87,43 @@ class BaseVideoDetector[C: BaseVideoConfig, ContentType: BaseModel](VisualDetect
             if cap is not None:
                 cap.release()
 
-    def set_fps(self, vid_src: str | Path, vid_dest: str | Path, target_fps: int = 30):
-        # 1. 현재 FPS 확인 (OpenCV 활용)
-        with self._load_video(vid_src) as cap:
-            current_fps = cap.get(cv2.CAP_PROP_FPS)
-
-        # 현재 FPS와 타겟 FPS가 같다면 처리를 스킵하거나 단순히 복사할 수 있습니다.
-        if int(current_fps) == target_fps:
-            shutil.copy(vid_src, vid_dest)
-            # shutil.copy(vid_src, vid_dest) 등 추가 가능
-            return
-
-        # 2. FFMPEG 명령어 구성
-        # -y: 출력 파일 덮어쓰기 허용
-        # -i: 입력 파일
-        # -filter:v fps=fps=30: 비디오 필터를 사용하여 FPS 조정 (프레임 드랍/복제 방식)
-        # -c:a copy: 오디오는 재인코딩 없이 그대로 복사 (속도 향상 및 품질 유지)
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-i",
-            str(vid_src),
-            "-filter:v",
-            f"fps=fps={target_fps}",
-            "-c:a",
-            "copy",
-            str(vid_dest),
-        ]
-
-        # 3. 동기 서브프로세스 실행
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,  # 이 설정을 통해 stderr를 바이트가 아닌 문자열로 바로 받습니다.
-        )
+    def unload_model(self):
+        """load_model()로 올린 모델을 해제 (다시 쓰려면 load_model() 재호출)."""
+        self._stop_batcher()
+        for attr in self._model_attrs:
+            if hasattr(self, attr):
+                setattr(self, attr, None)
+        _ = gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
-        # 실행 완료 후 리턴코드 확인
-        if result.returncode != 0:
-            error_msg = result.stderr.strip()
-            raise RuntimeError(
-                f"FFMPEG failed with returncode {result.returncode}: {error_msg}"
-            )
+    def set_fps(self, vid_src: str | Path, vid_dest: str | Path, target_fps: int = 30):
+        normalize_fps(vid_src, vid_dest, target_fps)
 
     @abstractmethod
-    def _analyze(self, vid_path: str | Path) -> ContentType:
+    def _analyze(self, media: MediaContext) -> ContentType:
         pass
 
-    def analyze(self, vid_path: str | Path) -> VideoReport[ContentType]:
+    def analyze(
+        self, vid_path: str | Path, media: MediaContext | None = None
+    ) -> VideoReport[ContentType]:
         vid_path = Path(vid_path)
-        resized_path = vid_path.with_stem(f"resize_{vid_path.stem}")
-        self.set_fps(vid_path, resized_path)
-
-        analyze_res = self._analyze(resized_path)
+        if media is None:
+            # 단독 호출 시에는 이 탐지기 전용 컨텍스트를 만들고 끝나면 해제
+            with MediaContext(vid_path) as own_media:
+                analyze_res = self._analyze(own_media)
+        else:
+            analyze_res = self._analyze(media)
 
         s3_key: str | None = None
         if isinstance(analyze_res, VisualContent):
             if analyze_res.image is not None:
                 upload_key = f"report/{vid_path.stem}_{self.model_name}_analyzed.png"
 
-                s3_key = upload_file_to_s3(
-                    BytesIO(analyze_res.image), upload_key, "image/png"
-                )
+                with span("s3_upload"):
+                    s3_key = upload_file_to_s3(
+                        BytesIO(analyze_res.image), upload_key, "image/png"
+                    )
                 analyze_res.visual_report = s3_key
 
         return VideoReport(
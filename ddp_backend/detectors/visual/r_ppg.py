@@ -11,6 +11,9 @@ import numpy as np
 import torch
 from scipy.signal import welch
 
+from ddp_backend.core.tracing import span
+from ddp_backend.detectors import MediaContext
+
 # 스키마
 from ddp_backend.schemas.config import RPPGConfig
 
@@ -38,6 +41,7 @@ class FeatDict(TypedDict):
 
 class RPPGDetector(BaseVideoDetector[RPPGConfig, VisualContent]):
     model_name = ModelName.R_PPG
+    _model_attrs = ("model", "preprocessor")
 
     @override
     def load_model(self):
@@ -72,9 +76,23 @@ class RPPGDetector(BaseVideoDetector[RPPGConfig, VisualContent]):
             model_type=ModelType.EFFICIENTPHYS,
             img_size=self.config.img_size,
         )
+        # EfficientPhys는 프레임 축이 배치 dim이고 내부에서 프레임 간 diff를 하므로
+        # 여러 윈도우를 쌓을 수 없음 → 마이크로 배처를 거치지 않고 작업 스레드에서 바로 추론
+        # (배치 크기 1 배처는 작업 간 호출을 직렬화할 뿐이라 동시 작업 처리량만 떨어짐)
 
         print(f"[{self.__class__.__name__}] Load Complete.")
 
+    def _infer_window(self, x: torch.Tensor) -> torch.Tensor:
+        """(T, C, H, W) 윈도우 → rPPG 출력 (CPU)."""
+        if self.model is None:
+            raise RuntimeError
+        out: tuple[torch.Tensor] | list[torch.Tensor] | torch.Tensor = self.model(
+            x.to(self.device)
+        )
+        if isinstance(out, (tuple, list)):
+            out = out[0]
+        return out.detach().cpu()
+
     def _extract_rppg_features(
         self, tensors: list[torch.Tensor]
     ) -> tuple[list[np.ndarray], list[FeatDict]]:
@@ -85,7 +103,6 @@ class RPPGDetector(BaseVideoDetector[RPPGConfig, VisualContent]):
         with torch.no_grad():
             for tensor in tensors:
                 # tensor: (C, T, H, W)
-                tensor = tensor.to(self.device)
                 C, T, H, W = tensor.shape
 
                 # EfficientPhys 내부 diff로 T-1이 되므로, (T-1)이 n_segment(10) 배수가 되게 T를 패딩
@@ -101,15 +118,8 @@ class RPPGDetector(BaseVideoDetector[RPPGConfig, VisualContent]):
                 # EfficientPhys는 (T, C, H, W) 입력을 기대 — 프레임이 배치 dim
                 x = tensor.permute(1, 0, 2, 3)  # (C, T, H, W) → (T, C, H, W)
 
-                if self.model is None:
-                    raise RuntimeError
-                out: tuple[torch.Tensor] | list[torch.Tensor] | torch.Tensor = (
-                    self.model(x)
-                )
-                if isinstance(out, (tuple, list)):
-                    out = out[0]
-
-                rppg = out.squeeze().detach().cpu().numpy()
+                out = self._infer_window(x)
+                rppg = out.squeeze().numpy()
 
                 # 원래 길이 기준으로 자르기 (내부 diff 때문에 -1)
                 orig_len = max(1, min(rppg.shape[0], (tensor.shape[1] - 1)))
@@ -219,16 +229,16 @@ class RPPGDetector(BaseVideoDetector[RPPGConfig, VisualContent]):
         return buf.getvalue()
 
     @override
-    def _analyze(self, vid_path: str | Path) -> VisualContent:
+    def _analyze(self, media: MediaContext) -> VisualContent:
         if self.model is None:
             raise RuntimeError("EfficientPhys model is not loaded.")
 
-        print(f"Starting analyze (rPPG Signal Extraction) for {vid_path}...")
+        print(f"Starting analyze (rPPG Signal Extraction) for {media.path}...")
 
+        frames = media.frames
         try:
-            prep_result: PreprocessResult = self.preprocessor.process_video(
-                str(vid_path)
-            )
+            with span("r_ppg.face_detect"):
+                prep_result: PreprocessResult = self.preprocessor.process_frames(frames)
         except Exception as e:
             warnings.warn(f"[RPPGDetector] Preprocessing failed: {e}")
             raise RuntimeError(f"Preprocessing failed: {str(e)}")
@@ -237,11 +247,13 @@ class RPPGDetector(BaseVideoDetector[RPPGConfig, VisualContent]):
             raise RuntimeError("No valid face windows extracted.")
 
         # rPPG 추출 및 시각화용 데이터 획득
-        signals, feat_dicts = self._extract_rppg_features(prep_result.tensors)
+        with span("r_ppg.forward"):
+            signals, feat_dicts = self._extract_rppg_features(prep_result.tensors)
 
         # 3포인트 시각화 (최고/최저 SNR 얼굴 + 전체 Frequency 그래프)
-        visual_report = self.generate_visual_report(
-            prep_result.tensors, signals, feat_dicts
-        )
+        with span("r_ppg.report_render"):
+            visual_report = self.generate_visual_report(
+                prep_result.tensors, signals, feat_dicts
+            )
 
         return VisualContent(image=visual_report)
@@ -164,7 +164,13 @@ class RPPGPreprocessing:
     # 5. 전체 파이프라인
     # =========
     def process_video(self, video_path: str) -> PreprocessResult:
-        frames = self._extract_frames(video_path)
+        return self.process_frames(self._extract_frames(video_path))
+
+    def process_frames(self, frames: List[np.ndarray]) -> PreprocessResult:
+        """이미 디코딩된 30fps RGB 프레임(MediaContext.frames)으로 전처리."""
+        if len(frames) < self.min_frames:
+            raise ValueError(f"프레임 수가 부족합니다. 최소 {self.min_frames}프레임 필요 (현재: {len(frames)})")
+
         tensors: List[torch.Tensor] = []
         first_bbox_vis: MatLike | None = None
         last_bbox_vis: MatLike | None = None
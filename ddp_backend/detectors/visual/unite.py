@@ -1,5 +1,5 @@
 from collections.abc import Sequence
-from pathlib import Path
+from concurrent.futures import Future
 from typing import cast, final, override
 
 import numpy as np
@@ -9,6 +9,8 @@ from torch.utils.data import DataLoader
 from unite_detection.dataset import CustomVideoDataset
 from unite_detection.schemas import ArchSchema, DatasetConfig
 
+from ddp_backend.core.tracing import span
+from ddp_backend.detectors import MediaContext
 from ddp_backend.schemas.enums import ModelName
 from ddp_backend.schemas.report import ProbabilityContent
 
@@ -18,6 +20,7 @@ from .base import BaseVideoConfig, BaseVideoDetector
 @final
 class UniteDetector(BaseVideoDetector[BaseVideoConfig, ProbabilityContent]):
     model_name = ModelName.UNITE
+    _model_attrs = ("session",)
 
     @override
     def load_model(self):
@@ -59,28 +62,45 @@ class UniteDetector(BaseVideoDetector[BaseVideoConfig, ProbabilityContent]):
         )
         self.input_name: str = self.session.get_inputs()[0].name  # type: ignore
         self.output_name: str = self.session.get_outputs()[0].name  # type: ignore
-        print(f"[UNITE] input shape: {self.session.get_inputs()[0].shape}, providers: {self.session.get_providers()}")
+        input_shape = self.session.get_inputs()[0].shape  # type: ignore
+        print(f"[UNITE] input shape: {input_shape}, providers: {self.session.get_providers()}")
+
+        # 배치 dim이 고정(int)으로 export된 모델은 클립을 쌓을 수 없으므로 1개씩 실행
+        dynamic_batch = not isinstance(input_shape[0], int)
+        self._start_batcher(
+            self._infer_batch, max_batch_size=None if dynamic_batch else 1
+        )
 
     @staticmethod
     def softmax(x: np.ndarray) -> np.ndarray:
-        e_x = np.exp(x - np.max(x))
-        return e_x / e_x.sum()
+        """행(클립)별 softmax."""
+        e_x = np.exp(x - np.max(x, axis=-1, keepdims=True))
+        return e_x / e_x.sum(axis=-1, keepdims=True)
+
+    def _infer_batch(self, clips: list[np.ndarray]) -> list[float]:
+        """배처 스레드에서 실행: 여러 작업의 클립 → 클립별 fake prob."""
+        output = self.session.run([self.output_name], {self.input_name: np.stack(clips)})  # type: ignore
+        output = cast(Sequence[np.ndarray], output)
+        return self.softmax(output[0])[:, 1].tolist()
 
     @override
-    def _analyze(self, vid_path: str | Path) -> ProbabilityContent:
+    def _analyze(self, media: MediaContext) -> ProbabilityContent:
+        # CustomVideoDataset은 파일 경로를 요구하므로 fps 정규화 파일 사용
         vid_dataset = CustomVideoDataset(
-            [vid_path],
+            [media.resampled_path()],
             config=DatasetConfig(arch=ArchSchema(img_size=self.config.img_size)),
         )
         loader = DataLoader(vid_dataset, batch_size=1, num_workers=0)
-        result_prob: list[float] = []
-        for batch in loader:
-            x, _ = cast(tuple[Tensor, Tensor], batch)
-            input_np: np.ndarray = x.detach().cpu().numpy()
-            output = self.session.run([self.output_name], {self.input_name: input_np})  # type: ignore
-            output = cast(Sequence[np.ndarray], output)
-            cur_prob: float = self.softmax(output[0])[0][1].item()
-            result_prob.append(cur_prob)
+        # 클립을 디코딩하는 대로 배처에 제출 → 다른 작업의 클립과 함께 배치 추론
+        futures: list[Future[float]] = []
+        with span("unite.clip_decode"):
+            for batch in loader:
+                x, _ = cast(tuple[Tensor, Tensor], batch)
+                input_np: np.ndarray = x.detach().cpu().numpy()
+                futures.extend(self.batcher.submit_many(list(input_np)))
+        # 디코딩 중에도 배처가 추론을 진행하므로 여기서는 마지막 제출 이후 남은 대기 시간만 측정됨
+        with span("unite.forward"):
+            result_prob: list[float] = [f.result() for f in futures]
         max_prob = max(result_prob)
 
         # softmax[0][1]은 FAKE 클래스 확률 → ProbabilityContent는 REAL 확률 기대
@@ -23,6 +23,8 @@ from wavelet_lib.detectors.base_detector import (  # type: ignore
     PredDict,
 )
 
+from ddp_backend.core.tracing import span
+from ddp_backend.detectors import MediaContext
 from ddp_backend.schemas.config import WaveletConfig as WaveletConfigParam
 from ddp_backend.schemas.enums import ModelName
 from ddp_backend.schemas.report import ProbVisualContent
@@ -44,6 +46,7 @@ _N_REP_FRAMES     = 4     # 대표 프레임 수 (visualization)
 
 class WaveletDetector(BaseVideoDetector[WaveletConfigParam, ProbVisualContent]):
     model_name = ModelName.WAVELET
+    _model_attrs = ("model", "face_app")
 
     @classmethod
     def from_yaml(
@@ -52,6 +55,8 @@ class WaveletDetector(BaseVideoDetector[WaveletConfigParam, ProbVisualContent]):
         img_size: int,
         ckpt_path: str | Path,
         threshold: float = 0.5,
+        batch_max_size: int = 32,
+        batch_max_wait_ms: float = 5.0,
     ) -> Self:
         with open(yaml_path, "r") as f:
             raw_data = yaml.safe_load(f)
@@ -65,6 +70,8 @@ class WaveletDetector(BaseVideoDetector[WaveletConfigParam, ProbVisualContent]):
             threshold=threshold,
             model_name=model_config["model_name"],
             loss_func=model_config["loss_func"],
+            batch_max_size=batch_max_size,
+            batch_max_wait_ms=batch_max_wait_ms,
         )
         return cls(new_config)
 
@@ -109,6 +116,7 @@ class WaveletDetector(BaseVideoDetector[WaveletConfigParam, ProbVisualContent]):
         )
         self.face_app.prepare(ctx_id=0, det_size=(640, 640))  # type: ignore
 
+        self._start_batcher(self._infer_batch)
         print("Load Complete.")
 
     # ──────────────────────────────────────────────────────────
@@ -172,6 +180,18 @@ class WaveletDetector(BaseVideoDetector[WaveletConfigParam, ProbVisualContent]):
             prob = torch.softmax(pred["cls"] / _TEMPERATURE, dim=1)[:, 1].item()
         return float(prob)
 
+    def _infer_batch(self, tensors: list[torch.Tensor]) -> list[float]:
+        """배처 스레드에서 실행: 여러 작업의 전처리된 view (C, H, W) → fake prob 리스트."""
+        batch = torch.stack(tensors).to(self.device)
+        data_dict = {
+            "image": batch,
+            "label": torch.zeros(batch.shape[0]).long().to(self.device),
+        }
+        with torch.no_grad():
+            pred: PredDict = self.model(data_dict, inference=False)
+            probs = torch.softmax(pred["cls"] / _TEMPERATURE, dim=1)[:, 1]
+        return probs.cpu().tolist()
+
     # ──────────────────────────────────────────────────────────
     # [F] 대표 프레임 선택 (inference_result.py: select_representative_frames)
     # ──────────────────────────────────────────────────────────
@@ -319,7 +339,7 @@ class WaveletDetector(BaseVideoDetector[WaveletConfigParam, ProbVisualContent]):
     # 메인 추론 (inference_result.py 개선사항 통합)
     # ──────────────────────────────────────────────────────────
     @override
-    def _analyze(self, vid_path: str | Path) -> ProbVisualContent:
+    def _analyze(self, media: MediaContext) -> ProbVisualContent:
         if not hasattr(self, "model") or self.model is None:
             raise RuntimeError("Wavelet model is not loaded (checkpoint not found).")
 
@@ -332,23 +352,14 @@ class WaveletDetector(BaseVideoDetector[WaveletConfigParam, ProbVisualContent]):
             ]
         )
 
-        # ── Step 1: [H] 균등 간격 프레임 샘플링 (fps + 인덱스 추적) ──────────────
+        # ── Step 1: [H] 균등 간격 프레임 샘플링 (공유 디코딩 결과에서 인덱스 추적) ──
         print("Starting analyze (wavelet)...")
-        raw_frames: list[MatLike] = []
-        raw_frame_indices: list[int] = []
-        fps: float = 30.0
-        with self._load_video(vid_path) as cap:
-            total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
-            n_sample = min(_MAX_FRAMES, max(total, 1))
-            indices = np.linspace(0, total - 1, n_sample, dtype=int)
-
-            for idx in indices:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, int(idx))
-                ret, frame = cap.read()
-                if ret:
-                    raw_frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                    raw_frame_indices.append(int(idx))
+        # 작업 계획이 있으면 비용 모델이 고른 프레임 수 사용 (긴 영상은 seek 샘플링)
+        max_frames = _MAX_FRAMES
+        if media.plan is not None and media.plan.wavelet_frames is not None:
+            max_frames = media.plan.wavelet_frames
+        raw_frame_indices, raw_frames = media.sample(max_frames)
+        fps: float = media.fps
 
         if not raw_frames:
             raise RuntimeError
@@ -356,23 +367,24 @@ class WaveletDetector(BaseVideoDetector[WaveletConfigParam, ProbVisualContent]):
         # ── Step 2: [G] 프레임 품질 필터링 (인덱스 함께 유지) ──────────────────
         valid_frames: list[MatLike] = []
         valid_frame_indices: list[int] = []
-        for rgb, fidx in zip(raw_frames, raw_frame_indices):
-            # 블러 검사
-            gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
-            if cv2.Laplacian(gray, cv2.CV_64F).var() < _BLUR_THRESHOLD:
-                continue
-            # 얼굴 신뢰도 검사
-            faces: list[Face] = self.face_app.get(rgb)  # type: ignore
-            if not faces:
-                continue
-            best = max(
-                faces,
-                key=lambda f: (f.bbox[2] - f.bbox[0]) * (f.bbox[3] - f.bbox[1]),  # type: ignore
-            )
-            if best.det_score < _FACE_SCORE_THR:
-                continue
-            valid_frames.append(rgb)
-            valid_frame_indices.append(fidx)
+        with span("wavelet.face_detect"):
+            for rgb, fidx in zip(raw_frames, raw_frame_indices):
+                # 블러 검사
+                gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+                if cv2.Laplacian(gray, cv2.CV_64F).var() < _BLUR_THRESHOLD:
+                    continue
+                # 얼굴 신뢰도 검사
+                faces: list[Face] = self.face_app.get(rgb)  # type: ignore
+                if not faces:
+                    continue
+                best = max(
+                    faces,
+                    key=lambda f: (f.bbox[2] - f.bbox[0]) * (f.bbox[3] - f.bbox[1]),  # type: ignore
+                )
+                if best.det_score < _FACE_SCORE_THR:
+                    continue
+                valid_frames.append(rgb)
+                valid_frame_indices.append(fidx)
 
         if not valid_frames:
             valid_frames = raw_frames  # fallback: 필터링된 게 없으면 원본 사용
@@ -382,32 +394,37 @@ class WaveletDetector(BaseVideoDetector[WaveletConfigParam, ProbVisualContent]):
         timestamps: list[float] = [idx / fps for idx in valid_frame_indices]
 
         # ── Step 3: [B]+[C] 얼굴 정렬 + TTA 추론 ────────────
-        all_probs: list[float] = []
-        max_prob: float = -1.0
-        best_face_rgb: MatLike | None = None
-
-        for rgb in valid_frames:
-            # [B] 얼굴 정렬 / 크롭
-            face_rgb = self._get_aligned_face(rgb)
-
-            # [C] TTA view 구성: 원본 + flip + brightness ×1.1 / ×0.9
-            views: list[MatLike] = [face_rgb, cv2.flip(face_rgb, 1)]
-            if _TTA_ENABLED:
-                views.append(
-                    np.clip(face_rgb.astype(np.float32) * 1.1, 0, 255).astype(np.uint8)
-                )
-                views.append(
-                    np.clip(face_rgb.astype(np.float32) * 0.9, 0, 255).astype(np.uint8)
+        # 모든 프레임의 view를 한 번에 배처에 제출 → 다른 작업의 요청과 함께 배치 추론
+        frame_views: list[list[torch.Tensor]] = []
+
+        with span("wavelet.face_align"):
+            for rgb in valid_frames:
+                # [B] 얼굴 정렬 / 크롭
+                face_rgb = self._get_aligned_face(rgb)
+
+                # [C] TTA view 구성: 원본 + flip + brightness ×1.1 / ×0.9
+                views: list[MatLike] = [face_rgb, cv2.flip(face_rgb, 1)]
+                if _TTA_ENABLED:
+                    views.append(
+                        np.clip(face_rgb.astype(np.float32) * 1.1, 0, 255).astype(np.uint8)
+                    )
+                    views.append(
+                        np.clip(face_rgb.astype(np.float32) * 0.9, 0, 255).astype(np.uint8)
+                    )
+
+                frame_views.append(
+                    [
+                        cast(torch.Tensor, transform(cv2.resize(v, (img_size, img_size))))
+                        for v in views
+                    ]
                 )
 
+        with span("wavelet.forward"):
+            futures = [self.batcher.submit_many(views) for views in frame_views]
             # 각 view 추론 후 평균
-            frame_probs = [self._infer_single(v, transform, img_size) for v in views]
-            avg_p = float(np.mean(frame_probs))
-            all_probs.append(avg_p)
-
-            if avg_p > max_prob:
-                max_prob = avg_p
-                best_face_rgb = face_rgb
+            all_probs: list[float] = [
+                float(np.mean([f.result() for f in view_futures])) for view_futures in futures
+            ]
 
         if not all_probs:
             raise RuntimeError
@@ -426,14 +443,15 @@ class WaveletDetector(BaseVideoDetector[WaveletConfigParam, ProbVisualContent]):
         # ── 시각화 리포트 (프론트와 동일한 집계값 agg_prob 전달) ──
         visual_report = None
         if valid_frames and all_probs:
-            visual_report = self.generate_visual_report(
-                valid_frames,
-                all_probs,
-                timestamps,
-                transform,
-                img_size,
-                agg_prob=final_prob,  # 프론트에 반환하는 값과 동일한 수치 사용
-            )
+            with span("wavelet.report_render"):
+                visual_report = self.generate_visual_report(
+                    valid_frames,
+                    all_probs,
+                    timestamps,
+                    transform,
+                    img_size,
+                    agg_prob=final_prob,  # 프론트에 반환하는 값과 동일한 수치 사용
+                )
 
         # final_prob는 FAKE 확률 → ProbabilityContent는 REAL 확률을 기대하므로 변환
         return ProbVisualContent(probability=1.0 - final_prob, image=visual_report)
@@ -1,10 +1,14 @@
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 import asyncio
 import os
+import resource
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-import torch
 import uvicorn
 
 from ddp_backend.core.database import engine
@@ -19,18 +23,19 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pyngrok import ngrok  # type: ignore
 
+from ddp_backend.core.config import settings
+from ddp_backend.core.model import load_all_model
+from ddp_backend.core.prefetch import prefetcher
+from ddp_backend.core.queue_stats import queue_stats
+from ddp_backend.core.tracing import start_metrics_server
 from ddp_backend.core.redis_bridge import redis_connector
-from ddp_backend.core.tk_broker import broker
+from ddp_backend.core.tk_broker import all_brokers, is_worker_process, serving_modes
 from ddp_backend.routers import alert, auth, detection, user, video, websocket
+from ddp_backend.services.result_cache import result_cache
 
 _BACKEND_DIR = Path(__file__).parent
 load_dotenv(_BACKEND_DIR / ".env")
 
-try:
-    from ddp_backend.core.model import load_all_model
-except Exception:
-    load_all_model = None
-
 # ==========================================
 # DB 생성
 # ==========================================
@@ -52,28 +57,51 @@ def _is_video(filename: str) -> bool:
     return Path(filename).suffix.lower() in _VIDEO_EXTENSIONS
 
 
-DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-
 NGROK_AUTH_TOKEN = os.environ.get("NGROK_AUTH_TOKEN", "")
 
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+startup_info: dict[str, object] = {}
+
+
+def _record_startup(role: str, started: float, model_seconds: float | None):
+    """프로세스 역할별 기동 시간 / 최대 RSS 기록 (/health에 노출)"""
+    startup_info.update(
+        role=role,
+        import_seconds=round(_IMPORT_SECONDS, 3),
+        model_load_seconds=round(model_seconds, 3) if model_seconds is not None else None,
+        startup_seconds=round(_IMPORT_SECONDS + time.perf_counter() - started, 3),
+        # Linux ru_maxrss 단위는 KB
+        max_rss_mb=round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    )
+    print(f"[STARTUP] {startup_info}")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # pyright: ignore[reportUnusedParameter]
-    is_worker = broker.is_worker_process
+    started = time.perf_counter()
+    is_worker = is_worker_process()
     public_url = None
     task = None
-
-    # Load ML models in both server and worker processes
-    if load_all_model:
-        load_all_model()
-    else:
-        print("[STARTUP] load_all_model() skipped (not available)")
+    model_seconds = None
+
+    # 추론은 Taskiq 워커에서만 수행 → ML 모델은 워커 프로세스에서만 로드
+    # (API 서버는 torch / insightface / onnxruntime을 import 하지 않음)
+    if is_worker:
+        model_started = time.perf_counter()
+        # fast 워커는 fast 모델만, deep 워커는 UNITE(+auto용 wavelet)만 로드
+        load_all_model(serving_modes())
+        model_seconds = time.perf_counter() - model_started
+        # 추론 중에 다음 작업 영상을 미리 받아 둠
+        prefetcher.start(serving_modes())
+        start_metrics_server(settings.METRICS_PORT)
 
     if not is_worker:
         # ── FastAPI 서버 전용 초기화 (Taskiq 워커에서는 실행 안 함) ──
-        start_schedular()
+        # heartbeat가 끊긴 작업 재큐잉은 브로커가 묶인 이 이벤트 루프에서 enqueue
+        start_schedular(asyncio.get_running_loop())
 
-        await broker.startup()
+        for b in all_brokers:
+            await b.startup()
 
         loop = asyncio.get_event_loop()
         task = loop.create_task(redis_connector(app))
@@ -97,13 +125,19 @@ async def lifespan(app: FastAPI):  # pyright: ignore[reportUnusedParameter]
 
         print("🚀 FastAPI 서버를 시작합니다 (Port: 8000)...")
 
+    _record_startup("worker" if is_worker else "api", started, model_seconds)
+
     yield
 
+    if is_worker:
+        prefetcher.stop()
+
     if not is_worker:
         if task:
             task.cancel()
         shutdown_schedular()
-        await broker.shutdown()
+        for b in all_brokers:
+            await b.shutdown()
         if public_url:
             print("\n🛠️ ngrok 터널을 종료 중입니다...")
             ngrok.disconnect(public_url)
@@ -116,7 +150,12 @@ app = FastAPI(lifespan=lifespan)
 
 @app.get("/health")
 def health():
-    return {"ok": True}
+    return {
+        "ok": True,
+        "startup": startup_info,
+        "queues": queue_stats.snapshot(),
+        "result_cache": result_cache.stats(),
+    }
 
 
 # CORS 설정 - 프론트엔드(Expo) 접속 허용
@@ -126,6 +165,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # /prediction 수락 제어 헤더를 웹 클라이언트에서 읽을 수 있도록
+    expose_headers=["Retry-After", "X-Estimated-Start", "X-Estimated-Wait-Seconds"],
 )
 
 app.include_router(detection.router)
@@ -0,0 +1,7 @@
+-- 콘텐츠 해시 기반 결과 캐시 (sources.content_hash)
+-- create_all은 기존 테이블에 컬럼을 추가하지 않으므로, 배포 전에 기존 DB(PostgreSQL)에 1회 실행:
+--   psql "$DATABASE_URL" -f ddp_backend/migrations/029_sources_content_hash.sql
+-- 새 테이블(detection_cache)은 앱 기동 시 create_all로 생성된다.
+
+ALTER TABLE sources ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+CREATE INDEX IF NOT EXISTS ix_sources_content_hash ON sources (content_hash);
@@ -0,0 +1,5 @@
+-- 작업 구간별 소요 시간 (results.timings)
+-- 배포 전에 기존 DB(PostgreSQL)에 1회 실행:
+--   psql "$DATABASE_URL" -f ddp_backend/migrations/046_results_timings.sql
+
+ALTER TABLE results ADD COLUMN IF NOT EXISTS timings JSON;
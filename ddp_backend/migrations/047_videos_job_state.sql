@@ -0,0 +1,17 @@
+-- 재시도 / heartbeat용 작업 상태 (videos.analysis_mode / heartbeat_at / attempts)
+-- 배포 전에 기존 DB(PostgreSQL)에 1회 실행:
+--   psql "$DATABASE_URL" -f ddp_backend/migrations/047_videos_job_state.sql
+-- 새 테이블(stage_checkpoints)은 앱 기동 시 create_all로 생성된다.
+
+-- analyzemode enum은 detection_cache(029)와 함께 생성되지만, 없으면 여기서 생성
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'analyzemode') THEN
+        CREATE TYPE analyzemode AS ENUM ('fast', 'deep', 'auto');
+    END IF;
+END
+$$;
+
+ALTER TABLE videos ADD COLUMN IF NOT EXISTS analysis_mode analyzemode;
+ALTER TABLE videos ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE videos ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
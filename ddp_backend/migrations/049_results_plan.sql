@@ -0,0 +1,5 @@
+-- pre-flight probe + 샘플링 계획 (results.plan)
+-- 배포 전에 기존 DB(PostgreSQL)에 1회 실행:
+--   psql "$DATABASE_URL" -f ddp_backend/migrations/049_results_plan.sql
+
+ALTER TABLE results ADD COLUMN IF NOT EXISTS plan JSON;
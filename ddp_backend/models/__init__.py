@@ -6,18 +6,24 @@ from .models import (
 )
 
 from .alert import Alert
+from .cache import DetectionCache
+from .checkpoint import StageCheckpoint
 from .user import User
-from .report import DeepReport, FastReport
+from .report import AutoReport, DeepReport, FastReport, PartialReport
 
-for next_model in [DeepReport, FastReport, Result, Source, Token, Video, Alert, User]:
+for next_model in [AutoReport, DeepReport, FastReport, PartialReport, Result, Source, Token, Video, Alert, User]:
     next_model.model_rebuild()
 
 __all__ = [
     'Alert',
+    'AutoReport',
     'DeepReport',
+    'DetectionCache',
     'FastReport',
+    'PartialReport',
     'Result',
     'Source',
+    'StageCheckpoint',
     'Token',
     'User',
     'Video',
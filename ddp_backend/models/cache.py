@@ -0,0 +1,35 @@
+from typing import Any
+
+from sqlalchemy import Column, UniqueConstraint
+from sqlalchemy.types import JSON, BigInteger, Enum
+from sqlmodel import Field
+
+from ddp_backend.core.database import Base
+from ddp_backend.schemas.enums import AnalyzeMode
+from ddp_backend.schemas.enums import Result as ResultEnum
+
+from .models import CreatedTimestampMixin, enum_to_value
+
+
+# 9. DetectionCache table (동일 영상 재분석 방지: 콘텐츠 해시 + 모델 버전 → 리포트)
+class DetectionCache(CreatedTimestampMixin, Base, table=True):
+    __tablename__: str = "detection_cache"  # type: ignore
+    __table_args__ = (
+        UniqueConstraint("content_hash", "analysis_mode", "model_version"),
+    )
+    cache_id: int | None = Field(default=None, primary_key=True, sa_type=BigInteger)
+    content_hash: str = Field(max_length=64, index=True)  # sha256 hex
+    analysis_mode: AnalyzeMode = Field(
+        sa_column=Column(
+            Enum(AnalyzeMode, values_callable=enum_to_value), nullable=False
+        )
+    )
+    model_version: str = Field(max_length=64)
+    total_result: ResultEnum = Field(
+        sa_column=Column(
+            Enum(ResultEnum, values_callable=enum_to_value), nullable=False
+        )
+    )
+    # FastReportData / DeepReportData / AutoReportData의 model_dump(mode="json")
+    report: dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+    hit_count: int = Field(default=0)
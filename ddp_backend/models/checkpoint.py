@@ -0,0 +1,27 @@
+import uuid
+from typing import Any
+
+from sqlalchemy import Column, UniqueConstraint
+from sqlalchemy.types import JSON, BigInteger, Enum
+from sqlmodel import Field
+
+from ddp_backend.core.database import Base
+from ddp_backend.schemas.enums import ModelName
+
+from .models import CreatedTimestampMixin, enum_to_value
+
+
+# 10. StageCheckpoints table (재시도 시 완료된 탐지기 단계를 건너뛰기 위한 중간 결과, 최종 Result 생성 시 삭제)
+class StageCheckpoint(CreatedTimestampMixin, Base, table=True):
+    __tablename__: str = "stage_checkpoints"  # type: ignore
+    __table_args__ = (UniqueConstraint("video_id", "model_name"),)
+    checkpoint_id: int | None = Field(default=None, primary_key=True, sa_type=BigInteger)
+    video_id: uuid.UUID = Field(foreign_key="videos.video_id", ondelete="CASCADE")
+    model_name: ModelName = Field(
+        sa_column=Column(
+            Enum(ModelName, values_callable=enum_to_value), nullable=False
+        )
+    )
+    model_version: str = Field(max_length=64)
+    # 탐지기 리포트 원본 필드 (S3 key 그대로, presigned URL 변환 전)
+    report: dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Annotated, Optional # type: ignore
 
 from pydantic.types import AwareDatetime
 from sqlalchemy import (
+    JSON,
     BigInteger,
     Column,
     DateTime,
@@ -17,6 +18,7 @@ from sqlmodel import Field, Relationship
 from ddp_backend.core.config import settings
 from ddp_backend.core.database import Base
 from ddp_backend.schemas.enums import (
+    AnalyzeMode,
     OriginPath,
     VideoStatus,
 )
@@ -25,7 +27,7 @@ from ddp_backend.schemas.enums import Result as ResultEnum
 if TYPE_CHECKING:
     from .alert import Alert
     from .user import User
-    from .report import DeepReport, FastReport
+    from .report import AutoReport, DeepReport, FastReport
 
 MAX_S3_LEN = 512
 
@@ -73,6 +75,16 @@ class Video(CreatedTimestampMixin, Base, table=True):
         default=VideoStatus.PENDING,
         sa_column=Column(Enum(VideoStatus, values_callable=enum_to_value), nullable=False),
     )
+    # 분석 작업 상태 (reaper가 멈춘 PROCESSING 작업을 다시 큐에 넣을 때 사용)
+    analysis_mode: AnalyzeMode | None = Field(
+        default=None,
+        sa_column=Column(Enum(AnalyzeMode, values_callable=enum_to_value), nullable=True),
+    )
+    heartbeat_at: Annotated[datetime, AwareDatetime] | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
+    attempts: int = Field(default=0)
 
     user: "User" = Relationship(back_populates="videos")
     source: "Source" = Relationship(back_populates="video", cascade_delete=True)
@@ -85,6 +97,7 @@ class Source(CreatedTimestampMixin, Base, table=True):
     source_id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     video_id: uuid.UUID = Field(foreign_key="videos.video_id", ondelete="CASCADE")
     s3_path: str = Field(max_length=MAX_S3_LEN)
+    content_hash: str | None = Field(default=None, max_length=64, index=True)  # 업로드 시 sha256
     expires_at: Annotated[datetime, AwareDatetime] = Field(
         default_factory=source_def_expire,
         sa_column=Column(DateTime(timezone=True), nullable=False),
@@ -103,6 +116,10 @@ class Result(CreatedTimestampMixin, Base, table=True):
     )
     is_fast: bool
     total_result: ResultEnum
+    # 작업 구간별 소요 시간(초) (core.tracing.JobTrace.summary)
+    timings: dict[str, float] | None = Field(default=None, sa_column=Column(JSON))
+    # pre-flight probe 결과 + 비용 모델이 고른 샘플링 파라미터 (schemas.plan.JobPlan)
+    plan: dict[str, object] | None = Field(default=None, sa_column=Column(JSON))
 
     user: "User" = Relationship(back_populates="results")
     video: "Video" = Relationship(back_populates="result")
@@ -112,4 +129,7 @@ class Result(CreatedTimestampMixin, Base, table=True):
     deep_report: Optional["DeepReport"] = Relationship( # type: ignore
         back_populates="result", cascade_delete=True
     )
+    auto_report: Optional["AutoReport"] = Relationship( # type: ignore
+        back_populates="result", cascade_delete=True
+    )
     alerts: list["Alert"] = Relationship(back_populates="result")
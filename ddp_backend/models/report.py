@@ -2,15 +2,15 @@ import uuid
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel
-from sqlalchemy import Column, Dialect
+from sqlalchemy import Column, Dialect, UniqueConstraint
 from sqlalchemy.types import JSON, BigInteger, Enum, TypeDecorator
 from sqlmodel import Field, Relationship
 
 from ddp_backend.core.database import Base
+from ddp_backend.schemas.enums import ModelName, STTRiskLevel
 from ddp_backend.schemas.enums import Result as ResultEnum
-from ddp_backend.schemas.enums import STTRiskLevel
 
-from .models import MAX_S3_LEN, enum_to_value
+from .models import MAX_S3_LEN, CreatedTimestampMixin, enum_to_value
 
 if TYPE_CHECKING:
     from .models import Result
@@ -85,6 +85,24 @@ class DeepReportData(Base):
     unite_conf: float
 
 
+class AutoReportData(Base):
+    freq_result: ResultEnum = Field(
+        sa_column=Column(
+            Enum(ResultEnum, values_callable=enum_to_value), nullable=False
+        )
+    )
+    freq_conf: float
+    freq_image: str | None = Field(max_length=MAX_S3_LEN)
+    escalated: bool  # UNITE 실행 여부
+    unite_result: ResultEnum | None = Field(
+        default=None,
+        sa_column=Column(
+            Enum(ResultEnum, values_callable=enum_to_value), nullable=True
+        ),
+    )
+    unite_conf: float | None = None
+
+
 # 6. FastReports table
 class FastReport(ReportBase, FastReportData, table=True):
     __tablename__: str = "fast_reports"  # type: ignore
@@ -101,3 +119,44 @@ class DeepReport(ReportBase, DeepReportData, table=True):
 
     user: "User" = Relationship(back_populates="deep_reports")
     result: "Result" = Relationship(back_populates="deep_report")
+
+
+# 6. AutoReports table
+class AutoReport(ReportBase, AutoReportData, table=True):
+    __tablename__: str = "auto_reports"  # type: ignore
+    auto_id: int | None = Field(default=None, primary_key=True, sa_type=BigInteger)
+
+    user: "User" = Relationship(back_populates="auto_reports")
+    result: "Result" = Relationship(back_populates="auto_report")
+
+
+# 7. PartialReports table (progressive 모드: 탐지기별 중간 결과, 최종 Result 생성 전까지 유지)
+class PartialReport(CreatedTimestampMixin, Base, table=True):
+    __tablename__: str = "partial_reports"  # type: ignore
+    __table_args__ = (UniqueConstraint("video_id", "model_name"),)
+    partial_id: int | None = Field(default=None, primary_key=True, sa_type=BigInteger)
+    user_id: uuid.UUID = Field(foreign_key="users.user_id", ondelete="CASCADE")
+    video_id: uuid.UUID = Field(foreign_key="videos.video_id", ondelete="CASCADE")
+    model_name: ModelName = Field(
+        sa_column=Column(
+            Enum(ModelName, values_callable=enum_to_value), nullable=False
+        )
+    )
+    result: ResultEnum | None = Field(
+        default=None,
+        sa_column=Column(
+            Enum(ResultEnum, values_callable=enum_to_value), nullable=True
+        ),
+    )
+    conf: float | None = None
+    image: str | None = Field(default=None, max_length=MAX_S3_LEN)
+    stt_risk_level: STTRiskLevel | None = Field(
+        default=None,
+        sa_column=Column(
+            Enum(STTRiskLevel, values_callable=enum_to_value), nullable=True
+        ),
+    )
+    stt_script: STTScript | None = Field(
+        default=None,
+        sa_column=Column(PydanticJSONType(STTScript), nullable=True),
+    )
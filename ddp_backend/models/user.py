@@ -19,7 +19,7 @@ if TYPE_CHECKING:
         Token,
         Video,
     )
-    from .report import DeepReport, FastReport
+    from .report import AutoReport, DeepReport, FastReport
 
 
 # 1. 공통 Base 모델 (가장 교집합이 되는 필드들)
@@ -64,4 +64,7 @@ class User(UserBase, CreatedTimestampMixin, table=True):
     deep_reports: list["DeepReport"] = Relationship(
         back_populates="user", cascade_delete=True
     )
+    auto_reports: list["AutoReport"] = Relationship(
+        back_populates="user", cascade_delete=True
+    )
     alerts: list["Alert"] = Relationship(back_populates="user", cascade_delete=True)
@@ -1,15 +1,19 @@
+import asyncio
 import uuid
+from datetime import datetime, timedelta
 from typing import Annotated
+from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import Field
 from sqlmodel.orm.session import Session
 
 from ddp_backend.core.database import get_db
 from ddp_backend.core.security import get_current_user
 from ddp_backend.models import User
-from ddp_backend.schemas.enums import AnalyzeMode, ModelName, Result, Status
+from ddp_backend.schemas.enums import AnalyzeMode, ModelName, Result, Status, VideoStatus
 from ddp_backend.schemas.report import (
+    AutoReportResponse,
     DeepReportResponse,
     FastReportResponse,
     STTReport,
@@ -18,8 +22,14 @@ from ddp_backend.schemas.report import (
     VisualContent,
     ProbVisualContent
 )
-from ddp_backend.services.crud import CRUDResult, CRUDSource, CRUDVideo
-from ddp_backend.task.detection import predict_deepfake_deep, predict_deepfake_fast
+from ddp_backend.services.admission import admission
+from ddp_backend.services.crud import (
+    CRUDPartialReport,
+    CRUDResult,
+    CRUDSource,
+    CRUDVideo,
+)
+from ddp_backend.task.detection import enqueue_detection
 
 router = APIRouter(prefix="/prediction", tags=["prediction"])
 
@@ -35,7 +45,14 @@ async def predict_deepfake(
     user_id: Annotated[uuid.UUID, Depends(get_current_user_id)],
     db: Annotated[Session, Depends(get_db)],
     mode: AnalyzeMode,
+    response: Response,
+    progressive: bool = False,
 ) -> None:
+    """
+    분석 작업 등록.
+    큐가 밀려 있거나 진행 중 작업이 많으면 429 + Retry-After,
+    수락 시 예상 시작 시각을 X-Estimated-Start(ISO 8601) / X-Estimated-Wait-Seconds 헤더로 반환.
+    """
     video = CRUDVideo.get_by_id(db, video_id)
     if video is None:
         raise HTTPException(404, "Video Not Found")
@@ -46,10 +63,25 @@ async def predict_deepfake(
     if src is None:
         raise HTTPException(409, "Video is not ready yet. Please wait for upload to complete.")
 
-    if mode == AnalyzeMode.FAST:
-        await predict_deepfake_fast.kiq(video.video_id)
-    elif mode == AnalyzeMode.DEEP:
-        await predict_deepfake_deep.kiq(video.video_id)
+    # 동기 Redis 호출(pipeline / XINFO)이므로 이벤트 루프 밖에서 실행
+    decision = await asyncio.to_thread(admission.admit, user_id, video.video_id, mode)
+    if not decision.accepted:
+        raise HTTPException(
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            decision.reason,
+            headers={"Retry-After": str(decision.retry_after_s)},
+        )
+
+    try:
+        await enqueue_detection(video.video_id, mode, progressive)
+    except Exception:
+        await asyncio.to_thread(admission.release, video.video_id)
+        raise
+
+    wait_s = round(decision.estimated_wait_s)
+    estimated_start = datetime.now(ZoneInfo("Asia/Seoul")) + timedelta(seconds=wait_s)
+    response.headers["X-Estimated-Start"] = estimated_start.isoformat(timespec="seconds")
+    response.headers["X-Estimated-Wait-Seconds"] = str(wait_s)
     return None
 
 
@@ -72,8 +104,61 @@ async def get_video_status(
     }
 
 
+@router.get("/partial/{video_id}")
+async def get_partial_reports(
+    video_id: uuid.UUID,
+    user_id: Annotated[uuid.UUID, Depends(get_current_user_id)],
+    db: Annotated[Session, Depends(get_db)],
+) -> list[VideoReport[ProbVisualContent] | VideoReport[VisualContent] | STTReport]:
+    """progressive 모드로 진행 중인 분석의 탐지기별 중간 결과 (재접속 시 복구용)"""
+    video = CRUDVideo.get_by_id(db, video_id)
+    if video is None:
+        raise HTTPException(404, "Video Not Found")
+    if video.user_id != user_id:
+        raise HTTPException(403, "Forbidden")
+    # 실패한 분석의 중간 결과는 보여주지 않음 (정리 전에 남아 있을 수 있음)
+    if video.status == VideoStatus.FAILED:
+        return []
+
+    reports: list[VideoReport[ProbVisualContent] | VideoReport[VisualContent] | STTReport] = []
+    for partial in CRUDPartialReport.get_by_video(db, video_id):
+        match partial.model_name:
+            case ModelName.WAVELET if partial.result is not None and partial.conf is not None:
+                reports.append(
+                    VideoReport[ProbVisualContent](
+                        status=Status.SUCCESS,
+                        model_name=ModelName.WAVELET,
+                        content=ProbVisualContent(
+                            visual_report=partial.image,
+                            probability=conf_to_prob(partial.conf, partial.result),
+                        ),
+                    )
+                )
+            case ModelName.R_PPG:
+                reports.append(
+                    VideoReport[VisualContent](
+                        status=Status.SUCCESS,
+                        model_name=ModelName.R_PPG,
+                        content=VisualContent(visual_report=partial.image),
+                    )
+                )
+            case ModelName.STT if partial.stt_risk_level is not None and partial.stt_script is not None:
+                reports.append(
+                    STTReport(
+                        status=Status.SUCCESS,
+                        model_name=ModelName.STT,
+                        risk_level=partial.stt_risk_level,
+                        **partial.stt_script.model_dump(),
+                    )
+                )
+            case _:
+                continue
+    return reports
+
+
 type ResultType = Annotated[
-    FastReportResponse | DeepReportResponse, Field(discriminator="analysis_mode")
+    FastReportResponse | DeepReportResponse | AutoReportResponse,
+    Field(discriminator="analysis_mode"),
 ]
 
 
@@ -99,6 +184,30 @@ async def get_result(
     if result.user_id != user_id:
         raise HTTPException(403, "Forbidden")
 
+    if result.auto_report is not None:
+        report = result.auto_report
+        return AutoReportResponse(
+            status=Status.SUCCESS,
+            result=result.total_result,
+            escalated=report.escalated,
+            wavelet=VideoReport[ProbVisualContent](
+                status=Status.SUCCESS,
+                model_name=ModelName.WAVELET,
+                content=ProbVisualContent(
+                    visual_report=report.freq_image,
+                    probability=conf_to_prob(report.freq_conf, report.freq_result),
+                )
+            ),
+            unite=VideoReport[ProbabilityContent](
+                status=Status.SUCCESS,
+                model_name=ModelName.UNITE,
+                content=ProbabilityContent(
+                    probability=conf_to_prob(report.unite_conf, report.unite_result),
+                )
+            )
+            if report.unite_conf is not None and report.unite_result is not None
+            else None,
+        )
     if result.is_fast:
         report = result.fast_report
         return FastReportResponse(
@@ -8,7 +8,7 @@ from pydantic import BaseModel, HttpUrl
 from sqlmodel.orm.session import Session
 
 from ddp_backend.core.database import get_db
-from ddp_backend.core.s3 import upload_file_to_s3
+from ddp_backend.core.s3 import upload_file_to_s3_hashed
 from ddp_backend.core.security import get_current_user
 from ddp_backend.models import Source, User, Video
 from ddp_backend.schemas.enums import OriginPath, VideoStatus
@@ -41,14 +41,14 @@ def upload_video(
         ext = Path(file.filename).suffix if file.filename else ".mp4"
         s3_key = f"raw/{video.video_id}_{uuid.uuid4().hex}{ext}"
 
-        s3_key = upload_file_to_s3(
+        s3_key, content_hash = upload_file_to_s3_hashed(
             file.file,
             s3_key,
             content_type=file.content_type or "video/mp4",
         )
 
         # 3) sources upsert(이 경우 신규)
-        src = Source(video_id=video.video_id, s3_path=s3_key)
+        src = Source(video_id=video.video_id, s3_path=s3_key, content_hash=content_hash)
         CRUDSource.create(db, src)
 
     return {"video_id": video.video_id, "s3_path": s3_key, "queued": True}
@@ -12,6 +12,9 @@ class BaseVideoConfig(BaseModel):
     model_path: str | Path
     threshold: float = 0.5
     img_size: int
+    # 작업 간 마이크로 배칭 (detectors.batching.MicroBatcher, 1이면 배칭 안 함)
+    batch_max_size: int = 8
+    batch_max_wait_ms: float = 5.0
 
 
 class WaveletConfig(BaseVideoConfig):
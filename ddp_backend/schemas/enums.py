@@ -34,6 +34,7 @@ class Result(StrEnum):
 class AnalyzeMode(StrEnum):
     FAST = "fast"
     DEEP = "deep"
+    AUTO = "auto"  # wavelet 우선, 애매할 때만 UNITE로 에스컬레이션
 
 
 class LoginMethod(StrEnum):
@@ -1,10 +1,39 @@
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
-__all__ = ['WorkerResultMessage']
+from .enums import ModelName
+
+__all__ = [
+    'WorkerResultMessage',
+    'WorkerPartialMessage',
+    'WorkerMessage',
+    'worker_message_adapter',
+]
 
 class WorkerResultMessage(BaseModel):
+    type: Literal["result"] = "result"
     user_id: UUID
     result_id: UUID | None
     error_msg: str | None = None
+
+
+class WorkerPartialMessage(BaseModel):
+    """
+    progressive 모드: 탐지기 하나가 끝날 때마다 전송되는 중간 결과.
+    작업이 끝나면(성공 / 실패) model_name / report 없이 done=True로 스트림 종료를 알린다.
+    """
+    type: Literal["partial"] = "partial"
+    user_id: UUID
+    video_id: UUID
+    model_name: ModelName | None = None
+    report: dict[str, Any] | None = None  # VideoReport / STTReport 직렬화 결과
+    done: bool = False
+    failed: bool = False  # done=True일 때만 의미 있음 (실패 시 지금까지의 중간 결과는 삭제됨)
+
+
+type WorkerMessage = Annotated[
+    WorkerResultMessage | WorkerPartialMessage, Field(discriminator="type")
+]
+worker_message_adapter: TypeAdapter[WorkerMessage] = TypeAdapter(WorkerMessage)
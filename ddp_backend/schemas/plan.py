@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+__all__ = [
+    "MediaInfo",
+    "JobPlan",
+]
+
+
+class MediaInfo(BaseModel):
+    """추론 전 pre-flight probe 결과 (ffprobe / 컨테이너 메타데이터)."""
+    duration_s: float
+    width: int
+    height: int
+    fps: float
+    video_codec: str | None = None
+    audio_codec: str | None = None  # None이면 오디오 트랙 없음
+
+
+class JobPlan(BaseModel):
+    """
+    작업 비용 모델이 고른 탐지기별 샘플링 파라미터 (Result.plan에 저장).
+    구간은 원본 기준 (시작초, 끝초), None이면 전체 사용.
+    """
+    media: MediaInfo
+    budget_s: float
+    decode_max_side: int | None = None  # 디코딩 시 긴 변 상한 (None: 원본 해상도)
+    wavelet_frames: int | None = None
+    rppg_span_s: tuple[float, float] | None = None
+    stt_window_s: float | None = None  # 앞에서부터 전사할 오디오 길이
+    unite_span_s: tuple[float, float] | None = None
+    estimated_s: dict[str, float] = {}  # 탐지기별 예상 소요 시간
+    within_budget: bool = True
@@ -3,7 +3,12 @@ from typing import Annotated, Literal
 from pydantic import BaseModel, Field, computed_field, field_serializer, model_serializer
 
 from ddp_backend.core.s3 import to_presigned_url
-from ddp_backend.models.report import DeepReportData, FastReportData, STTScript
+from ddp_backend.models.report import (
+    AutoReportData,
+    DeepReportData,
+    FastReportData,
+    STTScript,
+)
 
 from .enums import AnalyzeMode, ModelName, Result, Status, STTRiskLevel
 
@@ -13,8 +18,10 @@ __all__ = [
     "STTReport",
     "FastReportData",
     "DeepReportData",
+    "AutoReportData",
     "FastReportResponse",
-    "DeepReportResponse"
+    "DeepReportResponse",
+    "AutoReportResponse",
 ]
 
 
@@ -88,3 +95,10 @@ class FastReportResponse(BaseReportResponse):
 class DeepReportResponse(BaseReportResponse):
     analysis_mode: Literal[AnalyzeMode.DEEP] = AnalyzeMode.DEEP
     unite: VideoReport[ProbabilityContent] | None = None
+
+
+class AutoReportResponse(BaseReportResponse):
+    analysis_mode: Literal[AnalyzeMode.AUTO] = AnalyzeMode.AUTO
+    escalated: bool = False
+    wavelet: VideoReport[ProbVisualContent] | None = None
+    unite: VideoReport[ProbabilityContent] | None = None
@@ -0,0 +1,142 @@
+"""
+분석 요청 수락 제어 (admission control / backpressure)
+
+/prediction/{mode} 요청을 큐에 넣기 전에
+- 사용자별 진행 중(enqueue ~ 워커 종료) 작업 수가 한도를 넘었는지
+- 현재 큐 적체량 × 최근 평균 처리 시간으로 추정한 대기 시간이 모드별 상한을 넘었는지
+를 확인해, 넘으면 Retry-After와 함께 거절한다.
+
+진행 중 작업은 사용자별 sorted set(score=수락 시각)에 기록하고, 워커가 작업을 마치면 release로 제거한다.
+워커가 비정상 종료해 release가 누락돼도 ADMISSION_INFLIGHT_TTL_S가 지나면 한도 계산에서 빠지고,
+영상별 소유자 key도 같은 시간이 지나면 만료된다.
+"""
+
+import math
+import time
+import uuid
+from dataclasses import dataclass
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from ddp_backend.core.config import REDIS_URL, settings
+from ddp_backend.core.queue_stats import QUEUE_OF_MODE, QueueStats, queue_stats
+from ddp_backend.schemas.enums import AnalyzeMode
+
+__all__ = ["Admission", "AdmissionController", "admission"]
+
+_INFLIGHT_KEY = "admission:inflight:{user_id}"
+_OWNER_KEY = "admission:owner:{video_id}"  # → user_id (워커는 video_id만 알고 있으므로)
+
+
+@dataclass
+class Admission:
+    accepted: bool
+    estimated_wait_s: float = 0.0
+    retry_after_s: int | None = None
+    reason: str | None = None
+
+
+class AdmissionController:
+    def __init__(self, redis: Redis, stats: QueueStats, enabled: bool = True):
+        self.redis = redis
+        self.stats = stats
+        self.enabled = enabled
+
+    @staticmethod
+    def _capacity(mode: AnalyzeMode) -> int:
+        per_worker = (
+            settings.FAST_WORKER_CONCURRENCY
+            if mode == AnalyzeMode.FAST
+            else settings.DEEP_WORKER_CONCURRENCY
+        )
+        return max(per_worker * settings.ADMISSION_WORKER_PROCESSES, 1)
+
+    @staticmethod
+    def _max_wait(mode: AnalyzeMode) -> float:
+        return (
+            settings.ADMISSION_MAX_WAIT_S_FAST
+            if mode == AnalyzeMode.FAST
+            else settings.ADMISSION_MAX_WAIT_S_DEEP
+        )
+
+    def job_seconds(self, mode: AnalyzeMode) -> float:
+        return self.stats.avg_duration(mode) or settings.ADMISSION_DEFAULT_JOB_S
+
+    def estimate_wait(self, mode: AnalyzeMode) -> float:
+        """
+        지금 enqueue하면 처리 시작까지 걸릴 시간(초) 추정.
+        앞선 작업(lag + pending)을 처리 슬롯 수로 나눈 만큼 평균 처리 시간이 걸린다고 본다.
+        """
+        ahead = self.stats.depth(QUEUE_OF_MODE[mode])["depth"] or 0
+        return ahead / self._capacity(mode) * self.job_seconds(mode)
+
+    def _acquire_inflight(self, user_id: uuid.UUID, video_id: uuid.UUID) -> int:
+        """진행 중 작업에 추가하고 추가 후 개수를 반환 (같은 영상 재요청은 중복 집계하지 않음)."""
+        key = _INFLIGHT_KEY.format(user_id=user_id)
+        now = time.time()
+        pipe = self.redis.pipeline()
+        pipe.zremrangebyscore(key, 0, now - settings.ADMISSION_INFLIGHT_TTL_S)
+        pipe.zadd(key, {str(video_id): now})
+        pipe.zcard(key)
+        pipe.expire(key, int(settings.ADMISSION_INFLIGHT_TTL_S))
+        pipe.set(
+            _OWNER_KEY.format(video_id=video_id), str(user_id), ex=int(settings.ADMISSION_INFLIGHT_TTL_S)
+        )
+        return int(pipe.execute()[2])
+
+    def _drop_inflight(self, user_id: uuid.UUID | str, video_id: uuid.UUID):
+        pipe = self.redis.pipeline()
+        pipe.zrem(_INFLIGHT_KEY.format(user_id=user_id), str(video_id))
+        pipe.delete(_OWNER_KEY.format(video_id=video_id))
+        pipe.execute()
+
+    def admit(self, user_id: uuid.UUID, video_id: uuid.UUID, mode: AnalyzeMode) -> Admission:
+        """요청 수락 여부 판단. 수락하면 진행 중 작업으로 기록된다 (Redis 장애 시에는 그냥 수락)."""
+        if not self.enabled:
+            return Admission(accepted=True)
+        try:
+            estimated = self.estimate_wait(mode)
+            max_wait = self._max_wait(mode)
+            if estimated > max_wait:
+                return Admission(
+                    accepted=False,
+                    estimated_wait_s=estimated,
+                    # 적체량이 상한 아래로 내려갈 때까지
+                    retry_after_s=max(math.ceil(estimated - max_wait), 1),
+                    reason=f"{mode} queue is overloaded",
+                )
+
+            inflight = self._acquire_inflight(user_id, video_id)
+            if inflight > settings.ADMISSION_MAX_INFLIGHT_PER_USER:
+                self._drop_inflight(user_id, video_id)
+                return Admission(
+                    accepted=False,
+                    estimated_wait_s=estimated,
+                    # 진행 중 작업 하나가 끝날 만한 시간
+                    retry_after_s=max(math.ceil(self.job_seconds(mode)), 1),
+                    reason=f"Too many analyses in progress (max {settings.ADMISSION_MAX_INFLIGHT_PER_USER})",
+                )
+        except RedisError as e:
+            print(f"[WARN] Admission check failed, accepting request: {e}")
+            return Admission(accepted=True)
+        return Admission(accepted=True, estimated_wait_s=estimated)
+
+    def release(self, video_id: uuid.UUID):
+        """작업 종료(성공/실패/스킵) 시 진행 중 작업에서 제거."""
+        try:
+            user_id = self.redis.get(_OWNER_KEY.format(video_id=video_id))
+            if user_id is None:
+                return
+            if isinstance(user_id, bytes):
+                user_id = user_id.decode()
+            self._drop_inflight(user_id, video_id)  # type: ignore
+        except RedisError as e:
+            print(f"[WARN] Admission release failed for video_id={video_id}: {e}")
+
+
+admission = AdmissionController(
+    Redis.from_url(REDIS_URL or "redis://127.0.0.1:6379/0"),
+    queue_stats,
+    enabled=settings.ADMISSION_ENABLED,
+)
@@ -0,0 +1,86 @@
+"""
+탐지기 단계별 체크포인트
+
+작업이 중간에 죽어 재시도되면, 이미 끝난 탐지기(wavelet / rPPG / STT)의 리포트를
+체크포인트에서 복원해 남은 단계만 실행한다.
+키: (video_id, 탐지기) — 저장 시점의 모델 버전이 현재와 다르면 무시하고 다시 실행.
+"""
+
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlmodel.orm.session import Session
+
+from ddp_backend.schemas.enums import ModelName, Status
+from ddp_backend.schemas.report import (
+    ProbabilityContent,
+    ProbVisualContent,
+    STTReport,
+    VideoReport,
+    VisualContent,
+)
+from ddp_backend.services.crud import CRUDStageCheckpoint
+from ddp_backend.services.detect_pipeline import DetectorReport
+
+__all__ = ["StageCheckpointStore", "stage_checkpoints"]
+
+# 탐지기별 VideoReport content 타입
+_CONTENT_TYPE: dict[ModelName, type[BaseModel]] = {
+    ModelName.WAVELET: ProbVisualContent,
+    ModelName.R_PPG: VisualContent,
+    ModelName.UNITE: ProbabilityContent,
+}
+
+
+def _raw_fields(model: BaseModel) -> dict[str, Any]:
+    # model_dump는 visual_report(S3 key)를 presigned URL로 바꾸므로 필드 값을 그대로 사용
+    # (image bytes는 이미 업로드되어 visual_report key로 남아 있음)
+    return {name: getattr(model, name) for name in type(model).model_fields if name != "image"}
+
+
+def dump_report(report: DetectorReport) -> dict[str, Any]:
+    if isinstance(report, STTReport):
+        return report.model_dump(mode="json")
+    return {
+        "status": report.status,
+        "model_name": report.model_name,
+        "content": _raw_fields(report.content) if report.content is not None else None,
+    }
+
+
+def load_report(model_name: ModelName, data: dict[str, Any]) -> DetectorReport:
+    if model_name == ModelName.STT:
+        return STTReport.model_validate(data)
+    content_type = _CONTENT_TYPE[model_name]
+    content = data.get("content")
+    return VideoReport[content_type](  # type: ignore[valid-type]
+        status=Status(data["status"]),
+        model_name=model_name,
+        content=content_type.model_validate(content) if content is not None else None,
+    )
+
+
+class StageCheckpointStore:
+    def load(
+        self, db: Session, video_id: UUID, versions: dict[ModelName, str]
+    ) -> dict[ModelName, DetectorReport]:
+        """현재 모델 버전과 일치하는 완료 단계 리포트."""
+        completed: dict[ModelName, DetectorReport] = {}
+        for checkpoint in CRUDStageCheckpoint.get_by_video(db, video_id):
+            if versions.get(checkpoint.model_name) != checkpoint.model_version:
+                continue
+            try:
+                completed[checkpoint.model_name] = load_report(checkpoint.model_name, checkpoint.report)
+            except Exception as e:
+                print(f"[WARN] Broken checkpoint {checkpoint.model_name} for {video_id}: {e}")
+        return completed
+
+    def save(self, db: Session, video_id: UUID, version: str, report: DetectorReport):
+        CRUDStageCheckpoint.upsert(db, video_id, report.model_name, version, dump_report(report))
+
+    def clear(self, db: Session, video_id: UUID):
+        CRUDStageCheckpoint.delete_by_video(db, video_id)
+
+
+stage_checkpoints = StageCheckpointStore()
@@ -1,5 +1,7 @@
 from .alert import CRUDAlert
-from .report import CRUDDeepReport, CRUDFastReport
+from .cache import CRUDDetectionCache
+from .checkpoint import CRUDStageCheckpoint
+from .report import CRUDAutoReport, CRUDDeepReport, CRUDFastReport, CRUDPartialReport
 from .result import CRUDResult
 from .source import CRUDSource
 from .token import CRUDToken
@@ -8,10 +10,14 @@ from .video import CRUDVideo
 
 __all__ = [
     'CRUDAlert',
+    'CRUDAutoReport',
     'CRUDDeepReport',
+    'CRUDDetectionCache',
     'CRUDFastReport',
+    'CRUDPartialReport',
     'CRUDResult',
     'CRUDSource',
+    'CRUDStageCheckpoint',
     'CRUDToken',
    ## 'TokenCreate',
     'CRUDUser',
@@ -0,0 +1,57 @@
+"""
+DetectionCache CRUD
+"""
+
+from sqlmodel import col, delete, select
+from sqlmodel.orm.session import Session
+
+from ddp_backend.models import DetectionCache
+from ddp_backend.schemas.enums import AnalyzeMode
+
+from .base import CRUDBase
+
+__all__ = [
+    "CRUDDetectionCache",
+]
+
+
+class CRUDDetectionCache(CRUDBase):
+    # 사용 : 분석 완료 후 결과 캐시 저장
+    @classmethod
+    def create(cls, db: Session, db_cache: DetectionCache):
+        """캐시 항목 생성"""
+        db.add(db_cache)
+        cls.commit_or_flush(db)
+        db.refresh(db_cache)
+        return db_cache
+
+    # 사용 : 분석 전 캐시 조회
+    @classmethod
+    def get(
+        cls, db: Session, content_hash: str, mode: AnalyzeMode, model_version: str
+    ):
+        """(해시, 모드, 모델 버전)으로 캐시 조회"""
+        query = select(DetectionCache).where(
+            DetectionCache.content_hash == content_hash,
+            DetectionCache.analysis_mode == mode,
+            DetectionCache.model_version == model_version,
+        )
+        return db.scalars(query).one_or_none()
+
+    @classmethod
+    def increment_hit(cls, db: Session, db_cache: DetectionCache):
+        db_cache.hit_count += 1
+        cls.commit_or_flush(db)
+        return db_cache
+
+    # 사용 : 체크포인트 교체 후 이전 버전 캐시 무효화
+    @classmethod
+    def delete_stale(cls, db: Session, mode: AnalyzeMode, model_version: str) -> int:
+        """현재 모델 버전이 아닌 캐시 항목 삭제"""
+        query = delete(DetectionCache).where(
+            col(DetectionCache.analysis_mode) == mode,
+            col(DetectionCache.model_version) != model_version,
+        )
+        res = db.exec(query)  # type: ignore
+        cls.commit_or_flush(db)
+        return res.rowcount
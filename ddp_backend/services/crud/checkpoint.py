@@ -0,0 +1,63 @@
+"""
+StageCheckpoint CRUD
+"""
+
+from typing import Any
+from uuid import UUID
+
+from sqlmodel import select
+from sqlmodel.orm.session import Session
+
+from ddp_backend.models import StageCheckpoint
+from ddp_backend.schemas.enums import ModelName
+
+from .base import CRUDBase
+
+__all__ = [
+    "CRUDStageCheckpoint",
+]
+
+
+class CRUDStageCheckpoint(CRUDBase):
+    # 사용 : 탐지기 단계 완료 시 중간 결과 저장 (재시도 시 덮어쓰기)
+    @classmethod
+    def upsert(
+        cls,
+        db: Session,
+        video_id: UUID,
+        model_name: ModelName,
+        model_version: str,
+        report: dict[str, Any],
+    ):
+        """(video_id, model_name) 기준 체크포인트 생성 또는 갱신"""
+        query = select(StageCheckpoint).where(
+            StageCheckpoint.video_id == video_id,
+            StageCheckpoint.model_name == model_name,
+        )
+        checkpoint = db.scalars(query).one_or_none()
+        if checkpoint is None:
+            checkpoint = StageCheckpoint(
+                video_id=video_id,
+                model_name=model_name,
+                model_version=model_version,
+                report=report,
+            )
+            db.add(checkpoint)
+        else:
+            checkpoint.model_version = model_version
+            checkpoint.report = report
+        cls.commit_or_flush(db)
+        return checkpoint
+
+    # 사용 : 재시도된 작업 시작 시 완료된 단계 조회
+    @classmethod
+    def get_by_video(cls, db: Session, video_id: UUID):
+        query = select(StageCheckpoint).where(StageCheckpoint.video_id == video_id)
+        return db.scalars(query).all()
+
+    # 사용 : 최종 Result 생성 후 정리
+    @classmethod
+    def delete_by_video(cls, db: Session, video_id: UUID):
+        for checkpoint in cls.get_by_video(db, video_id):
+            db.delete(checkpoint)
+        cls.commit_or_flush(db)
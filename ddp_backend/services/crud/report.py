@@ -7,13 +7,15 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.orm.session import Session
 
-from ddp_backend.models import DeepReport, FastReport
+from ddp_backend.models import AutoReport, DeepReport, FastReport, PartialReport
 
 from .base import CRUDBase
 
 __all__ = [
     "CRUDFastReport",
     "CRUDDeepReport",
+    "CRUDPartialReport",
+    "CRUDAutoReport",
 ]
 
 
@@ -51,3 +53,60 @@ class CRUDDeepReport(CRUDBase):
         """result_id로 Deep 리포트 조회"""
         query = select(DeepReport).where(DeepReport.result_id == result_id)
         return db.scalars(query).one_or_none()
+
+
+class CRUDAutoReport(CRUDBase):
+    # 사용 : AutoReport 저장
+    @classmethod
+    def create(cls, db: Session, db_report: AutoReport):
+        """Auto 분석 리포트 생성"""
+        db.add(db_report)
+        cls.commit_or_flush(db)
+        db.refresh(db_report)
+        return db_report
+
+    # 사용 : AutoReport 상세 결과 조회
+    @classmethod
+    def get_by_result(cls, db: Session, result_id: UUID):
+        """result_id로 Auto 리포트 조회"""
+        query = select(AutoReport).where(AutoReport.result_id == result_id)
+        return db.scalars(query).one_or_none()
+
+
+class CRUDPartialReport(CRUDBase):
+    # 사용 : progressive 모드에서 탐지기별 결과 저장 (재시도 시 덮어쓰기)
+    @classmethod
+    def upsert(cls, db: Session, db_report: PartialReport):
+        """(video_id, model_name) 기준 중간 결과 생성 또는 갱신"""
+        query = select(PartialReport).where(
+            PartialReport.video_id == db_report.video_id,
+            PartialReport.model_name == db_report.model_name,
+        )
+        existing = db.scalars(query).one_or_none()
+        if existing is not None:
+            existing.result = db_report.result
+            existing.conf = db_report.conf
+            existing.image = db_report.image
+            existing.stt_risk_level = db_report.stt_risk_level
+            existing.stt_script = db_report.stt_script
+            db_report = existing
+        else:
+            db.add(db_report)
+        cls.commit_or_flush(db)
+        db.refresh(db_report)
+        return db_report
+
+    # 사용 : 진행 중인 분석의 중간 결과 조회
+    @classmethod
+    def get_by_video(cls, db: Session, video_id: UUID):
+        """video_id로 중간 결과 목록 조회"""
+        query = select(PartialReport).where(PartialReport.video_id == video_id)
+        return db.scalars(query).all()
+
+    # 사용 : 최종 Result 생성 후 정리
+    @classmethod
+    def delete_by_video(cls, db: Session, video_id: UUID):
+        """video_id의 중간 결과 삭제"""
+        for report in cls.get_by_video(db, video_id):
+            db.delete(report)
+        cls.commit_or_flush(db)
@@ -22,6 +22,7 @@ class CRUDSource(CRUDBase):
         db_source = Source(
             video_id=db_source.video_id,
             s3_path=db_source.s3_path,
+            content_hash=db_source.content_hash,
         )
         db.add(db_source)
         cls.commit_or_flush(db)
@@ -36,20 +37,27 @@ class CRUDSource(CRUDBase):
         return db.scalars(query).one_or_none()
 
     @classmethod
-    def update_s3(cls, db: Session, video_id: UUID, s3_path: str):
+    def update_s3(
+        cls, db: Session, video_id: UUID, s3_path: str, content_hash: str | None = None
+    ):
         src = cls.get_by_video(db, video_id)
         if src is None:
             return None
         src.s3_path = s3_path
+        src.content_hash = content_hash
 
         cls.commit_or_flush(db)
         db.refresh(src)
         return src
 
     @classmethod
-    def upsert_source(cls, db: Session, video_id: UUID, s3_path: str):
-        src = cls.update_s3(db, video_id, s3_path)
+    def upsert_source(
+        cls, db: Session, video_id: UUID, s3_path: str, content_hash: str | None = None
+    ):
+        src = cls.update_s3(db, video_id, s3_path, content_hash)
         if src:
             return src
-        return cls.create(db, Source(video_id=video_id, s3_path=s3_path))
+        return cls.create(
+            db, Source(video_id=video_id, s3_path=s3_path, content_hash=content_hash)
+        )
         
\ No newline at end of file
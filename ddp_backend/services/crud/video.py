@@ -2,12 +2,15 @@
 Video CRUD
 """
 
+from datetime import datetime, timedelta
 from uuid import UUID
-from sqlmodel import select
+from zoneinfo import ZoneInfo
+
+from sqlmodel import col, or_, select
 from sqlmodel.orm.session import Session
 
 from ddp_backend.models import Video
-from ddp_backend.schemas.enums import VideoStatus
+from ddp_backend.schemas.enums import AnalyzeMode, VideoStatus
 
 from .base import CRUDBase
 __all__ = [
@@ -48,3 +51,51 @@ class CRUDVideo(CRUDBase):
         cls.commit_or_flush(db)
         db.refresh(video)
         return video
+
+    # 사용 : 분석 작업 시작 (재전달 / 재시도 포함)
+    @classmethod
+    def claim_processing(
+        cls, db: Session, video_id: UUID, mode: AnalyzeMode, stale_after: float
+    ) -> Video | None:
+        """
+        PROCESSING으로 전환하고 heartbeat / 시도 횟수 갱신.
+        다른 워커가 stale_after초 이내에 heartbeat를 남긴 작업이면 None (중복 실행 방지).
+        """
+        video = db.get(Video, video_id, with_for_update=True)
+        if video is None:
+            return None
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        if (
+            video.status == VideoStatus.PROCESSING
+            and video.heartbeat_at is not None
+            and now - video.heartbeat_at < timedelta(seconds=stale_after)
+        ):
+            db.rollback()
+            return None
+        video.status = VideoStatus.PROCESSING
+        video.analysis_mode = mode
+        video.heartbeat_at = now
+        video.attempts += 1
+        cls.commit_or_flush(db)
+        db.refresh(video)
+        return video
+
+    # 사용 : 작업 진행 중 주기적 갱신
+    @classmethod
+    def heartbeat(cls, db: Session, video_id: UUID):
+        video = db.get(Video, video_id)
+        if video is None or video.status != VideoStatus.PROCESSING:
+            return None
+        video.heartbeat_at = datetime.now(ZoneInfo("Asia/Seoul"))
+        cls.commit_or_flush(db)
+        return video
+
+    # 사용 : reaper (heartbeat가 끊긴 작업 조회)
+    @classmethod
+    def get_stale_processing(cls, db: Session, stale_after: float):
+        deadline = datetime.now(ZoneInfo("Asia/Seoul")) - timedelta(seconds=stale_after)
+        query = select(Video).where(
+            Video.status == VideoStatus.PROCESSING,
+            or_(col(Video.heartbeat_at).is_(None), col(Video.heartbeat_at) < deadline),
+        )
+        return db.scalars(query).all()
@@ -1,8 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from ddp_backend.core.tracing import submit_in_context
+from ddp_backend.schemas.enums import AnalyzeMode, ModelName
+from ddp_backend.schemas.plan import JobPlan
+from ddp_backend.schemas.report import (
+    AutoReportData,
+    DeepReportData,
+    FastReportData,
+    STTReport,
+    STTScript,
+    VideoReport,
+)
+
+# 탐지기 모듈은 torch / insightface / onnxruntime을 끌어오므로 타입 검사 시에만 import
+# (API 서버 프로세스가 이 모듈을 import 해도 ML 라이브러리는 로드되지 않음)
+if TYPE_CHECKING:
+    from ddp_backend.detectors import MediaContext
+    from ddp_backend.detectors.audio import STTDetector
+    from ddp_backend.detectors.visual import RPPGDetector, UniteDetector, WaveletDetector
+
+type DetectorReport = VideoReport[Any] | STTReport
+type ReportCallback = Callable[[DetectorReport], None]
+
+# 모드별로 필요한 모델
+MODE_MODELS: dict[AnalyzeMode, tuple[ModelName, ...]] = {
+    AnalyzeMode.FAST: (ModelName.WAVELET, ModelName.R_PPG, ModelName.STT),
+    AnalyzeMode.DEEP: (ModelName.UNITE,),
+    AnalyzeMode.AUTO: (ModelName.WAVELET, ModelName.UNITE),
+}
+# 미리 로드(warm-up) 실패해도 워커 기동은 계속할 모델 (첫 사용 시 다시 시도)
+_OPTIONAL_PRELOAD = {ModelName.WAVELET, ModelName.STT}
+
+
+@lru_cache(maxsize=16)
+def _content_hash(path: str, size: int, mtime_ns: int) -> str:
+    # (size, mtime)은 재계산 여부 판단용 캐시 키일 뿐, 결과는 파일 내용에만 의존
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(8 * 1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Loadable(Protocol):
+    def load_model(self) -> None: ...
+    def unload_model(self) -> None: ...
+
+
+class LazyModel[D: Loadable]:
+    """
+    탐지기 모델 지연 로드.
+    최초 사용 시 한 번만 load_model()을 호출하고(스레드 안전),
+    사용 중이 아닌 상태로 유휴 시간이 지나면 unload_model()로 해제한다.
+    """
 
-from ddp_backend.detectors.audio import STTDetector
-from ddp_backend.detectors.visual import RPPGDetector, UniteDetector, WaveletDetector
-from ddp_backend.schemas.report import DeepReportData, FastReportData, STTScript
+    def __init__(self, name: ModelName, detector: D):
+        self.name = name
+        self.detector = detector
+        self.loaded = False
+        self.last_used = time.monotonic()
+        self._in_use = 0
+        self._lock = threading.Lock()
+
+    def ensure_loaded(self) -> D:
+        if not self.loaded:
+            with self._lock:
+                if not self.loaded:
+                    started = time.perf_counter()
+                    self.detector.load_model()
+                    self.loaded = True
+                    self.last_used = time.monotonic()
+                    print(f"[PIPELINE] {self.name} model loaded ({time.perf_counter() - started:.1f}s)")
+        return self.detector
+
+    @contextmanager
+    def use(self) -> Iterator[D]:
+        with self._lock:
+            self._in_use += 1
+        try:
+            yield self.ensure_loaded()
+        finally:
+            with self._lock:
+                self._in_use -= 1
+                self.last_used = time.monotonic()
+
+    def unload_if_idle(self, idle_seconds: float) -> bool:
+        with self._lock:
+            if (
+                not self.loaded
+                or self._in_use
+                or time.monotonic() - self.last_used < idle_seconds
+            ):
+                return False
+            self.detector.unload_model()
+            self.loaded = False
+        print(f"[PIPELINE] {self.name} model unloaded after {idle_seconds:.0f}s idle")
+        return True
 
 
 class DetectionPipeline:
@@ -12,29 +116,188 @@ class DetectionPipeline:
         wavelet: WaveletDetector,
         r_ppg: RPPGDetector,
         stt: STTDetector,
+        auto_uncertain_band: tuple[float, float] = (0.35, 0.65),
+        version_tag: str = "",
     ):
         self.unite_detector = unite
         self.wavelet_detector = wavelet
         self.r_ppg_detector = r_ppg
 
         self.stt_detector = stt
+        # auto 모드: wavelet REAL 확률이 [low, high] 구간이면 UNITE 실행
+        self.auto_uncertain_band = auto_uncertain_band
+        # 비어 있지 않으면 체크포인트 해시 대신 이 값을 모델 버전으로 사용 (대용량 체크포인트 배포용)
+        self.version_tag = version_tag
 
-    def load_all_models(self):
-        self.unite_detector.load_model()
+        # 모델은 첫 사용 시 로드 (워커가 담당하는 모드의 모델만 메모리에 올라감)
+        self._unite = LazyModel(ModelName.UNITE, unite)
+        self._wavelet = LazyModel(ModelName.WAVELET, wavelet)
+        self._r_ppg = LazyModel(ModelName.R_PPG, r_ppg)
+        self._stt = LazyModel(ModelName.STT, stt)
+        self._models: dict[ModelName, LazyModel[Any]] = {
+            m.name: m for m in (self._unite, self._wavelet, self._r_ppg, self._stt)
+        }
+        self._idle_unloader: threading.Thread | None = None
+
+    @staticmethod
+    def _file_fingerprint(path: str | Path) -> str:
+        """체크포인트 내용 해시 (호스트 / 재다운로드와 무관하게 같은 파일이면 같은 값)."""
+        path = Path(path)
         try:
-            self.wavelet_detector.load_model()
-        except Exception as e:
-            print(f"[WARN] Wavelet model load failed: {e}")
-        self.r_ppg_detector.load_model()
-
-    def run_fast_mode(self, file_path: Path) -> FastReportData:
-        print(f"[PIPELINE] Starting wavelet analysis: {file_path}")
-        wavelet_report = self.wavelet_detector.analyze(file_path)
-        print(f"[PIPELINE] Wavelet done. Starting rPPG analysis.")
-        r_ppg_report = self.r_ppg_detector.analyze(file_path)
-        print(f"[PIPELINE] rPPG done. Starting STT analysis.")
-        stt_report = self.stt_detector.analyze(file_path)
-        print(f"[PIPELINE] STT done.")
+            st = path.stat()
+        except OSError:
+            return f"{path.name}:missing"
+        return f"sha256={_content_hash(str(path.resolve()), st.st_size, st.st_mtime_ns)}"
+
+    def _stage_fingerprint(self, name: ModelName) -> str:
+        if self.version_tag and name != ModelName.STT:
+            return f"{name}={self.version_tag}"
+        match name:
+            case ModelName.WAVELET:
+                return self._file_fingerprint(self.wavelet_detector.config.model_path)
+            case ModelName.R_PPG:
+                return self._file_fingerprint(self.r_ppg_detector.config.model_path)
+            case ModelName.UNITE:
+                return self._file_fingerprint(self.unite_detector.config.model_path)
+            case ModelName.STT:
+                return f"whisper={self.stt_detector.whisper_model}"
+
+    def model_version(self, mode: AnalyzeMode) -> str:
+        """모드별 결과에 영향을 주는 체크포인트/설정 지문 (결과 캐시 키로 사용)"""
+        parts = [self._stage_fingerprint(name) for name in MODE_MODELS[mode]]
+        if mode == AnalyzeMode.AUTO:
+            parts.append(f"band={self.auto_uncertain_band}")
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
+
+    def stage_versions(self, mode: AnalyzeMode) -> dict[ModelName, str]:
+        """탐지기 단계별 버전 (단계 체크포인트 키로 사용)"""
+        return {
+            name: hashlib.sha256(self._stage_fingerprint(name).encode()).hexdigest()[:32]
+            for name in MODE_MODELS[mode]
+        }
+
+    def load_models(self, modes: Iterable[AnalyzeMode]):
+        """주어진 모드에 필요한 모델 미리 로드 (warm-up)."""
+        names = {name for mode in modes for name in MODE_MODELS[mode]}
+        for name in ModelName:
+            if name not in names:
+                continue
+            try:
+                self._models[name].ensure_loaded()
+            except Exception as e:
+                if name not in _OPTIONAL_PRELOAD:
+                    raise
+                print(f"[WARN] {name} model preload failed: {e}")
+
+    def load_all_models(self):
+        self.load_models(AnalyzeMode)
+
+    def loaded_models(self) -> list[ModelName]:
+        return [name for name, m in self._models.items() if m.loaded]
+
+    def batch_stats(self) -> dict[ModelName, dict[str, float | int]]:
+        """로드된 탐지기별 마이크로 배칭 통계 (배치 수, 평균/최대 배치 크기 등)."""
+        stats: dict[ModelName, dict[str, float | int]] = {}
+        for name, m in self._models.items():
+            get_stats = getattr(m.detector, "batch_stats", None)
+            if m.loaded and get_stats is not None and (snapshot := get_stats()) is not None:
+                stats[name] = snapshot
+        return stats
+
+    def unload_idle(self, idle_seconds: float) -> list[ModelName]:
+        return [name for name, m in self._models.items() if m.unload_if_idle(idle_seconds)]
+
+    def start_idle_unloader(self, idle_seconds: float):
+        """idle_seconds 동안 쓰이지 않은 모델을 주기적으로 해제하는 백그라운드 스레드 시작."""
+        if idle_seconds <= 0 or self._idle_unloader is not None:
+            return
+
+        def loop():
+            interval = min(max(idle_seconds / 2, 1.0), 60.0)
+            while True:
+                time.sleep(interval)
+                try:
+                    self.unload_idle(idle_seconds)
+                except Exception as e:
+                    print(f"[WARN] Idle model unload failed: {e}")
+
+        self._idle_unloader = threading.Thread(target=loop, name="model_idle_unloader", daemon=True)
+        self._idle_unloader.start()
+
+    def run_fast_mode(
+        self,
+        file_path: Path,
+        on_report: ReportCallback | None = None,
+        completed: Mapping[ModelName, DetectorReport] | None = None,
+        plan: JobPlan | None = None,
+    ) -> FastReportData:
+        """
+        영상 분기(wavelet → rPPG)와 STT 분기를 동시에 실행.
+        on_report는 각 탐지기 결과가 나오는 즉시 호출 스레드에서 호출된다
+        (DB 세션 등 스레드 비안전 객체를 콜백에서 그대로 사용 가능).
+        completed(재시도 시 체크포인트에서 복원한 리포트)에 있는 탐지기는 실행하지 않는다.
+        plan(services.job_plan)이 있으면 디코딩 해상도 / 구간을 계획대로 제한한다.
+        """
+        done: queue.Queue[DetectorReport | BaseException] = queue.Queue()
+        completed = completed or {}
+        # 한 분기가 실패하면 다른 분기는 다음 탐지기를 시작하지 않음
+        cancelled = threading.Event()
+
+        def run(model: LazyModel[Any]) -> DetectorReport:
+            if model.name in completed:
+                print(f"[PIPELINE] {model.name} restored from checkpoint.")
+                return completed[model.name]
+            with model.use() as detector:
+                return detector.analyze(file_path, media)
+
+        def branch(*steps: Callable[[], DetectorReport]):
+            try:
+                for step in steps:
+                    if cancelled.is_set():
+                        return
+                    done.put(step())
+            except BaseException as e:
+                done.put(e)
+
+        reports: dict[ModelName, DetectorReport] = {}
+        from ddp_backend.detectors import MediaContext
+
+        # 영상/오디오 디코딩은 MediaContext에서 1회만 수행하고 각 탐지기가 공유
+        with MediaContext(file_path, plan=plan) as media:
+            pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fast_mode")
+            try:
+                print(f"[PIPELINE] Starting fast mode: {file_path}")
+                # 분기 스레드에서도 같은 작업 trace에 기록되도록 context 전달
+                submit_in_context(
+                    pool,
+                    branch,
+                    lambda: run(self._wavelet),
+                    lambda: run(self._r_ppg),
+                )
+                submit_in_context(pool, branch, lambda: run(self._stt))
+
+                while len(reports) < 3:
+                    item = done.get()
+                    if isinstance(item, BaseException):
+                        raise item
+                    print(f"[PIPELINE] {item.model_name} done.")
+                    reports[item.model_name] = item
+                    if on_report is not None:
+                        on_report(item)
+            except BaseException:
+                cancelled.set()
+                raise
+            finally:
+                # MediaContext를 해제하기 전에 분기 종료를 기다림
+                # (실행 중인 탐지기는 중단할 수 없으므로 현재 탐지기까지만 마치고 종료)
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        wavelet_report = reports[ModelName.WAVELET]
+        r_ppg_report = reports[ModelName.R_PPG]
+        stt_report = reports[ModelName.STT]
+        assert isinstance(wavelet_report, VideoReport)
+        assert isinstance(r_ppg_report, VideoReport)
+        assert isinstance(stt_report, STTReport)
 
         if wavelet_report.content is None or r_ppg_report.content is None:
             raise RuntimeError("Content is empty.")
@@ -53,11 +316,65 @@ class DetectionPipeline:
             ),
         )
 
-    def run_deep_mode(self, file_path: Path) -> DeepReportData:
-        unite_report = self.unite_detector.analyze(file_path)
+    def run_deep_mode(
+        self, file_path: Path, media: MediaContext | None = None, plan: JobPlan | None = None
+    ) -> DeepReportData:
+        if media is None and plan is not None:
+            from ddp_backend.detectors import MediaContext
+
+            with MediaContext(file_path, plan=plan) as own_media:
+                return self.run_deep_mode(file_path, own_media)
+        with self._unite.use() as unite:
+            unite_report = unite.analyze(file_path, media)
         if unite_report.content is None:
             raise RuntimeError("Content is empty")
         return DeepReportData(
             unite_result=unite_report.content.result,
             unite_conf=unite_report.content.confidence_score
-        )
\ No newline at end of file
+        )
+
+    def run_auto_mode(
+        self,
+        file_path: Path,
+        on_report: ReportCallback | None = None,
+        completed: Mapping[ModelName, DetectorReport] | None = None,
+        plan: JobPlan | None = None,
+    ) -> AutoReportData:
+        """
+        Cascade: wavelet 점수를 먼저 계산하고, REAL 확률이
+        auto_uncertain_band 안에 들어오는 애매한 경우에만 UNITE(deep)를 실행.
+        wavelet 결과는 on_report로 넘기고, completed에 있으면 다시 계산하지 않는다.
+        """
+        completed = completed or {}
+        low, high = self.auto_uncertain_band
+        from ddp_backend.detectors import MediaContext
+
+        with MediaContext(file_path, plan=plan) as media:
+            restored = completed.get(ModelName.WAVELET)
+            if isinstance(restored, VideoReport):
+                print("[PIPELINE] wavelet restored from checkpoint (auto).")
+                wavelet_report = restored
+            else:
+                print(f"[PIPELINE] Starting wavelet analysis (auto): {file_path}")
+                with self._wavelet.use() as wavelet:
+                    wavelet_report = wavelet.analyze(file_path, media)
+                if on_report is not None:
+                    on_report(wavelet_report)
+            if wavelet_report.content is None:
+                raise RuntimeError("Content is empty.")
+            prob = wavelet_report.content.probability
+            report = AutoReportData(
+                freq_result=wavelet_report.content.result,
+                freq_conf=wavelet_report.content.confidence_score,
+                freq_image=wavelet_report.content.visual_report,
+                escalated=low <= prob <= high,
+            )
+            if not report.escalated:
+                print(f"[PIPELINE] Wavelet prob {prob:.3f} outside [{low}, {high}]. Skip UNITE.")
+                return report
+
+            print(f"[PIPELINE] Wavelet prob {prob:.3f} ambiguous. Escalating to UNITE.")
+            deep_report = self.run_deep_mode(file_path, media)
+            report.unite_result = deep_report.unite_result
+            report.unite_conf = deep_report.unite_conf
+            return report
@@ -0,0 +1,119 @@
+"""
+작업 비용 모델 (pre-flight 계획)
+
+추론 전에 영상을 probe해 길이 / 해상도 / fps / 코덱을 확인하고,
+작업 하나가 JOB_COMPUTE_BUDGET_S 안에 끝나도록 탐지기별 샘플링 파라미터를 고른다.
+
+- 디코딩 해상도: 긴 변을 JOB_DECODE_MAX_SIDE 이하로 축소 (4K 디코딩/얼굴 검출 비용 절감)
+- wavelet: 균등 샘플링 프레임 수 (기본 64, 최소 16)
+- rPPG: 연속 분석 구간 (영상 중앙 기준, 최소 10초)
+- STT: 앞에서부터 전사할 오디오 길이 (최소 60초)
+- UNITE: fps 정규화/클립 추론 구간 (영상 중앙 기준, 최소 10초)
+
+fast 모드는 영상 분기(wavelet → rPPG)와 STT 분기가 동시에 돌기 때문에 분기마다 예산 전체를 쓴다.
+처리 속도 계수는 CPU 기준 보수적 추정치다.
+"""
+
+from pathlib import Path
+
+from ddp_backend.core.config import settings
+from ddp_backend.schemas.enums import AnalyzeMode, ModelName
+from ddp_backend.schemas.plan import JobPlan, MediaInfo
+
+__all__ = ["plan_job", "build_plan"]
+
+_TARGET_FPS = 30  # MediaContext 정규화 fps
+
+# 처리 속도 계수 (초)
+_DECODE_S_PER_MPIX_FRAME = 0.004  # 순차 디코딩 + 색 변환, 1 메가픽셀 프레임당
+_SEEK_S_PER_MPIX_FRAME = 0.03     # seek 후 키프레임부터 디코딩, 1 메가픽셀 프레임당
+_WAVELET_S_PER_FRAME = 0.25       # 얼굴 검출 + 정렬 + TTA 4 view 추론
+_RPPG_S_PER_FRAME = 0.04          # 프레임별 얼굴 분할 + EfficientPhys
+_STT_S_PER_AUDIO_S = 0.15         # Whisper(base/int8) + 구간별 키워드 분석
+_UNITE_S_PER_VIDEO_S = 0.5        # fps 정규화 + 클립 디코딩 + 추론
+
+# 샘플링 범위
+_WAVELET_MAX_FRAMES = 64
+_WAVELET_MIN_FRAMES = 16
+_RPPG_MIN_SPAN_S = 10.0
+_STT_MIN_WINDOW_S = 60.0
+_UNITE_MIN_SPAN_S = 10.0
+
+
+def _centered(duration: float, length: float) -> tuple[float, float] | None:
+    if length >= duration:
+        return None
+    start = (duration - length) / 2
+    return round(start, 3), round(start + length, 3)
+
+
+def build_plan(info: MediaInfo, mode: AnalyzeMode, budget_s: float | None = None) -> JobPlan:
+    """probe 결과와 모드로 샘플링 계획 수립. 최소 샘플링으로도 예산을 넘으면 within_budget=False."""
+    budget = settings.JOB_COMPUTE_BUDGET_S if budget_s is None else budget_s
+    duration = info.duration_s
+
+    long_side = max(info.width, info.height)
+    max_side = settings.JOB_DECODE_MAX_SIDE if long_side > settings.JOB_DECODE_MAX_SIDE > 0 else None
+    scale = max_side / long_side if max_side is not None else 1.0
+    mpix = info.width * info.height * scale * scale / 1e6
+
+    plan = JobPlan(media=info, budget_s=budget, decode_max_side=max_side)
+    estimated: dict[str, float] = {}
+    video_budget = budget
+
+    if mode in (AnalyzeMode.FAST, AnalyzeMode.AUTO):
+        per_frame = _WAVELET_S_PER_FRAME + _SEEK_S_PER_MPIX_FRAME * mpix
+        frames = _WAVELET_MAX_FRAMES
+        if mode == AnalyzeMode.FAST:
+            # rPPG는 구간 내 모든 프레임을 순차 디코딩 + 분석
+            rppg_per_s = info.fps * _DECODE_S_PER_MPIX_FRAME * mpix + _TARGET_FPS * _RPPG_S_PER_FRAME
+            rppg_span = min(duration, max((budget - frames * per_frame) / rppg_per_s, _RPPG_MIN_SPAN_S))
+            # 최소 rPPG 구간으로도 넘치면 wavelet 프레임 수를 줄임
+            frames = int(min(frames, max((budget - rppg_span * rppg_per_s) / per_frame, _WAVELET_MIN_FRAMES)))
+            plan.rppg_span_s = _centered(duration, rppg_span)
+            estimated[ModelName.R_PPG] = round(rppg_span * rppg_per_s, 1)
+        plan.wavelet_frames = frames
+        estimated[ModelName.WAVELET] = round(frames * per_frame, 1)
+        video_budget = budget - estimated[ModelName.WAVELET] - estimated.get(ModelName.R_PPG, 0.0)
+
+    if mode == AnalyzeMode.FAST:
+        if info.audio_codec is not None:
+            window = min(duration, max(budget / _STT_S_PER_AUDIO_S, _STT_MIN_WINDOW_S))
+            plan.stt_window_s = round(window, 3) if window < duration else None
+            estimated[ModelName.STT] = round(window * _STT_S_PER_AUDIO_S, 1)
+        else:
+            estimated[ModelName.STT] = 0.0
+
+    if mode in (AnalyzeMode.DEEP, AnalyzeMode.AUTO):
+        # auto는 에스컬레이션될 때만 UNITE를 돌리지만 wavelet 이후 남은 예산 안에 들어오도록 계획
+        span = min(duration, max(video_budget / _UNITE_S_PER_VIDEO_S, _UNITE_MIN_SPAN_S))
+        plan.unite_span_s = _centered(duration, span)
+        estimated[ModelName.UNITE] = round(span * _UNITE_S_PER_VIDEO_S, 1)
+
+    plan.estimated_s = estimated
+    # fast 모드는 영상 분기와 STT 분기가 병렬
+    video_total = sum(v for k, v in estimated.items() if k != ModelName.STT)
+    plan.within_budget = max(video_total, estimated.get(ModelName.STT, 0.0)) <= budget
+    return plan
+
+
+def plan_job(vid_path: str | Path, mode: AnalyzeMode) -> JobPlan:
+    """영상 probe + 가드레일 확인 + 계획 수립. 분석할 수 없는 영상이면 RuntimeError."""
+    # detectors는 cv2를 import하므로 API 서버에서 불러오지 않도록 지연 import
+    from ddp_backend.detectors import probe_media
+
+    info = probe_media(vid_path)
+    if info.duration_s <= 0 or info.width <= 0 or info.height <= 0:
+        raise RuntimeError(f"Could not probe video stream: {info}")
+    if 0 < settings.JOB_MAX_SOURCE_DURATION_S < info.duration_s:
+        raise RuntimeError(
+            f"Video is too long ({info.duration_s:.0f}s > {settings.JOB_MAX_SOURCE_DURATION_S:.0f}s)."
+        )
+    plan = build_plan(info, mode)
+    print(
+        f"[PLAN] {mode}: {info.width}x{info.height}@{info.fps:.1f} {info.duration_s:.1f}s "
+        f"({info.video_codec}/{info.audio_codec}) → max_side={plan.decode_max_side} "
+        f"wavelet={plan.wavelet_frames} rppg={plan.rppg_span_s} stt={plan.stt_window_s} "
+        f"unite={plan.unite_span_s} est={plan.estimated_s}"
+    )
+    return plan
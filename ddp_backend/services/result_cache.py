@@ -0,0 +1,108 @@
+"""
+콘텐츠 해시 기반 분석 결과 캐시
+
+같은 영상(바이트 단위 동일)이 여러 사용자에게서 들어오면 추론을 다시 돌리지 않고
+저장된 리포트(및 S3 리포트 이미지 key)를 복제한다.
+키: (sha256, 분석 모드, 모델 버전) — 체크포인트가 바뀌면 모델 버전이 달라져 자동으로 miss.
+"""
+
+from pydantic import BaseModel
+from redis import Redis
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.orm.session import Session
+
+from ddp_backend.core.config import REDIS_URL, settings
+from ddp_backend.models import DetectionCache
+from ddp_backend.schemas.enums import AnalyzeMode
+from ddp_backend.schemas.enums import Result as ResultEnum
+from ddp_backend.services.crud import CRUDDetectionCache
+
+__all__ = ["ResultCache", "result_cache"]
+
+_STATS_KEY = "detection_cache:stats"
+
+
+class ResultCache:
+    def __init__(self, redis: Redis, enabled: bool = True):
+        self.redis = redis
+        self.enabled = enabled
+
+    def _count(self, mode: AnalyzeMode, field: str):
+        try:
+            self.redis.hincrby(_STATS_KEY, f"{mode}:{field}", 1)
+        except Exception as e:
+            print(f"[WARN] Result cache metric update failed: {e}")
+
+    def lookup(
+        self,
+        db: Session,
+        content_hash: str | None,
+        mode: AnalyzeMode,
+        model_version: str,
+    ) -> DetectionCache | None:
+        if not self.enabled or content_hash is None:
+            return None
+        cached = CRUDDetectionCache.get(db, content_hash, mode, model_version)
+        if cached is None:
+            self._count(mode, "misses")
+            return None
+        self._count(mode, "hits")
+        CRUDDetectionCache.increment_hit(db, cached)
+        return cached
+
+    def store(
+        self,
+        db: Session,
+        content_hash: str | None,
+        mode: AnalyzeMode,
+        model_version: str,
+        total_result: ResultEnum,
+        report: BaseModel,
+    ):
+        if not self.enabled or content_hash is None:
+            return
+        try:
+            CRUDDetectionCache.create(
+                db,
+                DetectionCache(
+                    content_hash=content_hash,
+                    analysis_mode=mode,
+                    model_version=model_version,
+                    total_result=total_result,
+                    report=report.model_dump(mode="json"),
+                ),
+            )
+        except IntegrityError:
+            # 같은 영상이 동시에 분석된 경우 먼저 저장된 항목 유지
+            db.rollback()
+
+    def purge_stale(self, db: Session, versions: dict[AnalyzeMode, str]) -> int:
+        """현재 모델 버전과 다른 캐시 항목 삭제 (core.model.purge_stale_cache 유지보수 명령에서 호출)"""
+        removed = 0
+        for mode, version in versions.items():
+            removed += CRUDDetectionCache.delete_stale(db, mode, version)
+        return removed
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """모드별 hits / misses / hit_rate"""
+        try:
+            raw: dict[bytes, bytes] = self.redis.hgetall(_STATS_KEY)  # type: ignore
+        except Exception:
+            return {}
+        result: dict[str, dict[str, float]] = {}
+        for mode in AnalyzeMode:
+            hits = int(raw.get(f"{mode}:hits".encode(), 0))
+            misses = int(raw.get(f"{mode}:misses".encode(), 0))
+            total = hits + misses
+            result[str(mode)] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / total if total else 0.0,
+            }
+        return result
+
+
+result_cache = ResultCache(
+    Redis.from_url(REDIS_URL if REDIS_URL is not None else "", db=1),
+    enabled=settings.RESULT_CACHE_ENABLED,
+)
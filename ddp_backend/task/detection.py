@@ -1,163 +1,553 @@
+import asyncio
+import contextvars
+import json
+import time
 import uuid
+from collections.abc import AsyncIterator, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
 import traceback
 
-from redis import Redis
+from redis.asyncio import Redis
 from sqlmodel.orm.session import Session
-from taskiq import TaskiqDepends
+from taskiq import Context, TaskiqDepends
 
-from ddp_backend.core.database import get_db
-from ddp_backend.core.model import detection_pipeline
+from ddp_backend.core.config import settings
+from ddp_backend.core.database import get_db, get_db_ctx
+from ddp_backend.core.model import get_detection_pipeline
 from ddp_backend.core.redis_bridge import NOTIFY_CHANNEL, REDIS_URL
-from ddp_backend.core.s3 import download_video_from_s3
-from ddp_backend.core.tk_broker import broker
-from ddp_backend.models import DeepReport, FastReport, Result
-from ddp_backend.schemas.message import WorkerResultMessage
-from ddp_backend.schemas.enums import VideoStatus
+from ddp_backend.core.queue_stats import queue_stats
+from ddp_backend.core.prefetch import fetch_video
+from ddp_backend.core.tk_broker import broker, deep_broker, serving_modes
+from ddp_backend.core.tracing import JobTrace, span, start_trace
+from ddp_backend.services.admission import admission
+from ddp_backend.services.checkpoint import stage_checkpoints
+from ddp_backend.services.job_plan import plan_job
+from ddp_backend.services.detect_pipeline import DetectorReport, ReportCallback
+from ddp_backend.services.result_cache import result_cache
+from ddp_backend.models import (
+    AutoReport,
+    DeepReport,
+    FastReport,
+    PartialReport,
+    Result,
+    Source,
+)
+from ddp_backend.schemas.message import WorkerPartialMessage, WorkerResultMessage
+from ddp_backend.schemas.plan import JobPlan
+from ddp_backend.schemas.enums import AnalyzeMode, ModelName, VideoStatus
+from ddp_backend.schemas.enums import Result as ResultEnum
+from ddp_backend.schemas.report import (
+    AutoReportData,
+    DeepReportData,
+    FastReportData,
+    ProbabilityContent,
+    STTReport,
+    STTScript,
+    VisualContent,
+)
 from ddp_backend.services.crud import (
+    CRUDAutoReport,
     CRUDDeepReport,
     CRUDFastReport,
+    CRUDPartialReport,
     CRUDResult,
     CRUDSource,
     CRUDVideo,
 )
 
+type ReportData = FastReportData | DeepReportData | AutoReportData
+# (소스, 영상 경로, 작업 계획, 체크포인트에서 복원한 단계 리포트, 단계 완료 콜백) → 모드별 리포트
+type Infer[R] = Callable[[Source, Path, JobPlan, Mapping[ModelName, DetectorReport], ReportCallback], R]
+
 _redis = Redis.from_url(REDIS_URL if REDIS_URL is not None else "", db=1)
 
+# reaper가 같은 인자(progressive 등)로 다시 enqueue할 수 있도록 원래 인자 보관
+_JOB_ARGS_KEY = "detection:job_args:{video_id}"
+_JOB_ARGS_TTL_S = 24 * 3600
 
-def publish_notification(msg: WorkerResultMessage):
+# 모드별 워커 내 동시 추론 수 제한 (deep / auto는 UNITE를 쓰므로 같은 슬롯 공유)
+# 슬롯은 다운로드 이후에 잡으므로, 추론 중에도 다음 작업의 S3 다운로드가 진행된다.
+_deep_slots = asyncio.Semaphore(settings.DEEP_WORKER_CONCURRENCY)
+_MODE_SLOTS: dict[AnalyzeMode, asyncio.Semaphore] = {
+    AnalyzeMode.FAST: asyncio.Semaphore(settings.FAST_WORKER_CONCURRENCY),
+    AnalyzeMode.DEEP: _deep_slots,
+    AnalyzeMode.AUTO: _deep_slots,
+}
+
+# CPU/GPU 추론 전용 executor (이벤트 루프는 I/O만 담당)
+_inference_executor = ThreadPoolExecutor(
+    max_workers=settings.INFERENCE_EXECUTOR_WORKERS
+    or settings.FAST_WORKER_CONCURRENCY + settings.DEEP_WORKER_CONCURRENCY,
+    thread_name_prefix="inference",
+)
+
+
+@asynccontextmanager
+async def _job_slot(mode: AnalyzeMode, context: Context) -> AsyncIterator[None]:
+    """
+    모드별 동시 실행 슬롯 확보 후 큐 대기 시간 기록.
+    deep / auto 작업은 같은 프로세스가 fast 큐도 처리할 때만, fast 큐에 대기 작업이 있으면
+    슬롯을 잡기 전에 먼저 양보한다 (양보하는 동안 슬롯을 비워 둬 다른 deep 작업이 막히지 않도록).
+    """
+    slots = _MODE_SLOTS[mode]
+    with span("slot_wait"):
+        if (
+            mode != AnalyzeMode.FAST
+            and settings.DEEP_YIELD_MAX_WAIT_S > 0
+            and AnalyzeMode.FAST in serving_modes()
+        ):
+            waited = await asyncio.to_thread(
+                queue_stats.wait_for_fast_backlog, settings.DEEP_YIELD_MAX_WAIT_S
+            )
+            if waited >= 1:
+                print(f"[TASK] {mode} job yielded {waited:.1f}s to fast backlog", flush=True)
+        await slots.acquire()
     try:
-        _redis.publish(NOTIFY_CHANNEL, msg.model_dump_json())
+        enqueued_at = context.message.labels.get("enqueued_at")
+        if enqueued_at is not None:
+            await asyncio.to_thread(queue_stats.record_wait, mode, time.time() - float(enqueued_at))
+        yield
+    finally:
+        slots.release()
+
+
+def _beat(video_id: uuid.UUID):
+    # 작업 세션은 추론 스레드가 쓰고 있으므로 별도 세션 사용
+    with get_db_ctx() as db:
+        CRUDVideo.heartbeat(db, video_id)
+
+
+@asynccontextmanager
+async def _heartbeat(video_id: uuid.UUID) -> AsyncIterator[None]:
+    """작업이 살아 있는 동안 Video.heartbeat_at을 주기적으로 갱신 (reaper가 멈춘 작업을 판별)."""
+
+    async def loop():
+        while True:
+            await asyncio.sleep(settings.JOB_HEARTBEAT_INTERVAL_S)
+            try:
+                await asyncio.to_thread(_beat, video_id)
+            except Exception as e:
+                print(f"[WARN] Heartbeat failed for video_id={video_id}: {e}")
+
+    task = asyncio.create_task(loop())
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
+async def publish_notification(msg: WorkerResultMessage | WorkerPartialMessage):
+    try:
+        await _redis.publish(NOTIFY_CHANNEL, msg.model_dump_json())
     except Exception as e:
         print(f"[WARN] Redis publish failed: {e}")
 
 
-@broker.task
-def predict_deepfake_fast(
-    video_id: uuid.UUID,
-    db: Session = TaskiqDepends(get_db),
-) -> uuid.UUID | None:
-    print(f"[TASK] predict_deepfake_fast started for video_id={video_id}", flush=True)
-    src = CRUDSource.get_by_video(db, video_id)
-    if src is None:
-        video_check = CRUDVideo.get_by_id(db, video_id)
-        print(f"[TASK] Source not found. Video exists in DB: {video_check is not None}", flush=True)
-        return None
+async def run_inference[T](fn: Callable[..., T], *args: object) -> T:
+    """블로킹 추론을 추론 전용 executor에서 실행 (작업 trace context 전달)."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_inference_executor, ctx.run, fn, *args)
 
-    with TemporaryDirectory() as temp_dir:
-        print(f"[TASK] Downloading from S3: {src.s3_path}", flush=True)
-        temp_path = download_video_from_s3(src.s3_path, Path(temp_dir))
-        print(f"[TASK] Download complete: {temp_path}", flush=True)
-        CRUDVideo.update_status(db, src.video_id, VideoStatus.PROCESSING)
-
-        try:
-            output = detection_pipeline.run_fast_mode(temp_path)
-        except Exception:
-            CRUDVideo.update_status(db, src.video_id, VideoStatus.FAILED)
-            tb = traceback.format_exc()
-            print(f"[ERROR] predict_deepfake_fast failed:\n{tb}")
-            publish_notification(
-                WorkerResultMessage(
-                    user_id=src.video.user_id,
-                    result_id=None,
-                    error_msg=tb,
-                )
-            )
-            return None
-
-        """
-        total_result: ResultEnum
-        if output.freq_conf > output.rppg_conf:
-            total_result = output.freq_result
-        elif output.freq_conf < output.rppg_conf:
-            total_result = output.rppg_result
-        else:
-            total_result = ResultEnum.UNKNOWN
-        """
-        total_result = output.freq_result
 
+async def _end_partial_stream(user_id: uuid.UUID, video_id: uuid.UUID, failed: bool):
+    """progressive 모드: 중간 결과 스트림 종료 알림."""
+    await publish_notification(
+        WorkerPartialMessage(user_id=user_id, video_id=video_id, done=True, failed=failed)
+    )
+
+
+def _to_partial_report(
+    user_id: uuid.UUID, video_id: uuid.UUID, report: DetectorReport
+) -> PartialReport:
+    partial = PartialReport(
+        user_id=user_id, video_id=video_id, model_name=report.model_name
+    )
+    if isinstance(report, STTReport):
+        partial.stt_risk_level = report.risk_level
+        partial.stt_script = STTScript(
+            keywords=report.keywords,
+            risk_reason=report.risk_reason,
+            transcript=report.transcript,
+            search_results=report.search_results,
+        )
+        return partial
+    if isinstance(report.content, ProbabilityContent):
+        partial.result = report.content.result
+        partial.conf = report.content.confidence_score
+    if isinstance(report.content, VisualContent):
+        partial.image = report.content.visual_report
+    return partial
+
+
+def _save_result(
+    db: Session,
+    src: Source,
+    mode: AnalyzeMode,
+    total_result: ResultEnum,
+    output: ReportData,
+    trace: JobTrace | None = None,
+    plan: JobPlan | None = None,
+) -> uuid.UUID:
+    """Result + 모드별 리포트 저장 및 완료 상태 갱신 (알림 발행은 호출 측에서)."""
+    with CRUDResult.atomic(db):
         result = CRUDResult.create(
             db,
             Result(
                 user_id=src.video.user_id,
                 video_id=src.video.video_id,
                 total_result=total_result,
-                is_fast=True,
-            ),
-        )
-        CRUDFastReport.create(
-            db,
-            FastReport(
-                user_id=src.video.user_id,
-                result_id=result.result_id,
-                **output.model_dump(),
+                is_fast=mode == AnalyzeMode.FAST,
+                timings=trace.summary() if trace is not None else None,
+                plan=plan.model_dump(mode="json") if plan is not None else None,
             ),
         )
+        match output:
+            case FastReportData():
+                CRUDFastReport.create(
+                    db,
+                    FastReport(
+                        user_id=src.video.user_id,
+                        result_id=result.result_id,
+                        **output.model_dump(),
+                    ),
+                )
+                CRUDPartialReport.delete_by_video(db, src.video_id)
+            case DeepReportData():
+                CRUDDeepReport.create(
+                    db,
+                    DeepReport(
+                        user_id=src.video.user_id,
+                        result_id=result.result_id,
+                        **output.model_dump(),
+                    ),
+                )
+            case AutoReportData():
+                CRUDAutoReport.create(
+                    db,
+                    AutoReport(
+                        user_id=src.video.user_id,
+                        result_id=result.result_id,
+                        **output.model_dump(),
+                    ),
+                )
+        stage_checkpoints.clear(db, src.video_id)
         CRUDVideo.update_status(db, src.video_id, VideoStatus.COMPLETED)
-        publish_notification(
-            WorkerResultMessage(
-                user_id=src.video.user_id,
-                result_id=result.result_id,
-            )
-        )
-        return result.result_id
+    return result.result_id
 
 
-@broker.task()
-def predict_deepfake_deep(
-    video_id: uuid.UUID,
-    db: Session = TaskiqDepends(get_db),
+_REPORT_DATA: dict[AnalyzeMode, type[ReportData]] = {
+    AnalyzeMode.FAST: FastReportData,
+    AnalyzeMode.DEEP: DeepReportData,
+    AnalyzeMode.AUTO: AutoReportData,
+}
+
+
+def _reuse_cached_result(
+    db: Session, src: Source, mode: AnalyzeMode, model_version: str, trace: JobTrace
 ) -> uuid.UUID | None:
-    print(f"[TASK] predict_deepfake_deep started for video_id={video_id}", flush=True)
+    """같은 영상 + 같은 모델 버전의 결과가 있으면 추론 없이 복제 (리포트 이미지 key 공유)."""
+    cached = result_cache.lookup(db, src.content_hash, mode, model_version)
+    if cached is None:
+        return None
+    print(f"[TASK] Result cache hit for video_id={src.video_id} ({mode})", flush=True)
+    output = _REPORT_DATA[mode].model_validate(cached.report)
+    return _save_result(db, src, mode, cached.total_result, output, trace)
+
+
+def _existing_result(db: Session, video_id: uuid.UUID) -> uuid.UUID | None:
+    """이미 결과가 저장된 영상이면 result_id (재전달 / 재시도된 작업은 다시 실행하지 않음)."""
+    result = CRUDResult.get_by_video_id(db, video_id)
+    if result is None:
+        return None
+    CRUDVideo.update_status(db, video_id, VideoStatus.COMPLETED)
+    return result.result_id
+
+
+def _save_checkpoint(db: Session, video_id: uuid.UUID, versions: dict[ModelName, str], report: DetectorReport):
+    try:
+        stage_checkpoints.save(db, video_id, versions[report.model_name], report)
+    except Exception as e:
+        db.rollback()
+        print(f"[WARN] Checkpoint save failed ({report.model_name}): {e}")
+
+
+def _load_source(db: Session, video_id: uuid.UUID) -> Source | None:
     src = CRUDSource.get_by_video(db, video_id)
     if src is None:
-        print(f"[TASK] Source not found for video_id={video_id}", flush=True)
+        video_check = CRUDVideo.get_by_id(db, video_id)
+        print(f"[TASK] Source not found. Video exists in DB: {video_check is not None}", flush=True)
         return None
+    _ = src.video  # 관계 로드를 DB 스레드에서 끝내 둠
+    return src
 
-    with TemporaryDirectory() as temp_dir:
-        print(f"[TASK] Downloading from S3: {src.s3_path}")
-        temp_path = download_video_from_s3(src.s3_path, Path(temp_dir))
-        print(f"[TASK] Download complete: {temp_path}")
-        CRUDVideo.update_status(db, src.video_id, VideoStatus.PROCESSING)
-
-        try:
-            output = detection_pipeline.run_deep_mode(temp_path)
-        except Exception:
-            CRUDVideo.update_status(db, src.video_id, VideoStatus.FAILED)
-            tb = traceback.format_exc()
-            print(f"[ERROR] predict_deepfake_deep failed:\n{tb}")
-            publish_notification(
-                WorkerResultMessage(
-                    user_id=src.video.user_id,
-                    result_id=None,
-                    error_msg=tb,
+
+class _ClaimedElsewhere(Exception):
+    """다른 워커가 같은 영상을 처리 중 (이 호출은 작업을 가져오지 못함)."""
+
+
+async def _run_job[R: ReportData](
+    mode: AnalyzeMode,
+    video_id: uuid.UUID,
+    db: Session,
+    context: Context,
+    infer: Infer[R],
+    total_result_of: Callable[[R], ResultEnum],
+    progressive: bool = False,
+) -> uuid.UUID | None:
+    """
+    모드 공통 작업 흐름.
+    DB / S3는 asyncio.to_thread, 추론은 추론 전용 executor에서 실행해 이벤트 루프를 막지 않는다.
+    구간별 소요 시간은 Result.timings에 저장된다.
+    """
+    release = True
+    try:
+        with start_trace(str(mode)) as trace:
+            try:
+                return await _traced_job(
+                    mode, video_id, db, context, infer, total_result_of, trace, progressive
                 )
+            except _ClaimedElsewhere:
+                # 진행 중 작업 기록은 실제로 처리 중인 워커가 끝날 때 해제
+                release = False
+                return None
+    finally:
+        # 이 호출이 끝낸 작업(성공 / 실패 / 스킵)만 사용자 진행 중 작업 한도에서 제외
+        if release:
+            await asyncio.to_thread(admission.release, video_id)
+
+
+async def _traced_job[R: ReportData](
+    mode: AnalyzeMode,
+    video_id: uuid.UUID,
+    db: Session,
+    context: Context,
+    infer: Infer[R],
+    total_result_of: Callable[[R], ResultEnum],
+    trace: JobTrace,
+    progressive: bool = False,
+) -> uuid.UUID | None:
+    print(f"[TASK] predict_deepfake_{mode} started for video_id={video_id}", flush=True)
+    existing_id = await asyncio.to_thread(_existing_result, db, video_id)
+    if existing_id is not None:
+        print(f"[TASK] Result already exists for video_id={video_id}. Skip.", flush=True)
+        return existing_id
+    src = await asyncio.to_thread(_load_source, db, video_id)
+    if src is None:
+        trace.failed = True
+        return None
+    user_id = src.video.user_id
+
+    # 모델 버전은 체크포인트 파일 내용 해시일 수 있음 (처음 계산하는 모드면 수 GB 읽기)
+    # → 이벤트 루프를 막지 않도록 스레드에서 계산 (파이프라인 최초 생성도 마찬가지)
+    pipeline = await asyncio.to_thread(get_detection_pipeline)
+    model_version = await asyncio.to_thread(pipeline.model_version, mode)
+    cached_id = await asyncio.to_thread(_reuse_cached_result, db, src, mode, model_version, trace)
+    if cached_id is not None:
+        if progressive:
+            await _end_partial_stream(user_id, video_id, failed=False)
+        await publish_notification(WorkerResultMessage(user_id=user_id, result_id=cached_id))
+        return cached_id
+
+    with TemporaryDirectory() as temp_dir:
+        # 다운로드는 슬롯 밖에서 → 다른 작업이 추론 중이어도 미리 받아 둠
+        # (prefetcher가 이미 staging 해 둔 영상이면 그대로 가져옴)
+        print(f"[TASK] Downloading from S3: {src.s3_path}", flush=True)
+        with span("download"):
+            temp_path = await asyncio.to_thread(fetch_video, src.video_id, src.s3_path, Path(temp_dir))
+        print(f"[TASK] Download complete: {temp_path}", flush=True)
+
+        async with _job_slot(mode, context):
+            claimed = await asyncio.to_thread(
+                CRUDVideo.claim_processing, db, src.video_id, mode, settings.JOB_HEARTBEAT_DEADLINE_S
             )
-            return None
+            if claimed is None:
+                print(f"[TASK] video_id={video_id} is being processed by another worker. Skip.", flush=True)
+                raise _ClaimedElsewhere(video_id)
 
-        result = CRUDResult.create(
-            db,
-            Result(
-                user_id=src.video.user_id,
-                video_id=src.video.video_id,
-                total_result=output.unite_result,
-                is_fast=False,
-            ),
-        )
-        CRUDDeepReport.create(
-            db,
-            DeepReport(
-                user_id=src.video.user_id,
-                result_id=result.result_id,
-                **output.model_dump(),
-            ),
+            # 재시도된 작업이면 완료된 탐지기 단계는 체크포인트에서 복원
+            versions = await asyncio.to_thread(pipeline.stage_versions, mode)
+            completed = await asyncio.to_thread(stage_checkpoints.load, db, src.video_id, versions)
+            if completed:
+                print(f"[TASK] Resuming video_id={video_id} (attempt {claimed.attempts}), done: {list(completed)}", flush=True)
+
+            def on_stage(report: DetectorReport):
+                _save_checkpoint(db, src.video_id, versions, report)
+
+            try:
+                # pre-flight probe: 길이 / 해상도 가드레일 + 탐지기별 샘플링 계획
+                with span("probe"):
+                    plan = await asyncio.to_thread(plan_job, temp_path, mode)
+                started = time.perf_counter()
+                async with _heartbeat(src.video_id):
+                    with span("inference"):
+                        output = await run_inference(infer, src, temp_path, plan, completed, on_stage)
+                # admission control의 대기 시간 추정용
+                await asyncio.to_thread(queue_stats.record_duration, mode, time.perf_counter() - started)
+            except Exception:
+                trace.failed = True
+                tb = traceback.format_exc()
+                print(f"[ERROR] predict_deepfake_{mode} failed:\n{tb}")
+                await asyncio.to_thread(CRUDVideo.update_status, db, src.video_id, VideoStatus.FAILED)
+                # 실패한 작업의 탐지기별 중간 결과는 남기지 않음
+                await asyncio.to_thread(CRUDPartialReport.delete_by_video, db, src.video_id)
+                if progressive:
+                    await _end_partial_stream(user_id, video_id, failed=True)
+                await publish_notification(
+                    WorkerResultMessage(user_id=user_id, result_id=None, error_msg=tb)
+                )
+                return None
+
+    total_result = total_result_of(output)
+    with span("db_write"):
+        result_id = await asyncio.to_thread(
+            _save_result, db, src, mode, total_result, output, trace, plan
         )
-        CRUDVideo.update_status(db, src.video_id, VideoStatus.COMPLETED)
-        publish_notification(
-            WorkerResultMessage(
-                user_id=src.video.user_id,
-                result_id=result.result_id,
-            )
+    if progressive:
+        await _end_partial_stream(user_id, video_id, failed=False)
+    await publish_notification(WorkerResultMessage(user_id=user_id, result_id=result_id))
+    await asyncio.to_thread(
+        result_cache.store, db, src.content_hash, mode, model_version, total_result, output
+    )
+    print(f"[TASK] predict_deepfake_{mode} timings: {trace.summary()}", flush=True)
+    return result_id
+
+
+def _fast_total_result(output: FastReportData) -> ResultEnum:
+    """
+    total_result: ResultEnum
+    if output.freq_conf > output.rppg_conf:
+        total_result = output.freq_result
+    elif output.freq_conf < output.rppg_conf:
+        total_result = output.rppg_result
+    else:
+        total_result = ResultEnum.UNKNOWN
+    """
+    return output.freq_result
+
+
+def _auto_total_result(output: AutoReportData) -> ResultEnum:
+    # 에스컬레이션된 경우 UNITE 판정을 최종 결과로 사용
+    return (
+        output.unite_result
+        if output.escalated and output.unite_result is not None
+        else output.freq_result
+    )
+
+
+@broker.task
+async def predict_deepfake_fast(
+    video_id: uuid.UUID,
+    progressive: bool = False,
+    db: Session = TaskiqDepends(get_db),
+    context: Context = TaskiqDepends(),
+) -> uuid.UUID | None:
+    loop = asyncio.get_running_loop()
+
+    def infer(
+        src: Source,
+        path: Path,
+        plan: JobPlan,
+        completed: Mapping[ModelName, DetectorReport],
+        on_stage: ReportCallback,
+    ) -> FastReportData:
+        def on_report(report: DetectorReport):
+            # 추론 스레드에서 호출: 단계 체크포인트 저장
+            if report.model_name not in completed:
+                on_stage(report)
+            if progressive:
+                # 탐지기별 결과를 즉시 저장하고 WebSocket 알림은 이벤트 루프로 넘김
+                CRUDPartialReport.upsert(
+                    db, _to_partial_report(src.video.user_id, src.video_id, report)
+                )
+                asyncio.run_coroutine_threadsafe(
+                    publish_notification(
+                        WorkerPartialMessage(
+                            user_id=src.video.user_id,
+                            video_id=src.video_id,
+                            model_name=report.model_name,
+                            report=report.model_dump(mode="json"),
+                        )
+                    ),
+                    loop,
+                )
+
+        return get_detection_pipeline().run_fast_mode(
+            path, on_report=on_report, completed=completed, plan=plan
         )
-        return result.result_id
+
+    return await _run_job(
+        AnalyzeMode.FAST, video_id, db, context, infer, _fast_total_result, progressive
+    )
+
+
+@deep_broker.task()
+async def predict_deepfake_deep(
+    video_id: uuid.UUID,
+    db: Session = TaskiqDepends(get_db),
+    context: Context = TaskiqDepends(),
+) -> uuid.UUID | None:
+    return await _run_job(
+        AnalyzeMode.DEEP,
+        video_id,
+        db,
+        context,
+        # UNITE 단일 단계라 복원할 중간 결과가 없음
+        lambda _src, path, plan, _completed, _on_stage: get_detection_pipeline().run_deep_mode(
+            path, plan=plan
+        ),
+        lambda output: output.unite_result,
+    )
+
+
+@deep_broker.task()
+async def predict_deepfake_auto(
+    video_id: uuid.UUID,
+    db: Session = TaskiqDepends(get_db),
+    context: Context = TaskiqDepends(),
+) -> uuid.UUID | None:
+    return await _run_job(
+        AnalyzeMode.AUTO,
+        video_id,
+        db,
+        context,
+        lambda _src, path, plan, completed, on_stage: get_detection_pipeline().run_auto_mode(
+            path, on_report=on_stage, completed=completed, plan=plan
+        ),
+        _auto_total_result,
+    )
+
+
+async def enqueue_detection(video_id: uuid.UUID, mode: AnalyzeMode, progressive: bool = False):
+    """
+    모드별 큐에 탐지 작업 등록.
+    enqueue 시각(대기 시간 측정)과 video_id(워커 prefetch)를 label로 기록.
+    reaper가 재등록할 때 쓰도록 원래 인자(mode, progressive)를 Redis에 보관.
+    """
+    labels = {"enqueued_at": time.time(), "video_id": str(video_id)}
+    await _redis.set(
+        _JOB_ARGS_KEY.format(video_id=video_id),
+        json.dumps({"mode": str(mode), "progressive": progressive}),
+        ex=_JOB_ARGS_TTL_S,
+    )
+    match mode:
+        case AnalyzeMode.FAST:
+            await predict_deepfake_fast.kicker().with_labels(**labels).kiq(video_id, progressive)
+        case AnalyzeMode.DEEP:
+            await predict_deepfake_deep.kicker().with_labels(**labels).kiq(video_id)
+        case AnalyzeMode.AUTO:
+            await predict_deepfake_auto.kicker().with_labels(**labels).kiq(video_id)
+
+
+async def requeue_detection(video_id: uuid.UUID, mode: AnalyzeMode):
+    """reaper용: 처음 enqueue할 때의 인자로 다시 등록 (기록이 없으면 mode, progressive=False)."""
+    progressive = False
+    raw = await _redis.get(_JOB_ARGS_KEY.format(video_id=video_id))
+    if raw is not None:
+        args = json.loads(raw)
+        mode = AnalyzeMode(args["mode"])
+        progressive = bool(args.get("progressive", False))
+    await enqueue_detection(video_id, mode, progressive)
@@ -7,7 +7,7 @@ import uuid
 from pathlib import Path
 
 from ddp_backend.core.database import get_db_ctx
-from ddp_backend.core.s3 import upload_file_to_s3
+from ddp_backend.core.s3 import upload_file_to_s3_hashed
 from ddp_backend.models.models import Source
 from ddp_backend.schemas.enums import VideoStatus
 from ddp_backend.services.crud import CRUDSource, CRUDVideo
@@ -108,7 +108,7 @@ def upload_youtube_video(video_id: uuid.UUID) -> None:
             _download_youtube_to_path(str(video.source_url), local_path)
             # ✅ S3 업로드 / Source upsert
             with open(local_path, "rb") as f:
-                s3_key = upload_file_to_s3(
+                s3_key, content_hash = upload_file_to_s3_hashed(
                     f,
                     f"raw/{video_id}.mp4",
                     content_type="video/mp4",
@@ -120,5 +120,6 @@ def upload_youtube_video(video_id: uuid.UUID) -> None:
                 Source(
                     video_id=video_id,
                     s3_path=s3_key,
+                    content_hash=content_hash,
                 ),
             )